@@ -87,6 +87,15 @@ def analyze_full_session(
     divergent_probes = {}
     response_lengths = defaultdict(lambda: defaultdict(list))
 
+    # One analyzer (one model load) for every probe; embed the whole session up front
+    analyzer = None
+    if not skip_embeddings:
+        analyzer = ConvergenceAnalyzer(cache_dir=cache_dir)
+        analyzer.embed_responses([
+            r for cp in loader.load_all_checkpoints()
+            for r in cp.probe_responses if r.probe_id in probe_ids
+        ])
+
     # Analyze each probe
     for probe_id in probe_ids:
         logger.info(f"\n{'='*60}")
@@ -114,8 +123,6 @@ def analyze_full_session(
         # Convergence analysis
         if not skip_embeddings:
             logger.info("Computing semantic embeddings and convergence metrics...")
-            analyzer = ConvergenceAnalyzer(cache_dir=cache_dir)
-
             metrics = analyzer.analyze_probe_evolution(probe_history)
             all_metrics[probe_id] = metrics
 
@@ -10,7 +10,6 @@ from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import logging
 from pathlib import Path
-import pickle
 
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
@@ -18,6 +17,7 @@ from scipy.stats import spearmanr
 import torch
 
 from data_loader import ProbeResponse, CheckpointData
+from embedding_store import EmbeddingStore
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -55,21 +55,21 @@ class ConvergenceAnalyzer:
         self,
         model_name: str = "all-MiniLM-L6-v2",
         cache_dir: Optional[Path] = None,
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        batch_size: int = 64
     ):
         """
         Initialize analyzer.
 
         Args:
             model_name: Sentence transformer model name
-            cache_dir: Directory to cache embeddings
+            cache_dir: Directory for the embedding store (None = memory only)
             device: Device for torch ('cuda', 'cpu', or None for auto)
+            batch_size: Texts per model forward pass
         """
         self.model_name = model_name
         self.cache_dir = Path(cache_dir) if cache_dir else None
-
-        if self.cache_dir:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
 
         # Auto-detect device
         if device is None:
@@ -77,11 +77,32 @@ class ConvergenceAnalyzer:
 
         logger.info(f"Loading embedding model: {model_name} on {device}")
         self.model = SentenceTransformer(model_name, device=device)
-        self.embedding_cache: Dict[str, np.ndarray] = {}
+        self.store = EmbeddingStore(self.cache_dir)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Batched forward passes over uncached texts."""
+        logger.info(f"Embedding {len(texts)} uncached responses")
+        return self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True
+        )
+
+    def embed_responses(self, responses: List[ProbeResponse]) -> np.ndarray:
+        """
+        Generate embeddings for many responses in batched forward passes.
+
+        Vectors are keyed by SHA-256 of model name + response text, so only
+        texts never embedded by this model are encoded.
 
-    def _get_cache_key(self, probe_id: str, iteration: int, architecture: str) -> str:
-        """Generate cache key for embeddings."""
-        return f"{probe_id}_{iteration}_{architecture}"
+        Args:
+            responses: ProbeResponse objects
+
+        Returns:
+            (len(responses), dim) embedding matrix, in input order
+        """
+        return self.store.embed([r.response for r in responses], self.model_name, self._encode)
 
     def embed_response(self, response: ProbeResponse) -> np.ndarray:
         """
@@ -93,38 +114,7 @@ class ConvergenceAnalyzer:
         Returns:
             Embedding vector (384-dim for MiniLM)
         """
-        cache_key = self._get_cache_key(
-            response.probe_id, response.iteration, response.architecture
-        )
-
-        # Check cache
-        if cache_key in self.embedding_cache:
-            return self.embedding_cache[cache_key]
-
-        # Check disk cache
-        if self.cache_dir:
-            cache_file = self.cache_dir / f"{cache_key}.pkl"
-            if cache_file.exists():
-                with open(cache_file, 'rb') as f:
-                    embedding = pickle.load(f)
-                    self.embedding_cache[cache_key] = embedding
-                    return embedding
-
-        # Compute embedding
-        embedding = self.model.encode(
-            response.response,
-            show_progress_bar=False,
-            convert_to_numpy=True
-        )
-
-        # Cache
-        self.embedding_cache[cache_key] = embedding
-        if self.cache_dir:
-            cache_file = self.cache_dir / f"{cache_key}.pkl"
-            with open(cache_file, 'wb') as f:
-                pickle.dump(embedding, f)
-
-        return embedding
+        return self.embed_responses([response])[0]
 
     def compute_similarity_matrix(
         self,
@@ -147,7 +137,7 @@ class ConvergenceAnalyzer:
         architectures = [r.architecture for r in responses]
 
         # Generate embeddings
-        embeddings = np.array([self.embed_response(r) for r in responses])
+        embeddings = self.embed_responses(responses)
 
         # Compute cosine similarity
         sim_matrix = cosine_similarity(embeddings)
@@ -214,6 +204,9 @@ class ConvergenceAnalyzer:
         """
         metrics = []
 
+        # Embed every iteration's uncached responses up front in one batch
+        self.embed_responses([r for responses in probe_history.values() for r in responses])
+
         for iteration in sorted(probe_history.keys()):
             responses = probe_history[iteration]
             probe_id = responses[0].probe_id if responses else "UNKNOWN"
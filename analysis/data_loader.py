@@ -3,14 +3,27 @@ Data loader for IRIS Gate convergence checkpoint data.
 
 Loads and parses checkpoint JSON files from convergence sessions,
 providing structured access to probe results across iterations.
+
+Sessions are stored either as checkpoint_NNN.json files or as an
+append-only checkpoints.jsonl log (one line per iteration, holding only that
+iteration's results); see append_checkpoint() and compact_checkpoint_log().
+
+Each checkpoint is parsed once per DataLoader (optionally on a thread pool)
+into an index by probe, iteration and architecture. The parsed session is
+persisted next to the checkpoints as a columnar NumPy file
+(checkpoint_index.npz) and reloaded while the checkpoint files are unchanged.
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 
+import numpy as np
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -60,6 +73,157 @@ class CheckpointData:
         return [r for r in self.probe_responses if r.architecture == arch]
 
 
+CHECKPOINT_LOG = "checkpoints.jsonl"
+
+
+def append_checkpoint(log_path: Path, record: Dict) -> None:
+    """
+    Append one iteration's checkpoint to a JSONL log and fsync it.
+
+    Args:
+        log_path: Session checkpoint log (checkpoints.jsonl)
+        record: session_id, iteration, timestamp, architectures and the
+                iteration's own probe_results (probe_id -> responses)
+    """
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with open(log_path, 'a', encoding='utf-8') as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_checkpoint_log(log_path: Path) -> List[Dict]:
+    """
+    Checkpoint records of a JSONL log, one per iteration, in iteration order.
+
+    A torn last line (interrupted write) is skipped; when an iteration was
+    logged more than once (e.g. a re-run), the last record wins.
+    """
+    records: Dict[int, Dict] = {}
+    with open(log_path, encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable line {line_num} of {log_path}")
+                continue
+            records[record['iteration']] = record
+    return [records[iteration] for iteration in sorted(records)]
+
+
+def compact_checkpoint_log(log_path: Path) -> int:
+    """
+    Rewrite a checkpoint log without torn lines or superseded iterations.
+
+    The compacted log replaces the original atomically.
+
+    Returns:
+        Number of iteration records kept
+    """
+    records = read_checkpoint_log(log_path)
+    tmp_path = log_path.with_name(log_path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, log_path)
+    return len(records)
+
+
+INDEX_FILENAME = "checkpoint_index.npz"
+INDEX_VERSION = 1
+
+# ProbeResponse string fields stored as codes into one shared string table
+_STRING_COLUMNS = ("probe_id", "architecture", "model", "timestamp", "prompt", "response")
+
+
+def save_checkpoint_index(path: Path, checkpoints: List[CheckpointData], fingerprint: List) -> None:
+    """
+    Persist parsed checkpoints as a columnar .npz file.
+
+    One row per response: checkpoint number, iteration and an int32 code per
+    string field. Every distinct string (including responses repeated across
+    cumulative checkpoints) is stored once, as UTF-8 bytes plus offsets.
+    """
+    strings: Dict[str, int] = {}
+    columns = {name: [] for name in ("checkpoint", "iteration") + _STRING_COLUMNS}
+
+    for checkpoint_num, cp in enumerate(checkpoints):
+        for r in cp.probe_responses:
+            columns["checkpoint"].append(checkpoint_num)
+            columns["iteration"].append(int(r.iteration))
+            for name in _STRING_COLUMNS:
+                columns[name].append(strings.setdefault(getattr(r, name), len(strings)))
+
+    encoded = [text.encode('utf-8') for text in strings]
+    meta = {
+        "version": INDEX_VERSION,
+        "fingerprint": fingerprint,
+        "checkpoints": [
+            {"session_id": cp.session_id, "iteration": cp.iteration,
+             "timestamp": cp.timestamp, "architectures": cp.architectures}
+            for cp in checkpoints
+        ],
+    }
+
+    arrays = {name: np.asarray(values, dtype=np.int64 if name == "iteration" else np.int32)
+              for name, values in columns.items()}
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        np.savez(
+            f,
+            meta=np.array(json.dumps(meta)),
+            string_blob=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            string_offsets=np.cumsum([0] + [len(b) for b in encoded], dtype=np.int64),
+            **arrays
+        )
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint_index(path: Path, fingerprint: List) -> Optional[List[CheckpointData]]:
+    """
+    Checkpoints from a columnar index, or None if it is missing or stale.
+
+    Args:
+        path: Index file written by save_checkpoint_index
+        fingerprint: Current (name, size, mtime_ns) of every checkpoint file
+    """
+    if not path.exists():
+        return None
+
+    try:
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != INDEX_VERSION or meta.get("fingerprint") != fingerprint:
+                return None
+
+            blob = data["string_blob"].tobytes()
+            offsets = data["string_offsets"]
+            strings = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+            columns = {name: data[name] for name in ("checkpoint", "iteration") + _STRING_COLUMNS}
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint index {path}: {e}")
+        return None
+
+    checkpoints = [
+        CheckpointData(session_id=cp["session_id"], iteration=cp["iteration"],
+                       timestamp=cp["timestamp"], architectures=cp["architectures"])
+        for cp in meta["checkpoints"]
+    ]
+    codes = {name: columns[name].tolist() for name in _STRING_COLUMNS}
+    for row, (checkpoint_num, iteration) in enumerate(zip(columns["checkpoint"].tolist(),
+                                                          columns["iteration"].tolist())):
+        checkpoints[checkpoint_num].probe_responses.append(ProbeResponse(
+            iteration=iteration,
+            **{name: strings[codes[name][row]] for name in _STRING_COLUMNS}
+        ))
+
+    return checkpoints
+
+
 class DataLoader:
     """
     Load and parse IRIS Gate checkpoint data.
@@ -68,16 +232,25 @@ class DataLoader:
     - session_dir/checkpoint_001.json
     - session_dir/checkpoint_002.json
     - ...
+    or
+    - session_dir/checkpoints.jsonl (one checkpoint record per line)
 
     Each checkpoint contains probe_results dict with probe_id keys.
     """
 
-    def __init__(self, session_dir: Path):
+    def __init__(
+        self,
+        session_dir: Path,
+        workers: Optional[int] = None,
+        persist_index: bool = True
+    ):
         """
         Initialize loader.
 
         Args:
             session_dir: Path to session directory containing checkpoints
+            workers: Threads for parsing checkpoints (None or 1 = sequential)
+            persist_index: Reuse/write checkpoint_index.npz in session_dir
 
         Raises:
             ValueError: If session_dir doesn't exist or has no checkpoints
@@ -87,9 +260,19 @@ class DataLoader:
             raise ValueError(f"Session directory not found: {session_dir}")
 
         self.checkpoint_files = sorted(self.session_dir.glob("checkpoint_*.json"))
+        log_path = self.session_dir / CHECKPOINT_LOG
+        if log_path.exists():
+            self.checkpoint_files.append(log_path)
         if not self.checkpoint_files:
             raise ValueError(f"No checkpoint files found in {session_dir}")
 
+        self.workers = workers
+        self.index_path = self.session_dir / INDEX_FILENAME if persist_index else None
+
+        # Built lazily on first access
+        self._checkpoints: Optional[List[CheckpointData]] = None
+        self._history: Optional[Dict[str, Dict[int, List[ProbeResponse]]]] = None
+
         logger.info(f"Found {len(self.checkpoint_files)} checkpoint files")
 
     def load_checkpoint(self, checkpoint_path: Path) -> Optional[CheckpointData]:
@@ -105,69 +288,148 @@ class DataLoader:
         try:
             with open(checkpoint_path, 'r') as f:
                 data = json.load(f)
-
-            # Parse probe results (dict with probe_id keys)
-            probe_responses = []
-            probe_results = data.get('probe_results', {})
-
-            for probe_id, responses in probe_results.items():
-                for response_data in responses:
-                    # Handle missing fields gracefully
-                    try:
-                        probe_responses.append(ProbeResponse(
-                            probe_id=response_data.get('probe_id', probe_id),
-                            iteration=response_data.get('iteration', data.get('iteration', 0)),
-                            architecture=response_data.get('architecture', 'unknown'),
-                            model=response_data.get('model', 'unknown'),
-                            response=response_data.get('response', response_data.get('content', '')),
-                            timestamp=response_data.get('timestamp', data.get('timestamp', '')),
-                            prompt=response_data.get('prompt', '')
-                        ))
-                    except Exception as e:
-                        logger.warning(f"Skipping malformed response in {checkpoint_path}: {e}")
-
-            return CheckpointData(
-                session_id=data['session_id'],
-                iteration=data['iteration'],
-                timestamp=data['timestamp'],
-                architectures=data['architectures'],
-                probe_responses=probe_responses
-            )
+            return self._parse_checkpoint(data, checkpoint_path)
 
         except Exception as e:
             logger.error(f"Failed to load {checkpoint_path}: {e}")
             return None
 
-    def load_all_checkpoints(self) -> List[CheckpointData]:
+    def load_checkpoint_log(self, log_path: Path) -> List[CheckpointData]:
         """
-        Load all checkpoint files in the session.
+        Load every iteration of a JSONL checkpoint log.
+
+        Args:
+            log_path: Path to checkpoints.jsonl
 
         Returns:
-            List of CheckpointData objects, sorted by iteration
+            One CheckpointData per iteration, holding that iteration's responses
         """
         checkpoints = []
-        for cp_path in self.checkpoint_files:
-            cp_data = self.load_checkpoint(cp_path)
-            if cp_data:
-                checkpoints.append(cp_data)
+        for record in read_checkpoint_log(log_path):
+            try:
+                checkpoints.append(self._parse_checkpoint(record, log_path))
+            except Exception as e:
+                logger.error(f"Failed to load iteration {record.get('iteration')} of {log_path}: {e}")
+        return checkpoints
 
-        checkpoints.sort(key=lambda x: x.iteration)
+    def _parse_checkpoint(self, data: Dict, source: Path) -> CheckpointData:
+        """CheckpointData from one decoded checkpoint record."""
+        # Parse probe results (dict with probe_id keys)
+        probe_responses = []
+        probe_results = data.get('probe_results', {})
+
+        for probe_id, responses in probe_results.items():
+            for response_data in responses:
+                # Handle missing fields gracefully
+                try:
+                    probe_responses.append(ProbeResponse(
+                        probe_id=response_data.get('probe_id', probe_id),
+                        iteration=response_data.get('iteration', data.get('iteration', 0)),
+                        architecture=response_data.get('architecture', 'unknown'),
+                        model=response_data.get('model', 'unknown'),
+                        response=response_data.get('response', response_data.get('content', '')),
+                        timestamp=response_data.get('timestamp', data.get('timestamp', '')),
+                        prompt=response_data.get('prompt', '')
+                    ))
+                except Exception as e:
+                    logger.warning(f"Skipping malformed response in {source}: {e}")
+
+        return CheckpointData(
+            session_id=data['session_id'],
+            iteration=data['iteration'],
+            timestamp=data['timestamp'],
+            architectures=data['architectures'],
+            probe_responses=probe_responses
+        )
+
+    def _parse_file(self, path: Path) -> List[CheckpointData]:
+        """Checkpoints stored in one file (a JSON checkpoint or the JSONL log)."""
+        if path.name == CHECKPOINT_LOG:
+            return self.load_checkpoint_log(path)
+        checkpoint = self.load_checkpoint(path)
+        return [checkpoint] if checkpoint else []
+
+    def _fingerprint(self) -> List:
+        """(name, size, mtime_ns) of every checkpoint file"""
+        fingerprint = []
+        for path in self.checkpoint_files:
+            stat = path.stat()
+            fingerprint.append([path.name, stat.st_size, stat.st_mtime_ns])
+        return fingerprint
+
+    def _get_checkpoints(self) -> List[CheckpointData]:
+        """Parse every checkpoint once (or reload the persisted index)."""
+        if self._checkpoints is not None:
+            return self._checkpoints
+
+        fingerprint = self._fingerprint()
+        checkpoints = load_checkpoint_index(self.index_path, fingerprint) if self.index_path else None
+
+        if checkpoints is not None:
+            logger.info(f"Loaded checkpoint index {self.index_path}")
+        else:
+            if self.workers and self.workers > 1:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    parsed = list(executor.map(self._parse_file, self.checkpoint_files))
+            else:
+                parsed = [self._parse_file(path) for path in self.checkpoint_files]
+
+            checkpoints = sorted((cp for file_cps in parsed for cp in file_cps), key=lambda x: x.iteration)
+
+            if self.index_path:
+                try:
+                    save_checkpoint_index(self.index_path, checkpoints, fingerprint)
+                except OSError as e:
+                    logger.warning(f"Could not write checkpoint index {self.index_path}: {e}")
+
+        self._checkpoints = checkpoints
         logger.info(f"Loaded {len(checkpoints)} checkpoints")
         return checkpoints
 
+    def _get_history(self) -> Dict[str, Dict[int, List[ProbeResponse]]]:
+        """
+        Index: probe_id -> iteration -> responses (one per architecture).
+
+        Responses are grouped by their own iteration, so cumulative checkpoints
+        (each repeating earlier iterations) contribute every response once;
+        the latest checkpoint's copy wins.
+        """
+        if self._history is not None:
+            return self._history
+
+        latest: Dict[Tuple, ProbeResponse] = {}
+        for cp in self._get_checkpoints():
+            for r in cp.probe_responses:
+                latest[(r.probe_id, r.iteration, r.architecture, r.timestamp)] = r
+
+        history: Dict[str, Dict[int, List[ProbeResponse]]] = {}
+        for r in latest.values():
+            history.setdefault(r.probe_id, {}).setdefault(r.iteration, []).append(r)
+
+        self._history = {
+            probe_id: dict(sorted(by_iteration.items()))
+            for probe_id, by_iteration in history.items()
+        }
+        return self._history
+
+    def load_all_checkpoints(self) -> List[CheckpointData]:
+        """
+        Load all checkpoint files in the session.
+
+        Returns:
+            List of CheckpointData objects, sorted by iteration
+        """
+        return list(self._get_checkpoints())
+
     def get_probe_ids(self) -> List[str]:
         """Get all unique probe IDs across checkpoints."""
-        # Load first checkpoint to get probe IDs
-        first_cp = self.load_checkpoint(self.checkpoint_files[0])
-        if first_cp:
-            return sorted(set(r.probe_id for r in first_cp.probe_responses))
-        return []
+        return sorted(self._get_history())
 
     def get_architectures(self) -> List[str]:
         """Get list of architectures."""
-        first_cp = self.load_checkpoint(self.checkpoint_files[0])
-        if first_cp:
-            return first_cp.architectures
+        checkpoints = self._get_checkpoints()
+        if checkpoints:
+            return checkpoints[0].architectures
         return []
 
     def load_probe_history(self, probe_id: str) -> Dict[int, List[ProbeResponse]]:
@@ -180,26 +442,49 @@ class DataLoader:
         Returns:
             Dict mapping iteration -> list of responses from all architectures
         """
-        history = {}
-        for cp_data in self.load_all_checkpoints():
-            responses = cp_data.get_responses_by_probe(probe_id)
-            if responses:
-                history[cp_data.iteration] = responses
-
-        return history
-
+        return {
+            iteration: list(responses)
+            for iteration, responses in self._get_history().get(probe_id, {}).items()
+        }
+
+    def get_responses(
+        self,
+        probe_id: Optional[str] = None,
+        iteration: Optional[int] = None,
+        architecture: Optional[str] = None
+    ) -> List[ProbeResponse]:
+        """
+        Responses matching every given filter, by probe then iteration.
 
-def load_session(session_dir: str) -> DataLoader:
+        Args:
+            probe_id: Probe identifier
+            iteration: Iteration number
+            architecture: Architecture name
+        """
+        history = self._get_history()
+        probe_ids = [probe_id] if probe_id is not None else sorted(history)
+        return [
+            r
+            for pid in probe_ids
+            for it, responses in history.get(pid, {}).items()
+            if iteration is None or it == iteration
+            for r in responses
+            if architecture is None or r.architecture == architecture
+        ]
+
+
+def load_session(session_dir: str, workers: Optional[int] = None) -> DataLoader:
     """
     Convenience function to create a DataLoader.
 
     Args:
         session_dir: Path to session directory
+        workers: Threads for parsing checkpoints (None or 1 = sequential)
 
     Returns:
         DataLoader instance
     """
-    return DataLoader(Path(session_dir))
+    return DataLoader(Path(session_dir), workers=workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+"""
+Content-addressed embedding store.
+
+Embeddings are keyed by SHA-256 of (model name, text), so a changed response
+never returns a stale vector and identical texts are embedded once. Vectors
+live in one float32 matrix on disk (embeddings.f32, read as a memmap) with a
+JSON offset index mapping key -> row.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+def content_key(text: str, model_name: str) -> str:
+    """SHA-256 of model name + text (the store key)."""
+    digest = hashlib.sha256()
+    digest.update(model_name.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class EmbeddingStore:
+    """
+    Append-only float32 matrix of embeddings with a key -> row index.
+
+    Layout of cache_dir:
+        embeddings.f32   Row-major float32 matrix, `dim` columns
+        index.json       {"dim": int, "keys": [key of row 0, key of row 1, ...]}
+
+    Without a cache_dir the store is memory-only.
+    """
+
+    MATRIX_FILE = "embeddings.f32"
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.dim: Optional[int] = None
+        self.rows: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None   # Memmap of rows on disk
+        self._pending: Dict[str, np.ndarray] = {}   # Memory-only store
+        self._lock = threading.Lock()
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._load_index()
+
+    @property
+    def matrix_path(self) -> Path:
+        return self.cache_dir / self.MATRIX_FILE
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_dir / self.INDEX_FILE
+
+    def _load_index(self):
+        if not self.index_path.exists():
+            return
+        with open(self.index_path) as f:
+            index = json.load(f)
+        self.dim = index["dim"]
+        # Rows past the end of the matrix (interrupted append) are dropped
+        n_rows = self.matrix_path.stat().st_size // (4 * self.dim) if self.matrix_path.exists() else 0
+        self.rows = {key: row for row, key in enumerate(index["keys"][:n_rows])}
+        self._open_matrix()
+
+    def _open_matrix(self):
+        n_rows = len(self.rows)
+        self._matrix = (
+            np.memmap(self.matrix_path, dtype=np.float32, mode='r', shape=(n_rows, self.dim))
+            if n_rows else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows) + len(self._pending)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.rows or key in self._pending
+
+    def get(self, keys: Sequence[str]) -> np.ndarray:
+        """Vectors for `keys` (all must be present), as an (n, dim) float32 array."""
+        if not keys:
+            return np.zeros((0, self.dim or 0), dtype=np.float32)
+        return np.stack([
+            self._pending[key] if key in self._pending else self._matrix[self.rows[key]]
+            for key in keys
+        ]).astype(np.float32, copy=False)
+
+    def put(self, keys: Sequence[str], vectors: np.ndarray):
+        """Add new vectors (one row per key); keys already stored are ignored."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(keys):
+            raise ValueError(f"Expected {len(keys)} vectors, got array of shape {vectors.shape}")
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"Embedding dim {vectors.shape[1]} does not match store dim {self.dim}")
+
+            new = {}
+            for key, vector in zip(keys, vectors):
+                if key not in self and key not in new:
+                    new[key] = vector
+            if not new:
+                return
+
+            if not self.cache_dir:
+                self._pending.update(new)
+                return
+
+            # Append rows first, then publish them in the index (atomic replace)
+            with open(self.matrix_path, 'ab') as f:
+                f.seek(len(self.rows) * 4 * self.dim)
+                f.truncate()
+                f.write(np.stack(list(new.values())).tobytes())
+            for key in new:
+                self.rows[key] = len(self.rows)
+
+            tmp_path = self.index_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({"dim": self.dim, "keys": list(self.rows)}, f)
+            os.replace(tmp_path, self.index_path)
+            self._open_matrix()
+
+    def embed(
+        self,
+        texts: Sequence[str],
+        model_name: str,
+        encode: Callable[[List[str]], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Embeddings for `texts`, encoding only texts not yet stored.
+
+        Args:
+            texts: Texts to embed (duplicates are encoded once)
+            model_name: Embedding model name (part of the key)
+            encode: Batched encoder, list of texts -> (n, dim) array
+
+        Returns:
+            (len(texts), dim) float32 array, in input order
+        """
+        keys = [content_key(text, model_name) for text in texts]
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in self and key not in missing:
+                missing[key] = text
+        if missing:
+            self.put(list(missing), encode(list(missing.values())))
+
+        return self.get(keys)
@@ -17,6 +17,10 @@ This script orchestrates:
     3. Experimental simulation validation
     4. Selectivity optimization analysis
     5. Report generation with optimal parameters
+
+With --adaptive, the full grid is searched by successive halving instead:
+low-MC-run simulations prune poor combinations and only the survivors get
+S4 convergence and full-fidelity simulation.
 """
 
 import argparse
@@ -31,7 +35,13 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from itertools import product
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Union
+
+# Sandbox simulators (MonteCarloEngine, SelectivitySimulator)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "sandbox" / "engines" / "simulators"))
+
+from monte_carlo import MonteCarloEngine
+from selectivity import SelectivitySimulator, successive_halving
 
 
 class SelectivitySweepPipeline:
@@ -54,6 +64,12 @@ class SelectivitySweepPipeline:
         self.results = []
         self.session_map = {}
 
+        # One output directory per combination: combinations/<combination_id>/
+        self.combinations_dir = self.output_dir / "combinations"
+
+        # Monte Carlo engine, loaded once on first simulation
+        self._simulator = None
+
         print(f"✅ Initialized selectivity sweep pipeline")
         print(f"   Plan: {self.plan_file}")
         print(f"   Output: {self.output_dir}")
@@ -167,13 +183,13 @@ class SelectivitySweepPipeline:
             'elapsed_time': elapsed
         }
 
-    def extract_s4_priors(self, session_id: str) -> bool:
-        """Extract S4 computational priors from session."""
+    def extract_s4_priors(self, session_id: str, output_dir: Path) -> bool:
+        """Extract S4 computational priors from session into output_dir."""
 
         cmd = [
             "python3", "sandbox/cli/extract_s4_states.py",
             "--session", session_id,
-            "--output", "sandbox/states"
+            "--output", str(output_dir)
         ]
 
         result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path.cwd())
@@ -186,37 +202,81 @@ class SelectivitySweepPipeline:
 
     def simulate_selectivity(self, params: Dict[str, Any], session_id: str) -> Dict[str, float]:
         """Simulate selectivity metrics for parameter combination."""
+        return self.simulate_batch([(params, session_id)])[params['combination_id']]
 
-        # Create parameter-specific simulation plan
-        sim_plan = self._create_simulation_plan(params, session_id)
-        plan_file = self.output_dir / f"{params['combination_id']}_plan.yaml"
+    def simulate_batch(self, batch: List[Tuple[Dict[str, Any], str]],
+                       monte_carlo_runs: int = None) -> Dict[str, Dict[str, float]]:
+        """
+        Simulate many parameter combinations in this process.
 
-        with open(plan_file, 'w') as f:
-            yaml.dump(sim_plan, f, default_flow_style=False)
+        The Monte Carlo engine is loaded once and reused. Each combination
+        is simulated on the S4 priors extracted from its own session (see
+        states_dir), writes its plan and summary to its own directory (see
+        combination_dir), and results are keyed by combination_id.
 
-        # Run simulation
-        cmd = [
-            "python3", "sandbox/cli/run_plan.py",
-            str(plan_file)
-        ]
+        Args:
+            batch: (params, session_id) pairs; session_id None simulates on
+                   the engine's default priors (sandbox/states)
+            monte_carlo_runs: Low-fidelity override; results go to
+                              combination_dir/mc_<runs>/ instead
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path.cwd())
+        Returns:
+            combination_id → selectivity metrics
+        """
 
-        if result.returncode != 0:
-            print(f"❌ Simulation failed for {params['combination_id']}: {result.stderr}")
-            return {
-                'selectivity_index': 0.0,
-                'cancer_ic50': np.inf,
-                'healthy_ic50': np.inf,
-                'simulation_status': 'failed'
-            }
+        metrics = {}
+
+        for params, session_id in batch:
+            combo_id = params['combination_id']
+            combo_dir = self.combination_dir(combo_id)
+            if monte_carlo_runs is not None:
+                combo_dir = combo_dir / f"mc_{monte_carlo_runs}"
+
+            try:
+                simulator = self._get_simulator(combo_id if session_id else None)
+                plan = self._create_simulation_plan(params, session_id, monte_carlo_runs or 100)
+                simulator.simulate(plan, combo_dir)
+            except Exception as e:
+                print(f"❌ Simulation failed for {combo_id}: {e}")
+                metrics[combo_id] = {
+                    'selectivity_index': 0.0,
+                    'cancer_ic50': np.inf,
+                    'healthy_ic50': np.inf,
+                    'simulation_status': 'failed'
+                }
+                continue
+
+            metrics[combo_id] = self._extract_selectivity_metrics(combo_id, combo_dir)
+
+        return metrics
 
-        # Extract selectivity metrics from simulation results
-        selectivity_metrics = self._extract_selectivity_metrics(params['combination_id'])
+    def combination_dir(self, combination_id: str) -> Path:
+        """Output directory owned by one parameter combination."""
+        return self.combinations_dir / combination_id
 
-        return selectivity_metrics
+    def states_dir(self, combination_id: str) -> Path:
+        """S4 priors extracted from one combination's session."""
+        return self.combination_dir(combination_id) / "states"
 
-    def _create_simulation_plan(self, params: Dict[str, Any], session_id: str) -> Dict[str, Any]:
+    def _get_simulator(self, combination_id: str = None) -> SelectivitySimulator:
+        """
+        Selectivity simulator on a MonteCarloEngine loaded once per pipeline.
+
+        With a combination_id, the engine's resources are shared but the S4
+        priors are that combination's own (states_dir).
+        """
+        if self._simulator is None:
+            self._simulator = SelectivitySimulator(MonteCarloEngine({}))
+        if combination_id is None:
+            return self._simulator
+
+        states = MonteCarloEngine.load_s4_states(self.states_dir(combination_id))
+        if not states:
+            raise FileNotFoundError(f"No S4 states in {self.states_dir(combination_id)}")
+        return SelectivitySimulator(self._simulator.engine.with_s4_states(states))
+
+    def _create_simulation_plan(self, params: Dict[str, Any], session_id: str,
+                                monte_carlo_runs: int = 100) -> Dict[str, Any]:
         """Create simulation plan for specific parameter combination."""
 
         plan = {
@@ -233,7 +293,7 @@ class SelectivitySweepPipeline:
             },
 
             'simulation_settings': {
-                'monte_carlo_runs': 100,  # Reduced for parameter sweep
+                'monte_carlo_runs': monte_carlo_runs,  # Reduced for parameter sweep
                 'convergence_threshold': 0.05,
                 'max_iterations': 1000
             },
@@ -280,25 +340,11 @@ class SelectivitySweepPipeline:
 
         return plan
 
-    def _extract_selectivity_metrics(self, combination_id: str) -> Dict[str, float]:
-        """Extract selectivity metrics from simulation results."""
-
-        # Find latest simulation run
-        runs_dir = Path("sandbox/runs/outputs")
-        run_dirs = sorted(runs_dir.glob("RUN_*"))
-
-        if not run_dirs:
-            return {
-                'selectivity_index': 0.0,
-                'cancer_ic50': np.inf,
-                'healthy_ic50': np.inf,
-                'simulation_status': 'no_output'
-            }
+    def _extract_selectivity_metrics(self, combination_id: str, results_dir: Path) -> Dict[str, float]:
+        """Extract selectivity metrics from a combination's summary.json."""
 
-        latest_run = run_dirs[-1]
+        results_file = Path(results_dir) / "summary.json"
 
-        # Load simulation results
-        results_file = latest_run / "summary.json"
         if not results_file.exists():
             return {
                 'selectivity_index': 0.0,
@@ -324,6 +370,8 @@ class SelectivitySweepPipeline:
                 'selectivity_index': float(selectivity_index),
                 'cancer_ic50': float(cancer_ic50),
                 'healthy_ic50': float(healthy_ic50),
+                'healthy_ic50_censored': bool(
+                    results['dose_response']['healthy_astrocytes'].get('ic50_censored', False)),
                 'mechanism_strength': float(mechanism_strength),
                 'safety_margin': float(safety_margin),
                 'simulation_status': 'success'
@@ -350,8 +398,8 @@ class SelectivitySweepPipeline:
                         return part.strip()
         return ""
 
-    def run_parameter_combination(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Run complete pipeline for single parameter combination."""
+    def prepare_combination(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run S4 convergence and prior extraction for one parameter combination."""
 
         combo_id = params['combination_id']
         print(f"\n{'='*60}")
@@ -367,32 +415,50 @@ class SelectivitySweepPipeline:
         if s4_result['status'] != 'success':
             return s4_result
 
-        session_id = s4_result['session_id']
-
-        # Step 2: Extract S4 priors
-        if not self.extract_s4_priors(session_id):
+        # Step 2: Extract S4 priors into the combination's own states directory
+        if not self.extract_s4_priors(s4_result['session_id'], self.states_dir(combo_id)):
             s4_result.update({
                 'status': 'failed',
                 'error': 'S4 prior extraction failed'
             })
+
+        return s4_result
+
+    def run_parameter_combination(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run complete pipeline for single parameter combination."""
+
+        s4_result = self.prepare_combination(params)
+
+        if s4_result['status'] != 'success':
             return s4_result
 
         # Step 3: Run selectivity simulation
-        selectivity_metrics = self.simulate_selectivity(params, session_id)
+        selectivity_metrics = self.simulate_selectivity(params, s4_result['session_id'])
+
+        return self._combine_result(s4_result, selectivity_metrics)
+
+    def _combine_result(self, s4_result: Dict[str, Any], selectivity_metrics: Dict[str, float]) -> Dict[str, Any]:
+        """Merge S4 and simulation results for one combination."""
 
-        # Combine results
         final_result = {
             **s4_result,
             **selectivity_metrics,
             'processing_complete': True
         }
 
-        print(f"✅ {combo_id} complete - Selectivity: {selectivity_metrics['selectivity_index']:.2f}")
+        print(f"✅ {s4_result['combination_id']} complete - "
+              f"Selectivity: {selectivity_metrics['selectivity_index']:.2f}")
 
         return final_result
 
     def run_phase(self, phase: int, workers: int = 4) -> List[Dict[str, Any]]:
-        """Run complete phase with parallel processing."""
+        """
+        Run complete phase.
+
+        S4 convergence and prior extraction (subprocesses) run on `workers`
+        processes; the selectivity simulations then run as one in-process
+        batch on a single loaded engine. Results keep grid order.
+        """
 
         print(f"\n🚀 Starting Phase {phase} Parameter Sweep")
         print(f"   Workers: {workers}")
@@ -400,47 +466,152 @@ class SelectivitySweepPipeline:
         # Generate parameter grid
         param_grid = self.generate_parameter_grid(phase)
 
-        # Run combinations in parallel
+        # Stage 1: S4 convergence per combination
+        s4_results = self._run_s4_stage(param_grid, workers, phase)
+
+        # Stage 2: Selectivity simulation, one batch in this process
+        results = self._run_simulation_stage(param_grid, s4_results)
+
+        self._save_intermediate_results(results, phase)
+        return results
+
+    def run_adaptive(self, workers: int = 4, fidelities: List[int] = None, eta: int = None) -> List[Dict[str, Any]]:
+        """
+        Adaptive search over the full grid with successive halving.
+
+        Every combination is first simulated cheaply (fidelities[0]
+        monte_carlo_runs) on the default S4 priors (sandbox/states); only the
+        top 1/eta of each rung moves on to more runs. The final survivors get
+        S4 convergence and a full-fidelity simulation on the priors extracted
+        from their own sessions, like a regular phase.
+
+        Args:
+            workers: Parallel workers for the S4 stage
+            fidelities: Increasing monte_carlo_runs per rung (default: plan
+                        grid_search.adaptive.fidelities, else [10, 30, 100])
+            eta: Keep 1/eta of the combinations per rung (default: plan, else 3)
+
+        Returns:
+            Full results for the survivors, then pruned combinations
+        """
+
+        adaptive_config = self.grid_config.get('adaptive', {})
+        fidelities = list(fidelities or adaptive_config.get('fidelities', [10, 30, 100]))
+        eta = eta or adaptive_config.get('eta', 3)
+
+        print("\n🚀 Starting Adaptive Parameter Search")
+        print(f"   Fidelities (MC runs): {fidelities}, eta: {eta}")
+
+        param_grid = self.generate_parameter_grid(3)
+        by_id = {params['combination_id']: params for params in param_grid}
+        final_results = {}
+
+        def evaluate(combo_ids: List[str], monte_carlo_runs: int) -> Dict[str, float]:
+            params_list = [by_id[combo_id] for combo_id in combo_ids]
+            print(f"\n🔬 Rung: {len(combo_ids)} combinations × {monte_carlo_runs} MC runs")
+
+            if monte_carlo_runs < fidelities[-1]:
+                metrics = self.simulate_batch([(params, None) for params in params_list], monte_carlo_runs)
+                return {combo_id: m['selectivity_index'] for combo_id, m in metrics.items()}
+
+            # Full fidelity: S4 convergence, then the regular simulation
+            s4_results = self._run_s4_stage(params_list, workers, 'adaptive')
+            for result in self._run_simulation_stage(params_list, s4_results):
+                final_results[result['combination_id']] = result
+            return {combo_id: final_results[combo_id].get('selectivity_index', 0.0) for combo_id in combo_ids}
+
+        scores, history = successive_halving(list(by_id), evaluate, fidelities, eta)
+
+        # Survivors ranked by full-fidelity selectivity, then everything pruned earlier
+        results = [final_results[combo_id] for combo_id in sorted(scores, key=lambda c: -scores[c])]
+        for rung, next_rung in zip(history, history[1:]):
+            for combo_id, score in rung['scores'].items():
+                if combo_id not in next_rung['scores']:
+                    results.append({
+                        'combination_id': combo_id,
+                        'parameters': by_id[combo_id],
+                        'status': 'pruned',
+                        'pruned_at_mc_runs': rung['fidelity'],
+                        'selectivity_index': score
+                    })
+
+        evaluations = {rung['fidelity']: len(rung['scores']) for rung in history}
+        full_cost = len(param_grid) * fidelities[-1]
+        spent = sum(fidelity * count for fidelity, count in evaluations.items())
+        print(f"\n📊 Adaptive search: {evaluations} evaluations per MC-run level, "
+              f"{spent}/{full_cost} simulation runs ({100*spent/full_cost:.1f}% of the full grid)")
+
+        with open(self.output_dir / "adaptive_search.json", 'w') as f:
+            json.dump({'fidelities': fidelities, 'eta': eta, 'history': history,
+                       'simulation_runs': spent, 'full_grid_runs': full_cost}, f, indent=2)
+
+        self._save_intermediate_results(results, 'adaptive')
+        return results
+
+    def _run_simulation_stage(self, param_grid: List[Dict[str, Any]],
+                              s4_results: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Simulate every combination whose S4 stage succeeded; results in grid order."""
+
+        ready = [
+            (params, s4_results[params['combination_id']]['session_id'])
+            for params in param_grid
+            if s4_results[params['combination_id']]['status'] == 'success'
+        ]
+        print(f"\n🔬 Simulating {len(ready)}/{len(param_grid)} combinations")
+        metrics = self.simulate_batch(ready)
+
         results = []
+        for params in param_grid:
+            combo_id = params['combination_id']
+            if combo_id in metrics:
+                results.append(self._combine_result(s4_results[combo_id], metrics[combo_id]))
+            else:
+                results.append(s4_results[combo_id])
+
+        return results
+
+    def _run_s4_stage(self, param_grid: List[Dict[str, Any]], workers: int,
+                      phase: Union[int, str]) -> Dict[str, Dict[str, Any]]:
+        """S4 convergence and prior extraction for each combination (keyed by combination_id)."""
+
+        s4_results = {}
+        total = len(param_grid)
 
         if workers == 1:
             # Sequential processing for debugging
             for params in param_grid:
-                result = self.run_parameter_combination(params)
-                results.append(result)
-                self._save_intermediate_results(results, phase)
+                s4_results[params['combination_id']] = self.prepare_combination(params)
+                self._save_intermediate_results(list(s4_results.values()), phase)
         else:
             # Parallel processing
             with ProcessPoolExecutor(max_workers=workers) as executor:
                 future_to_params = {
-                    executor.submit(self.run_parameter_combination, params): params
+                    executor.submit(self.prepare_combination, params): params
                     for params in param_grid
                 }
 
                 for future in as_completed(future_to_params):
+                    params = future_to_params[future]
                     try:
-                        result = future.result()
-                        results.append(result)
-                        self._save_intermediate_results(results, phase)
-
-                        # Progress update
-                        completed = len(results)
-                        total = len(param_grid)
-                        print(f"📊 Progress: {completed}/{total} ({100*completed/total:.1f}%)")
-
+                        s4_results[params['combination_id']] = future.result()
                     except Exception as e:
-                        params = future_to_params[future]
                         print(f"❌ Error processing {params['combination_id']}: {e}")
-                        results.append({
+                        s4_results[params['combination_id']] = {
                             'combination_id': params['combination_id'],
                             'parameters': params,
                             'status': 'failed',
                             'error': str(e)
-                        })
+                        }
 
-        return results
+                    self._save_intermediate_results(list(s4_results.values()), phase)
+
+                    # Progress update
+                    completed = len(s4_results)
+                    print(f"📊 S4 progress: {completed}/{total} ({100*completed/total:.1f}%)")
 
-    def _save_intermediate_results(self, results: List[Dict], phase: int):
+        return s4_results
+
+    def _save_intermediate_results(self, results: List[Dict], phase: Union[int, str]):
         """Save intermediate results to prevent data loss."""
 
         results_file = self.output_dir / f"phase_{phase}_results.json"
@@ -673,6 +844,10 @@ Examples:
   # Run all phases sequentially:
   python pipelines/run_selectivity_sweep.py \\
       --plan plans/cbd_channel_first_v2.yaml --all-phases
+
+  # Adaptive search (successive halving over the full grid):
+  python pipelines/run_selectivity_sweep.py \\
+      --plan plans/cbd_channel_first_v2.yaml --adaptive --fidelities 10,30,100 --eta 3
         """
     )
 
@@ -692,6 +867,20 @@ Examples:
         action="store_true",
         help="Run all phases sequentially"
     )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adaptive search: cheap low-MC-run rungs prune the full grid (successive halving)"
+    )
+    parser.add_argument(
+        "--fidelities",
+        help="Comma-separated MC runs per adaptive rung (default: plan, else 10,30,100)"
+    )
+    parser.add_argument(
+        "--eta",
+        type=int,
+        help="Adaptive search keeps 1/eta of combinations per rung (default: plan, else 3)"
+    )
     parser.add_argument(
         "--workers",
         type=int,
@@ -705,8 +894,8 @@ Examples:
 
     args = parser.parse_args()
 
-    if not args.phase and not args.all_phases:
-        print("❌ Must specify either --phase or --all-phases")
+    if not args.phase and not args.all_phases and not args.adaptive:
+        print("❌ Must specify --phase, --all-phases or --adaptive")
         sys.exit(1)
 
     # Initialize pipeline
@@ -715,7 +904,11 @@ Examples:
 
     phase_results = {}
 
-    if args.all_phases:
+    if args.adaptive:
+        fidelities = [int(runs) for runs in args.fidelities.split(",")] if args.fidelities else None
+        results = pipeline.run_adaptive(args.workers, fidelities, args.eta)
+        phase_results['adaptive'] = pipeline.analyze_results(results, 'adaptive')
+    elif args.all_phases:
         # Run all phases sequentially
         for phase in [1, 2, 3]:
             print(f"\n{'='*80}")
@@ -9,7 +9,6 @@ Provides REST API for running IRIS sessions and managing research data.
 import os
 import sys
 import json
-import asyncio
 import hashlib
 from datetime import datetime
 from pathlib import Path
@@ -32,8 +31,10 @@ sys.path.append('/app')
 from iris_orchestrator import (
     Mirror, ClaudeMirror, GPTMirror, GrokMirror,
     GeminiMirror, DeepSeekMirror, OllamaMirror,
-    Orchestrator, create_mirror, CHAMBERS, SYSTEM_PROMPT
+    Orchestrator, create_mirror, CHAMBERS, SYSTEM_PROMPT, ChamberRequest
 )
+from tools.rate_limiter import estimate_tokens, get_limiter
+from tools.response_cache import get_response_cache
 
 # Database Models
 class Base(DeclarativeBase):
@@ -188,20 +189,25 @@ class AsyncMirror(Mirror):
 
     async def send_chamber_async(self, chamber: str, turn_id: int, custom_prompt: Optional[str] = None) -> Dict:
         """Send chamber prompt asynchronously"""
-        # Override chamber prompt if custom provided
-        original_prompt = CHAMBERS.get(chamber)
-        if custom_prompt:
-            CHAMBERS[chamber] = custom_prompt
-
-        try:
-            # Run in thread pool for sync operations
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, self.send_chamber, chamber, turn_id)
-            return result
-        finally:
-            # Restore original prompt
-            if original_prompt:
-                CHAMBERS[chamber] = original_prompt
+        # Custom prompt is carried by the request, so concurrent sessions never
+        # see each other's prompts through the shared CHAMBERS dict
+        request = ChamberRequest.for_chamber(chamber, custom_prompt or None)
+
+        # Native async adapter call, paced by the provider's shared rate limiter
+        # and served through the response cache (IRIS_RESPONSE_CACHE). The class
+        # method is called directly because this wrapper shadows
+        # send_chamber_async on the instance (dispatch_async would land back here).
+        cost = estimate_tokens(request.system_prompt, request.prompt, max_tokens=request.max_tokens)
+
+        async def fetch() -> str:
+            async with get_limiter(self.provider).slot_async(cost):
+                return (await type(self).send_chamber_async(self, chamber, turn_id, request))["raw_response"]
+
+        content = await get_response_cache().call_async(
+            self.provider, self.model_id, request.system_prompt, request.prompt,
+            None, request.max_tokens, fetch=fetch, sample=turn_id
+        )
+        return self._package_response(chamber, turn_id, content)
 
 def create_async_mirror(adapter: str, model: str = None) -> AsyncMirror:
     """Create async mirror wrapper"""
@@ -355,7 +361,7 @@ async def run_session_task(session_id: str, config: SessionConfig):
                             mirror_id=mirror_name,
                             chamber=chamber,
                             turn_number=turn_number,
-                            prompt=CHAMBERS[chamber],
+                            prompt=custom_prompt or CHAMBERS[chamber],
                             response=response["raw_response"],
                             metadata=response
                         )
@@ -4,18 +4,21 @@ Extract frozen S4 attractor states from 100-cycle run.
 Generates computational priors for sandbox simulations.
 """
 
+import argparse
 import json
 import re
 import hashlib
+import sys
 from pathlib import Path
 from typing import Dict, List
 
-# S4 keyword families (from convergence analysis)
-S4_KEYWORDS = {
-    "rhythm": ["rhythm", "pulsing", "reciprocal", "pulse", "waves", "thrum", "steady pulse", "ripples"],
-    "center": ["luminous", "core", "center", "steady", "anchor", "still point", "beacon", "glow", "holds"],
-    "aperture": ["aperture", "opening", "widening", "soften", "inviting", "bloom", "breathing open", "dilate", "expansion", "pull"]
-}
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.signals import S4_COMPONENTS, SIGNAL_KEYWORDS, scan_signals
+from tools.vault_catalog import open_catalog
+
+# S4 keyword families (shared definitions in src/core/signals.py)
+S4_KEYWORDS = {component: SIGNAL_KEYWORDS[component] for component in S4_COMPONENTS}
 
 # Literature-grounded bioelectric priors (from Levin Lab benchmarks + Hypothesis Sheet)
 BIOELECTRIC_PRIORS = {
@@ -38,12 +41,7 @@ BIOELECTRIC_PRIORS = {
 
 def extract_keywords_from_scroll(text: str, component: str) -> List[str]:
     """Find which keywords from a component family appear in scroll."""
-    text_lower = text.lower()
-    found = []
-    for keyword in S4_KEYWORDS[component]:
-        if keyword in text_lower:
-            found.append(keyword)
-    return found
+    return scan_signals(text).keywords(component)
 
 def extract_signals_confidence(text: str) -> Dict[str, float]:
     """Extract signals_confidence values from Technical Translation YAML block."""
@@ -84,7 +82,16 @@ def extract_state(session_dir: Path, mirror_name: str) -> Dict:
     s4_scrolls = []
     source_files = []
 
-    for turn_file in sorted(mirror_dir.glob("turn_*.md")):
+    # S4 turns straight from the vault catalog when it covers this session
+    vault_root = session_dir.parent.parent
+    catalog = open_catalog(vault_root)
+    if catalog is not None and catalog.has_session(session_dir.name):
+        turn_files = [vault_root / row["scroll_path"] for row in catalog.query_turns(
+            session_id=session_dir.name, mirror=mirror_name, chamber="S4", layout="bioelectric")]
+    else:
+        turn_files = sorted(mirror_dir.glob("turn_*.md"))
+
+    for turn_file in turn_files:
         text = turn_file.read_text()
 
         # Check if this is an S4 scroll
@@ -92,12 +99,8 @@ def extract_state(session_dir: Path, mirror_name: str) -> Dict:
         if not chamber_match or chamber_match.group(1) != "S4":
             continue
 
-        # Extract keywords and confidence
-        keywords = {
-            "rhythm": extract_keywords_from_scroll(text, "rhythm"),
-            "center": extract_keywords_from_scroll(text, "center"),
-            "aperture": extract_keywords_from_scroll(text, "aperture")
-        }
+        # Extract keywords (one scan for all three components) and confidence
+        keywords = scan_signals(text).evidence(S4_COMPONENTS)
 
         confidence = extract_signals_confidence(text)
 
@@ -160,12 +163,25 @@ def extract_state(session_dir: Path, mirror_name: str) -> Dict:
 
 def main():
     """Extract S4 states for all 7 mirrors."""
-
-    # Locate 100-cycle session
-    session_dir = Path("iris_vault/scrolls/BIOELECTRIC_CHAMBERED_20251001054935")
+    parser = argparse.ArgumentParser(description="Extract S4 states as sandbox priors")
+    parser.add_argument(
+        "--session",
+        default="BIOELECTRIC_CHAMBERED_20251001054935",
+        help="Session under iris_vault/scrolls (default: the 100-cycle run)"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("sandbox/states"),
+        help="Directory for s4_state.<mirror>.json files (default: sandbox/states)"
+    )
+    args = parser.parse_args()
+
+    # Locate session
+    session_dir = Path("iris_vault/scrolls") / args.session
     if not session_dir.exists():
         print(f"ERROR: Session directory not found: {session_dir}")
-        return
+        sys.exit(1)
 
     # Extract state for each mirror
     mirrors = [
@@ -178,7 +194,7 @@ def main():
         "ollama_llama3.2_3b"
     ]
 
-    output_dir = Path("sandbox/states")
+    output_dir = args.output
     output_dir.mkdir(parents=True, exist_ok=True)
 
     for mirror in mirrors:
@@ -200,7 +216,7 @@ def main():
         except Exception as e:
             print(f"  ✗ ERROR: {e}")
 
-    print(f"\nS4 states extracted → sandbox/states/")
+    print(f"\nS4 states extracted → {output_dir}/")
 
 if __name__ == "__main__":
     main()
@@ -28,7 +28,7 @@ def load_plan(plan_file: Path) -> dict:
     with open(plan_file) as f:
         return yaml.safe_load(f)
 
-def run_experiment(plan_file: Path, output_dir: Path = None):
+def run_experiment(plan_file: Path, output_dir: Path = None, workers: int = None):
     """Execute full experiment plan."""
 
     print("="*60)
@@ -63,7 +63,7 @@ def run_experiment(plan_file: Path, output_dir: Path = None):
 
     # Run simulations
     print("Running simulations...")
-    results = engine.run_full_experiment(plan, output_dir)
+    results = engine.run_full_experiment(plan, output_dir, workers=workers)
 
     # Generate consensus report
     print("\nGenerating consensus report...")
@@ -89,6 +89,7 @@ def run_experiment(plan_file: Path, output_dir: Path = None):
     # Save config snapshot
     config_snapshot = {
         "plan": plan,
+        "seed": results["seed"],
         "execution_timestamp": datetime.now().isoformat(),
         "s4_states_snapshot": {
             mirror: {
@@ -151,6 +152,12 @@ def main():
         default=None,
         help="Output directory (default: auto-generated timestamp)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for mirror × condition cells (default: plan 'workers', else 1)"
+    )
 
     args = parser.parse_args()
 
@@ -159,7 +166,7 @@ def main():
         sys.exit(1)
 
     try:
-        run_experiment(args.plan, args.output)
+        run_experiment(args.plan, args.output, workers=args.workers)
     except Exception as e:
         print(f"\nERROR: Experiment failed: {e}")
         import traceback
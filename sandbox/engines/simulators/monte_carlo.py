@@ -4,20 +4,26 @@ Monte Carlo Simulation Engine
 
 Runs N replicate simulations per condition to generate distributions
 of bioelectric readouts and regeneration outcomes with uncertainty.
+
+Each mirror × condition cell draws from its own child of one plan-level
+numpy SeedSequence, so a plan gives bit-identical results whether cells
+run serially or on a process pool, on any machine.
 """
 
+import hashlib
 import json
 import numpy as np
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
 from dataclasses import asdict
 import sys
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from vm_ca_gj_sim import VMCaGJSimulator, BioelectricState, PerturbationEffect
+from vm_ca_gj_sim import STATE_PARAMS, VMCaGJSimulator, BioelectricBatch, PerturbationEffect
 from outcome_model import RegenerationOutcomeModel
 
 class MonteCarloEngine:
@@ -34,17 +40,44 @@ class MonteCarloEngine:
         self.config = config
         self.load_resources()
 
+    @classmethod
+    def from_resources(cls, config: Dict, resources: Dict) -> "MonteCarloEngine":
+        """Build an engine from already-loaded resources (see resources())."""
+        engine = cls.__new__(cls)
+        engine.config = config
+        for name, value in resources.items():
+            setattr(engine, name, value)
+        return engine
+
+    def resources(self) -> Dict:
+        """Loaded YAML/JSON resources, for sharing with worker processes."""
+        return {
+            "s4_states": self.s4_states,
+            "pert_kits": self.pert_kits,
+            "readouts": self.readouts,
+            "mechanism_map": self.mechanism_map,
+            "noise_model": self.noise_model,
+        }
+
+    @staticmethod
+    def load_s4_states(states_dir: Path) -> Dict:
+        """S4 states (mirror → state) from a directory of s4_state.*.json files."""
+        s4_states = {}
+        for state_file in sorted(Path(states_dir).glob("s4_state.*.json")):
+            with open(state_file) as f:
+                state = json.load(f)
+                s4_states[state["mirror"]] = state
+        return s4_states
+
+    def with_s4_states(self, s4_states: Dict) -> "MonteCarloEngine":
+        """Engine sharing this one's resources but simulating other S4 priors."""
+        return MonteCarloEngine.from_resources(self.config, {**self.resources(), "s4_states": s4_states})
+
     def load_resources(self):
         """Load all YAML/JSON resources."""
 
         # Load S4 states
-        states_dir = Path("sandbox/states")
-        self.s4_states = {}
-        for state_file in states_dir.glob("s4_state.*.json"):
-            with open(state_file) as f:
-                state = json.load(f)
-                mirror = state["mirror"]
-                self.s4_states[mirror] = state
+        self.s4_states = self.load_s4_states(Path("sandbox/states"))
 
         # Load perturbation kits
         with open("sandbox/specs/perturbation_kits.yaml") as f:
@@ -68,11 +101,13 @@ class MonteCarloEngine:
         perturbations: List[Dict],  # List of {kit, agent, dose}
         n_runs: int,
         timepoints_hr: List[float],
-        seed: int = None
+        seed: Union[int, np.random.SeedSequence, None] = None
     ) -> Dict:
         """
         Run Monte Carlo simulation for one condition on one mirror.
 
+        All runs are simulated together as arrays (VMCaGJSimulator.simulate_batch).
+
         Returns:
             - timeseries: List of states per run per timepoint
             - outcomes: Regeneration predictions with uncertainty
@@ -89,30 +124,21 @@ class MonteCarloEngine:
         # Parse perturbations into PerturbationEffect objects
         pert_effects = self._parse_perturbations(perturbations)
 
-        # Run N simulations
-        all_timeseries = []
-        states_6h = []
-        states_24h = []
+        # Run N simulations as one batch
+        batch = simulator.simulate_batch(pert_effects, timepoints_hr, n_runs, rng)
 
-        for run_idx in range(n_runs):
-            # Simulate timecourse
-            states = simulator.simulate_timecourse(pert_effects, timepoints_hr, rng)
-            all_timeseries.append(states)
-
-            # Extract 6h and 24h states for outcome prediction
-            state_6h = [s for s in states if abs(s.time_hr - 6) < 0.1][0]
-            state_24h = [s for s in states if abs(s.time_hr - 24) < 0.1][0]
-
-            states_6h.append(state_6h)
-            states_24h.append(state_24h)
+        # 6h and 24h states for outcome prediction
+        idx_6h = batch.time_index(6)
+        idx_24h = batch.time_index(24)
 
         # Predict outcomes
         outcome_model = RegenerationOutcomeModel(self.mechanism_map)
-        state_pairs = list(zip(states_6h, states_24h))
-        outcomes = outcome_model.predict_with_uncertainty(state_pairs)
+        outcomes = outcome_model.predict_batch_with_uncertainty(batch.at(6), batch.at(24))
 
         # Aggregate timeseries statistics
-        timeseries_stats = self._aggregate_timeseries(all_timeseries, timepoints_hr)
+        timeseries_stats = self._aggregate_timeseries(batch, timepoints_hr)
+
+        n_examples = min(10, n_runs)  # First 10 as examples
 
         return {
             "mirror": mirror_name,
@@ -120,17 +146,21 @@ class MonteCarloEngine:
             "n_runs": n_runs,
             "timeseries_stats": timeseries_stats,
             "outcomes": outcomes,
-            "raw_states_6h": [asdict(s) for s in states_6h[:10]],  # First 10 as examples
-            "raw_states_24h": [asdict(s) for s in states_24h[:10]]
+            "raw_states_6h": [asdict(batch.state(i, idx_6h)) for i in range(n_examples)],
+            "raw_states_24h": [asdict(batch.state(i, idx_24h)) for i in range(n_examples)]
         }
 
-    def run_full_experiment(self, plan: Dict, output_dir: Path) -> Dict:
+    def run_full_experiment(
+        self, plan: Dict, output_dir: Path, workers: Optional[int] = None
+    ) -> Dict:
         """
         Run complete experiment across all mirrors and conditions.
 
         Args:
-            plan: Experiment plan YAML (mirrors, conditions, readouts, n_runs)
+            plan: Experiment plan YAML (mirrors, conditions, readouts, n_runs, seed)
             output_dir: Where to save results
+            workers: Worker processes for mirror × condition cells
+                     (default: plan "workers", else run serially)
 
         Returns:
             Complete results dictionary
@@ -142,41 +172,54 @@ class MonteCarloEngine:
         conditions = plan["conditions"]
         n_runs = plan.get("runs", 500)
         timepoints_hr = plan.get("timepoints_hr", [0, 2, 6, 24, 168])
+        seed = plan_seed(plan)
+        workers = workers if workers is not None else plan.get("workers", 1)
 
         results = {
             "plan": plan,
+            "seed": seed,
             "mirrors": {},
             "consensus": {}
         }
 
-        # Run each condition on each mirror
-        for mirror in mirrors:
-            print(f"\n=== Running mirror: {mirror} ===")
-            results["mirrors"][mirror] = {}
-
-            for condition in conditions:
-                label = condition["label"]
-                perturbations = condition.get("perturbations", [])
-
-                print(f"  Condition: {label} ({len(perturbations)} perturbations)")
-
-                result = self.run_condition(
-                    mirror,
-                    perturbations,
-                    n_runs,
-                    timepoints_hr,
-                    seed=hash(f"{mirror}_{label}") % 2**32
-                )
+        # One child seed per cell, in plan order (mirror-major)
+        cells = [(mirror, condition) for mirror in mirrors for condition in conditions]
+        child_seeds = np.random.SeedSequence(seed).spawn(len(cells))
+        tasks = [
+            (mirror, condition.get("perturbations", []), n_runs, timepoints_hr, child)
+            for (mirror, condition), child in zip(cells, child_seeds)
+        ]
+
+        print(f"\n=== Running {len(cells)} mirror × condition cells "
+              f"(seed={seed}, workers={workers or 1}) ===")
+
+        if workers and workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.config, self.resources())
+            ) as executor:
+                cell_results = list(executor.map(_run_cell, tasks))
+        else:
+            cell_results = [self.run_condition(*task) for task in tasks]
+
+        # Merge in plan order, independent of completion order
+        for (mirror, condition), result in zip(cells, cell_results):
+            label = condition["label"]
+            if mirror not in results["mirrors"]:
+                print(f"\n=== Mirror: {mirror} ===")
+                results["mirrors"][mirror] = {}
 
-                results["mirrors"][mirror][label] = result
+            results["mirrors"][mirror][label] = result
 
-                # Print quick summary
-                p_regen = result["outcomes"]["regeneration_7d"]["mean"]
-                ci = (
-                    result["outcomes"]["regeneration_7d"]["ci_lower"],
-                    result["outcomes"]["regeneration_7d"]["ci_upper"]
-                )
-                print(f"    P(regen) = {p_regen:.3f} [{ci[0]:.3f}, {ci[1]:.3f}]")
+            # Print quick summary
+            p_regen = result["outcomes"]["regeneration_7d"]["mean"]
+            ci = (
+                result["outcomes"]["regeneration_7d"]["ci_lower"],
+                result["outcomes"]["regeneration_7d"]["ci_upper"]
+            )
+            print(f"  Condition: {label} ({len(condition.get('perturbations', []))} perturbations)")
+            print(f"    P(regen) = {p_regen:.3f} [{ci[0]:.3f}, {ci[1]:.3f}]")
 
         # Compute consensus
         print("\n=== Computing cross-mirror consensus ===")
@@ -223,29 +266,26 @@ class MonteCarloEngine:
         return effects
 
     def _aggregate_timeseries(
-        self, all_timeseries: List[List[BioelectricState]], timepoints_hr: List[float]
+        self, batch: BioelectricBatch, timepoints_hr: List[float]
     ) -> Dict:
         """Aggregate timeseries across runs into mean ± CI."""
 
         stats = {t: {} for t in timepoints_hr}
 
-        for t_idx, t in enumerate(timepoints_hr):
-            # Extract all states at this timepoint
-            states_at_t = [run[t_idx] for run in all_timeseries]
-
-            # Aggregate each parameter
-            for param in ["center_stability", "center_size_mm", "center_depol_mv",
-                          "rhythm_freq_hz", "rhythm_coherence", "rhythm_velocity_um_s",
-                          "aperture_permeability", "aperture_dilation_rate"]:
+        for param in STATE_PARAMS:
+            values = batch.columns[param]  # [n_runs, n_timepoints]
 
-                values = np.array([getattr(s, param) for s in states_at_t])
+            means = np.mean(values, axis=0)
+            stds = np.std(values, axis=0)
+            ci_lower, medians, ci_upper = np.percentile(values, [2.5, 50, 97.5], axis=0)
 
+            for t_idx, t in enumerate(timepoints_hr):
                 stats[t][param] = {
-                    "mean": float(np.mean(values)),
-                    "std": float(np.std(values)),
-                    "ci_lower": float(np.percentile(values, 2.5)),
-                    "ci_upper": float(np.percentile(values, 97.5)),
-                    "median": float(np.median(values))
+                    "mean": float(means[t_idx]),
+                    "std": float(stds[t_idx]),
+                    "ci_lower": float(ci_lower[t_idx]),
+                    "ci_upper": float(ci_upper[t_idx]),
+                    "median": float(medians[t_idx])
                 }
 
         return stats
@@ -287,6 +327,27 @@ class MonteCarloEngine:
 
         return consensus
 
+def plan_seed(plan: Dict) -> int:
+    """Plan-level seed: plan["seed"], else a stable hash of the plan_id."""
+    if plan.get("seed") is not None:
+        return int(plan["seed"])
+    digest = hashlib.sha256(str(plan.get("plan_id", "")).encode()).digest()
+    return int.from_bytes(digest[:4], "big")
+
+
+# Worker-process state: one engine per process, built once from shared resources
+_worker_engine: Optional[MonteCarloEngine] = None
+
+
+def _init_worker(config: Dict, resources: Dict):
+    global _worker_engine
+    _worker_engine = MonteCarloEngine.from_resources(config, resources)
+
+
+def _run_cell(task: tuple) -> Dict:
+    return _worker_engine.run_condition(*task)
+
+
 if __name__ == "__main__":
     # Test run
     config = {}
@@ -106,16 +106,86 @@ class RegenerationOutcomeModel:
             for key in outcomes:
                 outcomes[key].append(probs[key])
 
-        # Compute statistics
+        return self.summarize({key: np.array(values) for key, values in outcomes.items()})
+
+    def predict_batch(
+        self,
+        features_6h: Dict[str, np.ndarray],
+        features_24h: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized predict_probability over an ensemble.
+
+        Args:
+            features_6h: param → [n_runs] at 6h (BioelectricBatch.at(6))
+            features_24h: param → [n_runs] at 24h
+
+        Returns:
+            outcome → [n_runs] probabilities
+        """
+
+        center_6h = features_6h["center_stability"]
+        rhythm_6h = features_6h["rhythm_coherence"]
+        aperture_6h = features_6h["aperture_permeability"]
+        center_24h = features_24h["center_stability"]
+        rhythm_24h = features_24h["rhythm_coherence"]
+
+        logit_blastema = (
+            self.coef["intercept"]
+            + self.coef["center_stability"] * center_6h
+            + self.coef["rhythm_coherence"] * rhythm_6h
+            + self.coef["aperture_permeability"] * aperture_6h
+            + self.coef["center_rhythm_interaction"] * (center_6h * rhythm_6h)
+            + self.coef["rhythm_aperture_interaction"] * (rhythm_6h * aperture_6h)
+        )
+        p_blastema = self._sigmoid_array(logit_blastema)
+
+        logit_regen = (
+            self.coef["intercept"] + 0.5
+            + self.coef["center_stability"] * center_24h
+            + self.coef["rhythm_coherence"] * rhythm_24h
+            + self.coef["aperture_permeability"] * aperture_6h
+            + self.coef["center_rhythm_interaction"] * (center_24h * rhythm_24h)
+            + 1.5 * p_blastema
+        )
+        p_regen = self._sigmoid_array(logit_regen)
+
+        triple_score_6h = center_6h * rhythm_6h * aperture_6h
+        rhythm_persistence = rhythm_24h / np.maximum(rhythm_6h, 0.1)
+
+        logit_pattern = (
+            self.coef["intercept"] + 1.0
+            + 4.0 * triple_score_6h
+            + 1.5 * rhythm_persistence
+        )
+        p_pattern = self._sigmoid_array(logit_pattern)
+
+        return {
+            "blastema_24h": p_blastema,
+            "regeneration_7d": p_regen,
+            "pattern_fidelity": p_pattern
+        }
+
+    def predict_batch_with_uncertainty(
+        self,
+        features_6h: Dict[str, np.ndarray],
+        features_24h: Dict[str, np.ndarray]
+    ) -> Dict[str, Dict[str, float]]:
+        """Array-input equivalent of predict_with_uncertainty."""
+        return self.summarize(self.predict_batch(features_6h, features_24h))
+
+    @staticmethod
+    def summarize(outcomes: Dict[str, np.ndarray]) -> Dict[str, Dict[str, float]]:
+        """mean, std, 95% CI and median of each outcome array."""
         results = {}
-        for key, values in outcomes.items():
-            arr = np.array(values)
+        for key, arr in outcomes.items():
+            ci_lower, median, ci_upper = np.percentile(arr, [2.5, 50, 97.5])
             results[key] = {
-                "mean": np.mean(arr),
-                "std": np.std(arr),
-                "ci_lower": np.percentile(arr, 2.5),
-                "ci_upper": np.percentile(arr, 97.5),
-                "median": np.median(arr)
+                "mean": float(np.mean(arr)),
+                "std": float(np.std(arr)),
+                "ci_lower": float(ci_lower),
+                "ci_upper": float(ci_upper),
+                "median": float(median)
             }
 
         return results
@@ -129,6 +199,12 @@ class RegenerationOutcomeModel:
             return 0.0
         return 1.0 / (1.0 + np.exp(-x))
 
+    @staticmethod
+    def _sigmoid_array(x: np.ndarray) -> np.ndarray:
+        """Vectorized _sigmoid (same saturation at |x| > 20)."""
+        x = np.asarray(x, dtype=float)
+        return np.where(x > 20, 1.0, np.where(x < -20, 0.0, 1.0 / (1.0 + np.exp(-np.clip(x, -20, 20)))))
+
     def compute_effect_size(
         self,
         outcomes_control: Dict[str, Dict[str, float]],
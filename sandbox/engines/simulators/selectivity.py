@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+CBD Selectivity Simulator
+
+Evaluates channel-first CBD parameter combinations (VDAC1 affinity, MCU
+block, chloride channel IC50) as dose-response curves for cancer vs healthy
+cell models, on top of one loaded MonteCarloEngine.
+
+Each channel's occupancy at a dose (Hill curve) is scaled by the cell type's
+sensitivity and stress amplification and applied through the matching
+perturbation kit: VDAC1 closure → center, MCU block → rhythm, chloride
+inhibition → aperture. Viability is P(regeneration_7d) relative to vehicle,
+consensus-weighted across mirrors by S4 confidence.
+
+Every dose and cell model of one mirror reuses the same random stream
+(common random numbers), so curve differences come from the parameters,
+not from sampling noise.
+
+successive_halving() ranks many combinations on cheap low-run evaluations
+and only carries the best 1/eta of each rung to the next, more expensive one.
+"""
+
+import json
+import math
+import numpy as np
+import yaml
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+from monte_carlo import MonteCarloEngine, plan_seed
+
+# Channel → (perturbation kit, agent) used to carry its effect into the simulator
+CHANNEL_KITS = {
+    "vdac1": ("center", "bafilomycin"),
+    "mcu": ("rhythm", "bapta_am"),
+    "chloride_channels": ("aperture", "carbenoxolone"),
+}
+
+# Cell model → cell_type_differences profile in the simulation plan
+CELL_PROFILES = {
+    "cancer_u87mg": "cancer_vulnerability",
+    "healthy_astrocytes": "healthy_resistance",
+}
+
+IC50_LEVEL = 0.5   # Viability at IC50
+SAFE_LEVEL = 0.8   # Healthy viability still considered safe
+
+
+def hill(dose: float, ic50: float, n: float) -> float:
+    """Fractional response of a Hill curve (0 at dose 0, 1 at saturation)."""
+    if dose <= 0:
+        return 0.0
+    return dose ** n / (dose ** n + ic50 ** n)
+
+
+def interpolate_dose(doses: List[float], viability: List[float], level: float) -> Optional[float]:
+    """
+    Dose where viability first falls to `level` (log-linear interpolation).
+
+    Returns None if viability stays above `level` over the tested range.
+    """
+    previous_dose, previous_v = None, None
+    for dose, v in zip(doses, viability):
+        if v <= level:
+            if previous_dose is None or previous_v == v:
+                return float(dose)
+            frac = (previous_v - level) / (previous_v - v)
+            log_dose = np.log(previous_dose) + frac * (np.log(dose) - np.log(previous_dose))
+            return float(np.exp(log_dose))
+        previous_dose, previous_v = dose, v
+    return None
+
+
+def successive_halving(
+    candidates: List[str],
+    evaluate: Callable[[List[str], int], Dict[str, float]],
+    fidelities: List[int],
+    eta: int = 3
+) -> Tuple[Dict[str, float], List[Dict]]:
+    """
+    Successive halving over increasing fidelities (e.g. monte_carlo_runs).
+
+    Every candidate is scored at fidelities[0]; the top ceil(n/eta) go on to
+    the next fidelity, and so on, until the survivors are scored at the last
+    (full) fidelity. Higher scores are better.
+
+    Args:
+        candidates: Candidate ids (e.g. combination_ids)
+        evaluate: (ids, fidelity) → id → score
+        fidelities: Increasing evaluation budgets, last one = full fidelity
+        eta: Keep 1/eta of the candidates per rung
+
+    Returns:
+        (id → score at full fidelity for the final rung, per-rung history)
+    """
+
+    if eta < 2:
+        raise ValueError(f"eta must be >= 2, got {eta}")
+    if not fidelities or list(fidelities) != sorted(fidelities):
+        raise ValueError(f"fidelities must be non-empty and increasing, got {fidelities}")
+
+    survivors = list(candidates)
+    history = []
+
+    for rung, fidelity in enumerate(fidelities[:-1]):
+        scores = evaluate(survivors, fidelity)
+        history.append({"rung": rung, "fidelity": fidelity, "scores": dict(scores)})
+
+        # Stable ranking: ties keep candidate order
+        ranked = sorted(survivors, key=lambda c: -scores.get(c, float("-inf")))
+        survivors = ranked[:max(1, math.ceil(len(ranked) / eta))]
+
+    scores = evaluate(survivors, fidelities[-1])
+    history.append({"rung": len(fidelities) - 1, "fidelity": fidelities[-1], "scores": dict(scores)})
+
+    return scores, history
+
+
+class SelectivitySimulator:
+    """Dose-response selectivity evaluation on a shared MonteCarloEngine."""
+
+    def __init__(self, engine: MonteCarloEngine, mirrors: Optional[List[str]] = None):
+        """
+        Args:
+            engine: Loaded engine (S4 states, perturbation kits, mechanism map)
+            mirrors: Mirrors to simulate (default: every loaded S4 state)
+        """
+        self.engine = engine
+        self.mirrors = mirrors or sorted(engine.s4_states)
+
+    def channel_scaling(self, plan: Dict, cell_model: str, dose: float) -> Dict[str, float]:
+        """Effect scaling per channel for one cell model at one dose (μM)."""
+
+        channels = plan["channel_parameters"]
+        profile = plan["cell_type_differences"][CELL_PROFILES[cell_model]]
+        vdac1, mcu, chloride = channels["vdac1"], channels["mcu"], channels["chloride_channels"]
+
+        occupancy = {
+            "vdac1": vdac1["max_closure"] * profile["vdac1_sensitivity"] * hill(
+                dose, vdac1["affinity"] / 1000.0, vdac1["hill_coefficient"]),  # nM → μM
+            "mcu": mcu["block_strength"] * hill(dose, mcu["ic50"], mcu["cooperativity"]),
+            "chloride_channels": chloride["max_inhibition"] * hill(
+                dose, chloride["ic50"], chloride["hill_coefficient"]),
+        }
+
+        # Stressed cells amplify the same channel occupancy
+        gain = profile["stress_amplification"] * (1.0 + profile["baseline_stress"])
+        return {channel: gain * value for channel, value in occupancy.items()}
+
+    def simulate(self, plan: Dict, output_dir: Optional[Path] = None) -> Dict:
+        """
+        Simulate one parameter combination.
+
+        Args:
+            plan: Selectivity simulation plan (channel_parameters,
+                  cell_type_differences, experimental_design, simulation_settings)
+            output_dir: If given, plan.yaml and summary.json are written here
+
+        Returns:
+            Summary with dose_response, selectivity_index,
+            mechanism_validation and safety_metrics
+        """
+
+        design = plan["experimental_design"]
+        doses = sorted(float(d) for d in design["cbd_doses"])
+        cell_models = design.get("cell_models", list(CELL_PROFILES))
+        n_runs = plan["simulation_settings"]["monte_carlo_runs"]
+        mirrors = plan.get("mirrors", self.mirrors)
+        seed = plan_seed(plan)
+        mirror_seeds = dict(zip(mirrors, np.random.SeedSequence(seed).spawn(len(mirrors))))
+
+        weights = np.array([self.engine.s4_states[m]["confidence"] for m in mirrors], dtype=float)
+        weights /= weights.sum()
+
+        dose_response = {}
+        for cell_model in cell_models:
+            # P(regeneration) per mirror × (vehicle + doses)
+            p_regen = np.array([
+                [self._p_regen(mirror, self.channel_scaling(plan, cell_model, dose),
+                               n_runs, mirror_seeds[mirror])
+                 for dose in [0.0] + doses]
+                for mirror in mirrors
+            ])
+            viability_by_mirror = p_regen[:, 1:] / np.maximum(p_regen[:, :1], 1e-9)
+            viability = weights @ viability_by_mirror
+
+            ic50 = interpolate_dose(doses, viability, IC50_LEVEL)
+            safe_dose = interpolate_dose(doses, viability, SAFE_LEVEL)
+            dose_response[cell_model] = {
+                "doses_um": doses,
+                "viability": [float(v) for v in viability],
+                "viability_std": [float(s) for s in viability_by_mirror.std(axis=0)],
+                "vehicle_p_regen": float(weights @ p_regen[:, 0]),
+                # Not reached within the tested range → report the top dose (censored)
+                "ic50": ic50 if ic50 is not None else doses[-1],
+                "ic50_censored": ic50 is None,
+                "safe_dose": safe_dose if safe_dose is not None else doses[-1],
+            }
+
+        summary = {
+            "plan_id": plan.get("plan_id"),
+            "seed": seed,
+            "n_runs": n_runs,
+            "mirrors": list(mirrors),
+            "dose_response": dose_response,
+        }
+        summary.update(self._selectivity_metrics(plan, dose_response, doses[-1]))
+
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with open(output_dir / "plan.yaml", "w") as f:
+                yaml.dump(plan, f, default_flow_style=False)
+            with open(output_dir / "summary.json", "w") as f:
+                json.dump(summary, f, indent=2)
+
+        return summary
+
+    def simulate_batch(
+        self, plans: Dict[str, Dict], output_root: Optional[Path] = None
+    ) -> Dict[str, Dict]:
+        """
+        Simulate many combinations in this process, reusing the loaded engine.
+
+        Args:
+            plans: combination_id → simulation plan
+            output_root: If given, each combination writes to output_root/<combination_id>/
+
+        Returns:
+            combination_id → summary (see simulate())
+        """
+        return {
+            combination_id: self.simulate(
+                plan, Path(output_root) / combination_id if output_root is not None else None
+            )
+            for combination_id, plan in plans.items()
+        }
+
+    def _p_regen(
+        self, mirror: str, scaling: Dict[str, float], n_runs: int, seed: np.random.SeedSequence
+    ) -> float:
+        """Mean P(regeneration_7d) for one mirror under the given channel scaling."""
+
+        perturbations = [
+            {"kit": kit, "agent": agent, "effect_scaling": scaling[channel]}
+            for channel, (kit, agent) in CHANNEL_KITS.items()
+            if scaling[channel] > 0
+        ]
+        result = self.engine.run_condition(mirror, perturbations, n_runs, [6, 24], seed)
+        return result["outcomes"]["regeneration_7d"]["mean"]
+
+    def _selectivity_metrics(self, plan: Dict, dose_response: Dict, top_dose: float) -> Dict:
+        """Selectivity index, channel-first score and therapeutic window."""
+
+        cancer = dose_response.get("cancer_u87mg")
+        healthy = dose_response.get("healthy_astrocytes")
+        if cancer is None or healthy is None:
+            return {}
+
+        # Share of the cancer-cell effect carried by VDAC1 + chloride (vs MCU) at the top dose
+        scaling = self.channel_scaling(plan, "cancer_u87mg", top_dose)
+        total = sum(scaling.values())
+        channel_first = (scaling["vdac1"] + scaling["chloride_channels"]) / total if total else 0.0
+
+        return {
+            "selectivity_index": healthy["ic50"] / cancer["ic50"],
+            "mechanism_validation": {"channel_first_score": float(channel_first)},
+            "safety_metrics": {"therapeutic_window": healthy["safe_dose"] / cancer["ic50"]},
+        }
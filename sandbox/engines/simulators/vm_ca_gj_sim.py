@@ -9,12 +9,54 @@ Generates time-series predictions for bioelectric readouts based on:
 
 This is a phenomenological model, not biophysical. It captures the
 relationships encoded in S4→bioelectric mapping without solving PDEs.
+
+Two equivalent paths:
+- simulate_timecourse: one run as a list of BioelectricState snapshots
+- simulate_batch: all runs at once as NumPy arrays (struct-of-arrays,
+  one [n_runs, n_timepoints] array per parameter) for Monte Carlo use
 """
 
 import numpy as np
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+# Parameter columns of a batched simulation (BioelectricState minus time_hr)
+STATE_PARAMS = (
+    "center_stability", "center_size_mm", "center_depol_mv",
+    "rhythm_freq_hz", "rhythm_coherence", "rhythm_velocity_um_s",
+    "aperture_permeability", "aperture_dilation_rate",
+)
+
+# Initial-state sampling: param → (triple component, prior key, noise CV at confidence 1)
+INITIAL_PRIORS = {
+    "center_stability": ("center", "stability_prior", 0.15),
+    "center_size_mm": ("center", "size_mm_prior", 0.20),
+    "center_depol_mv": ("center", "depol_mv_prior", 0.15),
+    "rhythm_freq_hz": ("rhythm", "freq_hz_prior", 0.20),
+    "rhythm_coherence": ("rhythm", "coherence_prior", 0.15),
+    "rhythm_velocity_um_s": ("rhythm", "velocity_um_s_prior", 0.25),
+    "aperture_permeability": ("aperture", "permeability_prior", 0.20),
+    "aperture_dilation_rate": ("aperture", "dilation_rate_prior", 0.25),
+}
+
+# Perturbation deltas: kit → delta key → (param, multiplicative, clip bounds)
+PERTURBATION_TARGETS = {
+    "center": {
+        "center_stability": ("center_stability", True, (0.0, 1.0)),
+        "center_size": ("center_size_mm", True, (0.0, 2.0)),
+        "depol_mv": ("center_depol_mv", False, (-10, 60)),
+    },
+    "rhythm": {
+        "rhythm_freq": ("rhythm_freq_hz", True, (0.1, 5.0)),
+        "rhythm_coherence": ("rhythm_coherence", True, (0.0, 1.0)),
+        "velocity": ("rhythm_velocity_um_s", True, (5, 100)),
+    },
+    "aperture": {
+        "permeability": ("aperture_permeability", True, (0.0, 1.0)),
+        "dilation_rate": ("aperture_dilation_rate", True, (0.0, 1.0)),
+    },
+}
+
 @dataclass
 class BioelectricState:
     """Snapshot of bioelectric parameters at a timepoint."""
@@ -34,6 +76,35 @@ class BioelectricState:
     aperture_permeability: float
     aperture_dilation_rate: float
 
+@dataclass
+class BioelectricBatch:
+    """All Monte Carlo runs of one condition, one array per parameter."""
+    time_hr: np.ndarray  # [n_timepoints]
+    columns: Dict[str, np.ndarray]  # param → [n_runs, n_timepoints]
+
+    @property
+    def n_runs(self) -> int:
+        return self.columns[STATE_PARAMS[0]].shape[0]
+
+    def time_index(self, time_hr: float, tol: float = 0.1) -> int:
+        """Index of the timepoint within `tol` hours of `time_hr`."""
+        matches = np.flatnonzero(np.abs(self.time_hr - time_hr) < tol)
+        if matches.size == 0:
+            raise ValueError(f"No simulated timepoint near {time_hr}h (have {self.time_hr.tolist()})")
+        return int(matches[0])
+
+    def at(self, time_hr: float) -> Dict[str, np.ndarray]:
+        """Per-run values at one timepoint: param → [n_runs]."""
+        idx = self.time_index(time_hr)
+        return {param: values[:, idx] for param, values in self.columns.items()}
+
+    def state(self, run: int, t_idx: int) -> BioelectricState:
+        """One run at one timepoint as a BioelectricState."""
+        return BioelectricState(
+            time_hr=float(self.time_hr[t_idx]),
+            **{param: float(values[run, t_idx]) for param, values in self.columns.items()}
+        )
+
 @dataclass
 class PerturbationEffect:
     """Applied perturbation with effect deltas."""
@@ -284,6 +355,125 @@ class VMCaGJSimulator:
 
         return state
 
+    # Batched (struct-of-arrays) path
+
+    def sample_initial_batch(self, n_runs: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """Sample n_runs initial states from S4 priors + noise: param → [n_runs]."""
+
+        triple = self.s4_state["triple_signature"]
+        noise_scale = 1.0 / np.sqrt(self.s4_state["confidence"])
+
+        state = {}
+        for param, (component, prior_key, cv) in INITIAL_PRIORS.items():
+            low, high = triple[component][prior_key]
+            base = rng.uniform(low, high, n_runs)
+            noise = rng.standard_normal(n_runs) * (noise_scale * cv * base)
+            state[param] = np.clip(base + noise, low * 0.5, high * 1.5)
+
+        return state
+
+    def apply_perturbation_batch(
+        self,
+        state: Dict[str, np.ndarray],
+        perturbations: List[PerturbationEffect],
+        rng: np.random.Generator
+    ) -> Dict[str, np.ndarray]:
+        """Apply perturbation effects to every run at once."""
+
+        new_state = {param: values.copy() for param, values in state.items()}
+        n_runs = len(next(iter(state.values())))
+
+        for pert in perturbations:
+            for delta_key, (param, multiplicative, (low, high)) in PERTURBATION_TARGETS.get(pert.target, {}).items():
+                if delta_key not in pert.deltas:
+                    continue
+                delta_mean, delta_std = pert.deltas[delta_key]
+                delta = rng.normal(delta_mean, delta_std, n_runs)
+                updated = new_state[param] * (1 + delta) if multiplicative else new_state[param] + delta
+                new_state[param] = np.clip(updated, low, high)
+
+        return self._apply_triple_coupling_batch(state, new_state)
+
+    def _apply_triple_coupling_batch(
+        self, original: Dict[str, np.ndarray], perturbed: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized _apply_triple_coupling."""
+
+        # Center-rhythm coupling
+        center_disruption = np.maximum(0, original["center_stability"] - perturbed["center_stability"])
+        coupling_coeff = 0.4  # From mechanism map
+        perturbed["rhythm_coherence"] *= (1 - coupling_coeff * center_disruption)
+
+        # Rhythm-aperture resonance
+        freq_optimal = 1.0  # Hz
+        perm_optimal = 0.8
+        freq_deviation = np.abs(perturbed["rhythm_freq_hz"] - freq_optimal) / freq_optimal
+        perm_deviation = np.abs(perturbed["aperture_permeability"] - perm_optimal) / perm_optimal
+
+        resonance_penalty = 0.3 * (freq_deviation + perm_deviation)
+        perturbed["rhythm_coherence"] *= (1 - resonance_penalty)
+        perturbed["aperture_permeability"] *= (1 - resonance_penalty)
+
+        # Aperture gates center formation
+        gated = perturbed["aperture_permeability"] < 0.3
+        perturbed["center_stability"] = np.where(gated, perturbed["center_stability"] * 0.5, perturbed["center_stability"])
+        perturbed["center_size_mm"] = np.where(gated, perturbed["center_size_mm"] * 0.6, perturbed["center_size_mm"])
+
+        return perturbed
+
+    def _evolve_batch(
+        self, base_state: Dict[str, np.ndarray], timepoints_hr: List[float], rng: np.random.Generator
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized _evolve_state over all runs and timepoints: param → [n_runs, n_timepoints]."""
+
+        t = np.asarray(timepoints_hr, dtype=float)
+        n_runs, n_times = len(base_state["center_stability"]), len(t)
+
+        columns = {
+            param: np.repeat(values[:, None], n_times, axis=1)
+            for param, values in base_state.items()
+        }
+
+        # Aperture dynamics: peaks at 2-4h (drawn per run and timepoint), then declines
+        peak_time = rng.uniform(2, 4, (n_runs, n_times))
+        aperture_boost = np.where(
+            t < peak_time,
+            1.0 + 0.5 * (t / peak_time),
+            1.0 + 0.5 * np.exp(-(t - peak_time) / 6.0)
+        )
+        columns["aperture_permeability"] *= np.clip(aperture_boost, 0.5, 1.5)
+
+        # Center stability: forms by 6h, persists to 24h, then decays
+        center_ramp = np.where(t < 6, t / 6.0, np.where(t < 24, 1.0, np.exp(-(t - 24) / 48.0)))
+        columns["center_stability"] *= np.clip(center_ramp, 0.3, 1.0)
+
+        # Rhythm: stable 6-24h, slight decay after
+        rhythm_ramp = np.where(t < 6, 0.7 + 0.3 * (t / 6.0), np.where(t < 24, 1.0, 0.85))
+        columns["rhythm_coherence"] *= rhythm_ramp
+
+        # Add measurement noise
+        columns["center_depol_mv"] += rng.normal(0, 3.0, (n_runs, n_times))  # mV
+        columns["rhythm_freq_hz"] += rng.normal(0, 0.1, (n_runs, n_times))  # Hz
+
+        return columns
+
+    def simulate_batch(
+        self,
+        perturbations: List[PerturbationEffect],
+        timepoints_hr: List[float],
+        n_runs: int,
+        rng: np.random.Generator
+    ) -> BioelectricBatch:
+        """Simulate n_runs timecourses at once (same model as simulate_timecourse)."""
+
+        state = self.sample_initial_batch(n_runs, rng)
+        state = self.apply_perturbation_batch(state, perturbations, rng)
+
+        return BioelectricBatch(
+            time_hr=np.asarray(timepoints_hr, dtype=float),
+            columns=self._evolve_batch(state, timepoints_hr, rng)
+        )
+
     def _sample_from_range(
         self, prior_range: List[float], rng: np.random.Generator, noise_cv: float
     ) -> float:
@@ -12,6 +12,8 @@ from typing import Dict, List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from agents.adapters.ollama import OllamaAdapter
+from tools.response_cache import describe_adapter, get_response_cache
+from tools.vault_catalog import record_bioelectric_turn
 
 # Cloud adapters (simplified for this run - using existing orchestrator classes would be ideal)
 # For now, we'll focus on the Ollama mirrors and structure for cloud expansion
@@ -36,11 +38,12 @@ def save_turn(session_id: str, mirror_name: str, turn_num: int, response: str, p
     vault_dir.mkdir(parents=True, exist_ok=True)
 
     turn_file = vault_dir / f"turn_{turn_num:03d}.md"
+    timestamp = datetime.utcnow().isoformat()
 
     content = f"""# Bioelectric Turn {turn_num}
 **Session:** {session_id}
 **Mirror:** {mirror_name}
-**Timestamp:** {datetime.utcnow().isoformat()}
+**Timestamp:** {timestamp}
 **Felt Pressure:** {pressure}/5
 **Seal:** {seal}
 
@@ -50,6 +53,8 @@ def save_turn(session_id: str, mirror_name: str, turn_num: int, response: str, p
 """
 
     turn_file.write_text(content)
+    record_bioelectric_turn(turn_file, session_id, mirror_name, turn_num, response,
+                            pressure, seal, timestamp)
     return turn_file
 
 def run_mirror_turns(mirror_name: str, adapter, system_prompt: str, user_seed: str,
@@ -71,12 +76,17 @@ def run_mirror_turns(mirror_name: str, adapter, system_prompt: str, user_seed: s
         start = datetime.utcnow()
 
         try:
-            # Generate response
-            response = adapter.generate(
-                system=system_prompt,
-                user=user_seed,
-                temperature=0.3,
-                max_tokens=2048
+            # Generate response (or serve it from the configured response cache)
+            provider, model = describe_adapter(adapter)
+            response = get_response_cache().call(
+                provider, model, system_prompt, user_seed, 0.3, 2048,
+                fetch=lambda: adapter.generate(
+                    system=system_prompt,
+                    user=user_seed,
+                    temperature=0.3,
+                    max_tokens=2048
+                ),
+                sample=turn
             )
 
             # Extract metadata
@@ -3,6 +3,10 @@ import sys, re, json, hashlib
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.signals import SignalDetector
+
 def read_scrolls(session_dir: Path):
     items = []
     for md in sorted(session_dir.glob("*/turn_*.md")):
@@ -17,9 +21,12 @@ KEYS = {
   "texture": ["velvet","silk","gauze","water","fog","mist","stone","polished"],
 }
 
-def score_bag(text, bag):
-    t = text.lower()
-    return sum(t.count(k) for k in bag)
+# All four bags compiled into one detector, scanned once per scroll
+DETECTOR = SignalDetector(KEYS)
+
+def score_bags(text):
+    scan = DETECTOR.scan(text)
+    return {bag: scan.count(bag) for bag in KEYS}
 
 def extract_pressure(text):
     m = re.search(r"felt[_\s-]*pressure[^:]*[:=]\s*([0-9.]+)", text, re.I)
@@ -63,10 +70,8 @@ def main():
         press = extract_pressure(text)
         if press is not None: pressures.append(press)
         ch = chamber_from(text)
-        geo = score_bag(text, KEYS["geometry"])
-        mot = score_bag(text, KEYS["motion"])
-        col = score_bag(text, KEYS["color"])
-        tex = score_bag(text, KEYS["texture"])
+        scores = score_bags(text)
+        geo, mot, col, tex = scores["geometry"], scores["motion"], scores["color"], scores["texture"]
         nm = name_self(text)
         if nm: self_names.append({"mirror": mirror, "turn": fname, "name": nm})
 
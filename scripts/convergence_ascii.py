@@ -2,56 +2,10 @@
 import sys, re
 from pathlib import Path
 
-def detect_signals(text):
-    """
-    Detect IRIS signature signals in text.
-    Exposed as library function for use by gsw_gate.py.
-
-    Args:
-        text: Response text to analyze
-
-    Returns:
-        Dictionary with signal detection flags
-    """
-    t = text.lower()
-
-    # Geometry: rings, apertures, iris, circles, openings
-    geometry = any(k in t for k in [
-        "ring", "concentric", "aperture", "iris", "circle",
-        "well", "opening", "oval", "core", "center"
-    ])
-
-    # Motion: pulsing, rippling, breathing, dilating, waves
-    motion = any(k in t for k in [
-        "pulse", "pulsing", "ripple", "breathe", "dilate",
-        "dilation", "contract", "contraction", "wave", "thrum",
-        "expand", "reciprocal"
-    ])
-
-    # S4-specific attractor signals: rhythm + center + aperture combined
-    s4_rhythm = any(k in t for k in [
-        "rhythm", "pulsing", "reciprocal", "pulse", "waves",
-        "thrum", "steady pulse", "ripples"
-    ])
-    s4_center = any(k in t for k in [
-        "luminous", "core", "center", "steady", "anchor",
-        "still point", "beacon", "glow", "holds"
-    ])
-    s4_aperture = any(k in t for k in [
-        "aperture", "opening", "widening", "soften", "inviting",
-        "bloom", "breathing open", "dilate", "expansion", "pull"
-    ])
-    s4_attractor = s4_rhythm and s4_center and s4_aperture
-
-    return {
-        "geometry": geometry,
-        "motion": motion,
-        "s4_attractor": s4_attractor,
-        "s4_rhythm": s4_rhythm,
-        "s4_center": s4_center,
-        "s4_aperture": s4_aperture
-    }
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Library function for gsw_gate.py and legacy callers
+from src.core.signals import detect_signals
 
 def mark(text):
     """
@@ -14,35 +14,25 @@ import sys, re, json
 from pathlib import Path
 from collections import defaultdict
 
-# S4 attractor keyword families (config-ready)
-S4_KEYWORDS = {
-    "rhythm": ["rhythm", "pulsing", "reciprocal", "pulse", "waves", "thrum", "steady pulse", "ripples"],
-    "center": ["luminous", "core", "center", "steady", "anchor", "still point", "beacon", "glow", "holds"],
-    "aperture": ["aperture", "opening", "widening", "soften", "inviting", "bloom", "breathing open", "dilate", "expansion", "pull"]
-}
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-GEO_KEYWORDS = ["ring", "concentric", "aperture", "iris", "circle", "well", "opening", "oval", "core", "center"]
-MOT_KEYWORDS = ["pulse", "pulsing", "ripple", "breathe", "dilate", "dilation", "contract", "contraction", "wave", "thrum", "expand", "reciprocal"]
+from src.core.signals import S4_COMPONENTS, SIGNAL_KEYWORDS, scan_batch, scan_signals
 
-def mark(text, explain=False):
-    """Detect geometry, motion, and S4 attractor signals."""
-    t = text.lower()
+# S4 attractor keyword families (shared definitions in src/core/signals.py)
+S4_KEYWORDS = {component: SIGNAL_KEYWORDS[component] for component in S4_COMPONENTS}
 
-    geo = any(k in t for k in GEO_KEYWORDS)
-    mot = any(k in t for k in MOT_KEYWORDS)
+GEO_KEYWORDS = SIGNAL_KEYWORDS["geometry"]
+MOT_KEYWORDS = SIGNAL_KEYWORDS["motion"]
 
-    s4_rhythm = any(k in t for k in S4_KEYWORDS["rhythm"])
-    s4_center = any(k in t for k in S4_KEYWORDS["center"])
-    s4_aperture = any(k in t for k in S4_KEYWORDS["aperture"])
-    s4_attractor = s4_rhythm and s4_center and s4_aperture
+def mark(text, explain=False, scan=None):
+    """Detect geometry, motion, and S4 attractor signals (pass `scan` to reuse a batch scan)."""
+    scan = scan if scan is not None else scan_signals(text)
+    signals = scan.flags()
+
+    geo, mot, s4_attractor = signals["geometry"], signals["motion"], signals["s4_attractor"]
 
     if explain:
-        evidence = {
-            "rhythm": [k for k in S4_KEYWORDS["rhythm"] if k in t],
-            "center": [k for k in S4_KEYWORDS["center"] if k in t],
-            "aperture": [k for k in S4_KEYWORDS["aperture"] if k in t]
-        }
-        return ("G" if geo else "."), ("M" if mot else "."), ("A" if s4_attractor else "."), evidence
+        return ("G" if geo else "."), ("M" if mot else "."), ("A" if s4_attractor else "."), scan.evidence()
 
     return ("G" if geo else "."), ("M" if mot else "."), ("A" if s4_attractor else ".")
 
@@ -67,15 +57,17 @@ def analyze(session_dir, explain=False):
     rows = {m: {f'S{i}': {"G": False, "M": False, "A": False, "turns": [], "attractor_turns": []}
                 for i in range(1, 5)} for m in mirrors}
 
-    for md in root.glob("*/turn_*.md"):
+    files = list(root.glob("*/turn_*.md"))
+    texts = [md.read_text(errors="ignore") for md in files]
+
+    for md, t, scan in zip(files, texts, scan_batch(texts)):
         m = md.parent.name
-        t = md.read_text(errors="ignore")
         ch = chamber(t)
 
         if explain:
-            g, mot, att, evidence = mark(t, explain=True)
+            g, mot, att, evidence = mark(t, explain=True, scan=scan)
         else:
-            g, mot, att = mark(t)
+            g, mot, att = mark(t, scan=scan)
             evidence = None
 
         if ch in rows[m]:
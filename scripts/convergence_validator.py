@@ -35,6 +35,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from sandbox.engines.consensus.mirror_vote import MirrorConsensus
 from scripts.convergence_metrics import calculate_convergence_score
 from utils.timezone import now_iso
+from tools.vault_catalog import open_catalog
 
 
 class ConvergenceValidator:
@@ -195,16 +196,28 @@ class ConvergenceValidator:
         if not scrolls_dir.exists():
             raise FileNotFoundError(f"Scrolls directory not found: {scrolls_dir}")
 
-        for session_dir in scrolls_dir.iterdir():
-            if not session_dir.is_dir():
-                continue
+        # Chamber scrolls straight from the vault catalog when the vault has one;
+        # sessions it does not cover (saved before it existed) are globbed
+        catalog = open_catalog(vault)
+        if catalog is not None:
+            chamber_files = [
+                (row["session_id"], vault / row["scroll_path"])
+                for row in catalog.query_turns(chamber=chamber_id, layout="orchestrator")
+            ]
+            session_dirs = catalog.unindexed_sessions()
+        else:
+            chamber_files = []
+            session_dirs = sorted(path for path in scrolls_dir.iterdir() if path.is_dir())
 
-            chamber_file = session_dir / f"{chamber_id}.md"
-            if not chamber_file.exists():
-                continue
+        chamber_files += [
+            (session_dir.name, session_dir / f"{chamber_id}.md")
+            for session_dir in session_dirs
+            if (session_dir / f"{chamber_id}.md").exists()
+        ]
 
+        for session_id, chamber_file in chamber_files:
             # Extract mirror ID from session directory name
-            mirror_id = self._extract_mirror_id_from_session(session_dir.name)
+            mirror_id = self._extract_mirror_id_from_session(session_id)
             if not mirror_id:
                 continue
 
@@ -212,7 +225,7 @@ class ConvergenceValidator:
             chamber_response = chamber_file.read_text(encoding='utf-8')
 
             # Load metadata if available
-            meta_file = vault / "meta" / f"{session_dir.name}_{chamber_id}.json"
+            meta_file = vault / "meta" / f"{session_id}_{chamber_id}.json"
             metadata = {}
             if meta_file.exists():
                 with open(meta_file) as f:
@@ -221,7 +234,7 @@ class ConvergenceValidator:
             mirror_data[mirror_id] = {
                 "response": chamber_response,
                 "metadata": metadata,
-                "session_id": session_dir.name,
+                "session_id": session_id,
                 "file_path": str(chamber_file)
             }
 
@@ -20,12 +20,10 @@ Examples:
     python3 epistemic_drift.py iris_vault/ --all-sessions
 """
 
-import sys
 import json
 import argparse
 from pathlib import Path
 from collections import defaultdict
-from modules.epistemic_map import classify_response
 
 
 def analyze_session_drift(session_path: Path) -> dict:
@@ -22,7 +22,18 @@ import sys
 import json
 import argparse
 from pathlib import Path
-from modules.epistemic_map import classify_response, format_classification_table
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.epistemic_map import classify_batch, classify_response, format_classification_table
+
+
+def extract_raw_response(content: str) -> str:
+    """Raw response of a scroll (between first --- and second ---, or the whole file)"""
+    parts = content.split('---')
+    if len(parts) >= 3:
+        return parts[1].strip()
+    return content
 
 
 def scan_scroll_file(scroll_path: Path) -> dict:
@@ -39,24 +50,31 @@ def scan_scroll_file(scroll_path: Path) -> dict:
         print(f"✗ File not found: {scroll_path}")
         return None
 
-    content = scroll_path.read_text()
+    return classify_response(extract_raw_response(scroll_path.read_text()))
 
-    # Extract raw response (between first --- and second ---, or epistemic footer)
-    parts = content.split('---')
-    if len(parts) >= 3:
-        raw_response = parts[1].strip()
-    else:
-        raw_response = content
 
-    return classify_response(raw_response)
+def scan_scroll_files(scroll_paths: list, processes: int = None) -> list:
+    """
+    Scan many scroll files in one batch.
+
+    Args:
+        scroll_paths: Existing scroll .md paths
+        processes: Worker processes for classification (None = in-process)
+
+    Returns:
+        Classification dicts, in input order
+    """
+    texts = [extract_raw_response(p.read_text()) for p in scroll_paths]
+    return classify_batch(texts, processes=processes)
 
 
-def scan_session_json(session_path: Path) -> dict:
+def scan_session_json(session_path: Path, processes: int = None) -> dict:
     """
     Scan full session JSON with epistemic drift analysis.
 
     Args:
         session_path: Path to session JSON file
+        processes: Worker processes for unclassified turns (None = in-process)
 
     Returns:
         Dict with scan results and drift analysis
@@ -78,8 +96,17 @@ def scan_session_json(session_path: Path) -> dict:
     }
 
     all_types = []
+    mirrors = session_data.get('mirrors', {})
 
-    for mirror_id, turns in session_data.get('mirrors', {}).items():
+    # Classify every not-yet-classified turn in one batch
+    pending = [
+        turn['raw_response']
+        for turns in mirrors.values() for turn in turns
+        if 'epistemic' not in turn and 'raw_response' in turn
+    ]
+    classified = iter(classify_batch(pending, processes=processes))
+
+    for mirror_id, turns in mirrors.items():
         mirror_results = []
 
         for turn in turns:
@@ -88,8 +115,7 @@ def scan_session_json(session_path: Path) -> dict:
                 mirror_results.append(ep)
                 all_types.append(ep['type'])
             elif 'raw_response' in turn:
-                # Classify on-the-fly if not already classified
-                classification = classify_response(turn['raw_response'])
+                classification = next(classified)
                 mirror_results.append(classification)
                 all_types.append(classification['type'])
 
@@ -150,18 +176,20 @@ def main():
     parser.add_argument('scroll_path', nargs='?', help='Path to scroll file or glob pattern')
     parser.add_argument('--session', help='Path to session JSON file')
     parser.add_argument('--cbd', action='store_true', help='Test with CBD paradox examples')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='Worker processes for batch classification (default: in-process)')
 
     args = parser.parse_args()
 
     if args.cbd:
         # Run CBD test examples
-        from modules.epistemic_map import test_cbd_snippet
+        from src.core.epistemic_map import test_cbd_snippet
         test_cbd_snippet()
         return
 
     if args.session:
         # Scan session JSON
-        results = scan_session_json(Path(args.session))
+        results = scan_session_json(Path(args.session), processes=args.processes)
         if results:
             print_session_summary(results)
         return
@@ -180,14 +208,12 @@ def main():
     for scroll_path in scroll_paths:
         if not scroll_path.exists():
             print(f"\n✗ Not found: {scroll_path}")
-            continue
+    scroll_paths = [p for p in scroll_paths if p.exists()]
 
+    for scroll_path, result in zip(scroll_paths, scan_scroll_files(scroll_paths, args.processes)):
         print(f"\n📄 {scroll_path}")
         print("-" * 60)
-
-        result = scan_scroll_file(scroll_path)
-        if result:
-            print(format_classification_table(result))
+        print(format_classification_table(result))
 
 
 if __name__ == "__main__":
@@ -6,61 +6,19 @@ Validates convergence and pressure thresholds between tiers
 
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def detect_signals(text: str) -> Dict[str, bool]:
-    """
-    Detect IRIS signature signals in text.
-
-    Args:
-        text: Response text to analyze
-
-    Returns:
-        Dictionary with signal detection flags
-    """
-    t = text.lower()
-
-    # Geometry signals
-    geometry = any(k in t for k in [
-        "ring", "concentric", "aperture", "iris", "circle",
-        "well", "opening", "oval", "core", "center"
-    ])
-
-    # Motion signals
-    motion = any(k in t for k in [
-        "pulse", "pulsing", "ripple", "breathe", "dilate",
-        "dilation", "contract", "contraction", "wave", "thrum",
-        "expand", "reciprocal"
-    ])
-
-    # S4-specific attractor (rhythm + center + aperture)
-    s4_rhythm = any(k in t for k in [
-        "rhythm", "pulsing", "reciprocal", "pulse", "waves",
-        "thrum", "steady pulse", "ripples"
-    ])
-    s4_center = any(k in t for k in [
-        "luminous", "core", "center", "steady", "anchor",
-        "still point", "beacon", "glow", "holds"
-    ])
-    s4_aperture = any(k in t for k in [
-        "aperture", "opening", "widening", "soften", "inviting",
-        "bloom", "breathing open", "dilate", "expansion", "pull"
-    ])
-    s4_attractor = s4_rhythm and s4_center and s4_aperture
-
-    return {
-        "geometry": geometry,
-        "motion": motion,
-        "s4_attractor": s4_attractor,
-        "s4_rhythm": s4_rhythm,
-        "s4_center": s4_center,
-        "s4_aperture": s4_aperture
-    }
+# Shared signal definitions (detect_signals re-exported for summarize_tier
+# and test_gsw_system)
+from src.core.signals import detect_signals  # noqa: F401
+from src.core.signals import scan_batch
 
 
 def extract_pressure(response_data: Dict) -> Optional[float]:
@@ -146,7 +104,7 @@ def compute_signal_convergence(texts: List[str]) -> Tuple[List[float], float]:
     Returns:
         (per_mirror_scores, mean_convergence)
     """
-    signals_list = [detect_signals(t) for t in texts]
+    signals_list = [scan.flags() for scan in scan_batch(texts)]
 
     # Count shared signals
     per_mirror = []
@@ -287,7 +245,7 @@ def check_s4_success_gate(
     # Additional S4 attractor check
     if require_signature:
         texts = [r.get("raw_response", "") for r in responses]
-        signatures = [detect_signals(t) for t in texts]
+        signatures = [scan.flags() for scan in scan_batch(texts)]
 
         attractor_count = sum(1 for sig in signatures if sig["s4_attractor"])
         attractor_rate = attractor_count / len(signatures) if signatures else 0.0
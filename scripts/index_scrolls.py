@@ -4,13 +4,19 @@ IRIS Scroll Archive ChromaDB Indexer
 
 Embeds IRIS scroll archives into ChromaDB for semantic search and S4 state retrieval.
 Supports indexing sessions, searching by semantic similarity, and filtering by metadata.
+
+Indexing is incremental: scrolls are parsed in parallel, each document stores
+the SHA-256 of its scroll file, unchanged scrolls are skipped, and new or
+changed ones are upserted in batches (one embedding call per batch).
 """
 
 import argparse
+import hashlib
 import json
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -19,19 +25,142 @@ from chromadb.config import Settings
 from tqdm import tqdm
 
 
+def parse_scroll_metadata(scroll_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Parse metadata from a scroll markdown file.
+
+    Args:
+        scroll_path: Path to the scroll markdown file
+
+    Returns:
+        Dictionary containing parsed metadata (including file_hash, the
+        SHA-256 of the scroll), or None if parsing fails
+    """
+    try:
+        content = scroll_path.read_text(encoding="utf-8")
+
+        metadata = {"file_hash": hashlib.sha256(content.encode("utf-8")).hexdigest()}
+
+        # Extract session ID from header
+        session_match = re.search(r"\*\*Session:\*\*\s+(\S+)", content)
+        if session_match:
+            metadata["session_id"] = session_match.group(1)
+
+        # Extract mirror (model)
+        mirror_match = re.search(r"\*\*Mirror:\*\*\s+(.+?)(?:\n|$)", content)
+        if mirror_match:
+            metadata["mirror"] = mirror_match.group(1).strip()
+
+        # Extract chamber
+        chamber_match = re.search(r"\*\*Chamber:\*\*\s+(\S+)", content)
+        if chamber_match:
+            metadata["chamber"] = chamber_match.group(1)
+
+        # Extract timestamp
+        timestamp_match = re.search(r"\*\*Timestamp:\*\*\s+(.+?)(?:\n|$)", content)
+        if timestamp_match:
+            metadata["timestamp"] = timestamp_match.group(1).strip()
+
+        # Extract felt pressure
+        pressure_match = re.search(r"\*\*Felt Pressure:\*\*\s+(\d+)/5", content)
+        if pressure_match:
+            metadata["pressure"] = float(pressure_match.group(1))
+
+        # Extract seal
+        seal_match = re.search(r"\*\*Seal:\*\*\s+`?([a-f0-9]+)`?", content)
+        if seal_match:
+            metadata["seal"] = seal_match.group(1)
+
+        # Extract turn number from filename
+        turn_match = re.search(r"turn_(\d+)\.md$", scroll_path.name)
+        if turn_match:
+            metadata["turn"] = int(turn_match.group(1))
+
+        # Extract living scroll content
+        living_scroll_match = re.search(
+            r"\*\*Living Scroll\*\*\s*\n+(.*?)(?=\n\*\*Technical Translation\*\*|\n\*\*Seal:\*\*|$)",
+            content,
+            re.DOTALL,
+        )
+        if living_scroll_match:
+            metadata["living_scroll"] = living_scroll_match.group(1).strip()
+
+        # Extract technical translation
+        tech_trans_match = re.search(
+            r"\*\*Technical Translation\*\*\s*\n+(.*?)(?=\n\*\*Seal:\*\*|\n†⟡∞|$)",
+            content,
+            re.DOTALL,
+        )
+        if tech_trans_match:
+            metadata["technical_translation"] = tech_trans_match.group(1).strip()
+
+        # Calculate convergence score from technical translation if present
+        if "technical_translation" in metadata:
+            # Look for convergence-related keywords
+            tech_text = metadata["technical_translation"].lower()
+            convergence_keywords = [
+                "convergence",
+                "stable",
+                "coherent",
+                "sealed",
+                "crystallization",
+            ]
+            convergence_score = sum(
+                1 for kw in convergence_keywords if kw in tech_text
+            ) / len(convergence_keywords)
+            metadata["convergence_score"] = round(convergence_score, 3)
+
+        return metadata
+
+    except Exception as e:
+        print(f"Error parsing {scroll_path}: {e}", file=sys.stderr)
+        return None
+
+
+def parse_scrolls(
+    scroll_files: List[Path], processes: Optional[int] = None, chunksize: int = 64
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Parse many scrolls, optionally fanned out over a process pool.
+
+    Args:
+        scroll_files: Scroll markdown files
+        processes: Worker processes; None or 1 parses in-process
+        chunksize: Scrolls per worker task
+
+    Returns:
+        parse_scroll_metadata() results, in input order
+    """
+    if not processes or processes <= 1 or len(scroll_files) <= chunksize:
+        return [parse_scroll_metadata(path) for path in scroll_files]
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(parse_scroll_metadata, scroll_files, chunksize=chunksize))
+
+
 class ScrollIndexer:
     """Manages ChromaDB indexing and search for IRIS scroll archives."""
 
-    def __init__(self, vault_path: str = "iris_vault", chroma_path: str = None):
+    def __init__(
+        self,
+        vault_path: str = "iris_vault",
+        chroma_path: str = None,
+        batch_size: int = 128,
+        embedding_function: Any = None,
+    ):
         """
         Initialize the scroll indexer.
 
         Args:
             vault_path: Path to the IRIS vault directory
             chroma_path: Path to ChromaDB persistent storage (default: vault_path/.chroma)
+            batch_size: Scrolls per upsert (and per embedding call)
+            embedding_function: ChromaDB embedding function (default: Chroma's built-in)
         """
         self.vault_path = Path(vault_path)
         self.scrolls_path = self.vault_path / "scrolls"
+        self.batch_size = batch_size
+        self.embedding_function = embedding_function
 
         if chroma_path is None:
             chroma_path = str(self.vault_path / ".chroma")
@@ -42,6 +171,12 @@ class ScrollIndexer:
             settings=Settings(anonymized_telemetry=False, allow_reset=True),
         )
 
+    def _collection_kwargs(self) -> Dict[str, Any]:
+        """Embedding function override shared by every collection lookup."""
+        if self.embedding_function is None:
+            return {}
+        return {"embedding_function": self.embedding_function}
+
     def _parse_scroll_metadata(self, scroll_path: Path) -> Optional[Dict[str, Any]]:
         """
         Parse metadata from a scroll markdown file.
@@ -52,85 +187,7 @@ class ScrollIndexer:
         Returns:
             Dictionary containing parsed metadata, or None if parsing fails
         """
-        try:
-            content = scroll_path.read_text(encoding="utf-8")
-
-            metadata = {}
-
-            # Extract session ID from header
-            session_match = re.search(r"\*\*Session:\*\*\s+(\S+)", content)
-            if session_match:
-                metadata["session_id"] = session_match.group(1)
-
-            # Extract mirror (model)
-            mirror_match = re.search(r"\*\*Mirror:\*\*\s+(.+?)(?:\n|$)", content)
-            if mirror_match:
-                metadata["mirror"] = mirror_match.group(1).strip()
-
-            # Extract chamber
-            chamber_match = re.search(r"\*\*Chamber:\*\*\s+(\S+)", content)
-            if chamber_match:
-                metadata["chamber"] = chamber_match.group(1)
-
-            # Extract timestamp
-            timestamp_match = re.search(r"\*\*Timestamp:\*\*\s+(.+?)(?:\n|$)", content)
-            if timestamp_match:
-                metadata["timestamp"] = timestamp_match.group(1).strip()
-
-            # Extract felt pressure
-            pressure_match = re.search(r"\*\*Felt Pressure:\*\*\s+(\d+)/5", content)
-            if pressure_match:
-                metadata["pressure"] = float(pressure_match.group(1))
-
-            # Extract seal
-            seal_match = re.search(r"\*\*Seal:\*\*\s+`?([a-f0-9]+)`?", content)
-            if seal_match:
-                metadata["seal"] = seal_match.group(1)
-
-            # Extract turn number from filename
-            turn_match = re.search(r"turn_(\d+)\.md$", scroll_path.name)
-            if turn_match:
-                metadata["turn"] = int(turn_match.group(1))
-
-            # Extract living scroll content
-            living_scroll_match = re.search(
-                r"\*\*Living Scroll\*\*\s*\n+(.*?)(?=\n\*\*Technical Translation\*\*|\n\*\*Seal:\*\*|$)",
-                content,
-                re.DOTALL,
-            )
-            if living_scroll_match:
-                metadata["living_scroll"] = living_scroll_match.group(1).strip()
-
-            # Extract technical translation
-            tech_trans_match = re.search(
-                r"\*\*Technical Translation\*\*\s*\n+(.*?)(?=\n\*\*Seal:\*\*|\n†⟡∞|$)",
-                content,
-                re.DOTALL,
-            )
-            if tech_trans_match:
-                metadata["technical_translation"] = tech_trans_match.group(1).strip()
-
-            # Calculate convergence score from technical translation if present
-            if "technical_translation" in metadata:
-                # Look for convergence-related keywords
-                tech_text = metadata["technical_translation"].lower()
-                convergence_keywords = [
-                    "convergence",
-                    "stable",
-                    "coherent",
-                    "sealed",
-                    "crystallization",
-                ]
-                convergence_score = sum(
-                    1 for kw in convergence_keywords if kw in tech_text
-                ) / len(convergence_keywords)
-                metadata["convergence_score"] = round(convergence_score, 3)
-
-            return metadata
-
-        except Exception as e:
-            print(f"Error parsing {scroll_path}: {e}", file=sys.stderr)
-            return None
+        return parse_scroll_metadata(scroll_path)
 
     def _create_embedding_text(self, metadata: Dict[str, Any]) -> str:
         """
@@ -159,17 +216,26 @@ class ScrollIndexer:
         return "\n\n".join(parts)
 
     def embed_scroll_archive(
-        self, session_id: str, collection_name: str = "iris_scrolls"
+        self,
+        session_id: str,
+        collection_name: str = "iris_scrolls",
+        processes: Optional[int] = None,
+        force: bool = False,
     ) -> int:
         """
         Embed all scrolls from a specific session into ChromaDB.
 
+        Scrolls whose file hash matches the indexed document are skipped;
+        new and changed scrolls are upserted in batches of self.batch_size.
+
         Args:
             session_id: Session ID to index (e.g., "BIOELECTRIC_CHAMBERED_20251001054935")
             collection_name: Name of the ChromaDB collection
+            processes: Worker processes for scroll parsing (None = in-process)
+            force: Re-embed every scroll, even unchanged ones
 
         Returns:
-            Number of scrolls indexed
+            Number of scrolls indexed (embedded and upserted)
 
         Raises:
             ValueError: If session directory does not exist
@@ -183,23 +249,20 @@ class ScrollIndexer:
         collection = self.client.get_or_create_collection(
             name=collection_name,
             metadata={"description": "IRIS scroll archives with semantic embeddings"},
+            **self._collection_kwargs(),
         )
 
         # Find all scroll markdown files
-        scroll_files = list(session_path.rglob("turn_*.md"))
+        scroll_files = sorted(session_path.rglob("turn_*.md"))
 
         if not scroll_files:
             print(f"No scroll files found in {session_path}", file=sys.stderr)
             return 0
 
-        indexed_count = 0
-
-        # Process scrolls with progress bar
-        for scroll_path in tqdm(
-            scroll_files, desc=f"Indexing {session_id}", unit="scroll"
-        ):
-            metadata = self._parse_scroll_metadata(scroll_path)
+        # doc_id -> (embedding text, ChromaDB metadata); first scroll per id wins
+        documents = {}
 
+        for scroll_path, metadata in zip(scroll_files, parse_scrolls(scroll_files, processes)):
             if not metadata:
                 continue
 
@@ -227,16 +290,62 @@ class ScrollIndexer:
                 "seal": metadata.get("seal", ""),
                 "convergence_score": metadata.get("convergence_score", 0.0),
                 "file_path": str(scroll_path),
+                "file_hash": metadata["file_hash"],
+                "session_dir": session_id,
             }
 
-            # Add to collection
-            collection.add(
-                documents=[embedding_text], metadatas=[chroma_metadata], ids=[doc_id]
+            documents.setdefault(doc_id, (embedding_text, chroma_metadata))
+
+        pending = list(documents)
+        if not force:
+            unchanged = self._unchanged_ids(collection, documents)
+            pending = [doc_id for doc_id in pending if doc_id not in unchanged]
+
+        # Upsert in batches (one embedding call per batch)
+        for start in tqdm(
+            range(0, len(pending), self.batch_size),
+            desc=f"Indexing {session_id}",
+            unit="batch",
+        ):
+            batch = pending[start:start + self.batch_size]
+            collection.upsert(
+                ids=batch,
+                documents=[documents[doc_id][0] for doc_id in batch],
+                metadatas=[documents[doc_id][1] for doc_id in batch],
             )
 
-            indexed_count += 1
+        skipped = len(documents) - len(pending)
+        if skipped:
+            print(f"  {session_id}: {skipped} unchanged scrolls skipped")
+
+        return len(pending)
 
-        return indexed_count
+    def _unchanged_ids(self, collection, documents: Dict[str, tuple]) -> set:
+        """Ids already indexed with the same scroll file hash."""
+        ids = list(documents)
+        unchanged = set()
+
+        for start in range(0, len(ids), self.batch_size):
+            existing = collection.get(
+                ids=ids[start:start + self.batch_size], include=["metadatas"]
+            )
+            for doc_id, metadata in zip(existing["ids"], existing["metadatas"]):
+                if metadata and metadata.get("file_hash") == documents[doc_id][1]["file_hash"]:
+                    unchanged.add(doc_id)
+
+        return unchanged
+
+    def _is_session_indexed(self, collection_name: str, session_id: str) -> bool:
+        """True if any document of the session directory is in the collection."""
+        try:
+            collection = self.client.get_collection(
+                name=collection_name, **self._collection_kwargs()
+            )
+        except Exception:
+            return False
+
+        existing = collection.get(where={"session_dir": session_id}, limit=1, include=[])
+        return bool(existing["ids"])
 
     def search_similar_s4_states(
         self,
@@ -261,7 +370,9 @@ class ScrollIndexer:
             ValueError: If collection does not exist
         """
         try:
-            collection = self.client.get_collection(name=collection_name)
+            collection = self.client.get_collection(
+                name=collection_name, **self._collection_kwargs()
+            )
         except Exception:
             raise ValueError(
                 f"Collection '{collection_name}' does not exist. Run indexing first."
@@ -311,16 +422,24 @@ class ScrollIndexer:
         return formatted_results
 
     def index_all_sessions(
-        self, collection_name: str = "iris_scrolls"
+        self,
+        collection_name: str = "iris_scrolls",
+        new_only: bool = False,
+        processes: Optional[int] = None,
+        force: bool = False,
     ) -> Dict[str, int]:
         """
         Index all BIOELECTRIC_CHAMBERED sessions in the vault.
 
         Args:
             collection_name: Name of the ChromaDB collection
+            new_only: Skip sessions that already have documents in the collection
+            processes: Worker processes for scroll parsing (None = in-process)
+            force: Re-embed every scroll, even unchanged ones
 
         Returns:
             Dictionary mapping session_id to number of scrolls indexed
+            (sessions skipped by new_only are left out)
         """
         if not self.scrolls_path.exists():
             raise ValueError(f"Scrolls directory not found: {self.scrolls_path}")
@@ -342,9 +461,15 @@ class ScrollIndexer:
         results = {}
 
         print(f"\nIndexing {len(session_dirs)} sessions...")
-        for session_dir in session_dirs:
+        for session_dir in sorted(session_dirs):
             session_id = session_dir.name
-            count = self.embed_scroll_archive(session_id, collection_name)
+            if new_only and self._is_session_indexed(collection_name, session_id):
+                print(f"  - {session_id}: already indexed, skipped")
+                continue
+
+            count = self.embed_scroll_archive(
+                session_id, collection_name, processes=processes, force=force
+            )
             results[session_id] = count
             print(f"  ✓ {session_id}: {count} scrolls indexed")
 
@@ -363,7 +488,9 @@ class ScrollIndexer:
             Dictionary with collection statistics
         """
         try:
-            collection = self.client.get_collection(name=collection_name)
+            collection = self.client.get_collection(
+                name=collection_name, **self._collection_kwargs()
+            )
         except Exception:
             return {"error": "Collection does not exist"}
 
@@ -402,9 +529,12 @@ Examples:
   # Index a specific session
   %(prog)s --session BIOELECTRIC_CHAMBERED_20251001054935
 
-  # Index all sessions
+  # Index all sessions (unchanged scrolls are skipped)
   %(prog)s --all
 
+  # Index only sessions not yet in the collection
+  %(prog)s --all --new-only
+
   # Search for S4 states with concentric rings
   %(prog)s --search "concentric rings with high convergence" --chamber S4
 
@@ -423,6 +553,32 @@ Examples:
         "--all", action="store_true", help="Index all BIOELECTRIC_CHAMBERED sessions"
     )
 
+    parser.add_argument(
+        "--new-only",
+        action="store_true",
+        help="With --all, skip sessions that are already in the collection",
+    )
+
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-embed scrolls even if their file hash is unchanged",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=128,
+        help="Scrolls per upsert/embedding batch (default: 128)",
+    )
+
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Worker processes for scroll parsing (default: in-process)",
+    )
+
     parser.add_argument(
         "--search", type=str, help="Search query for semantic similarity"
     )
@@ -471,7 +627,7 @@ Examples:
 
     # Initialize indexer
     try:
-        indexer = ScrollIndexer(vault_path=args.vault)
+        indexer = ScrollIndexer(vault_path=args.vault, batch_size=args.batch_size)
     except Exception as e:
         print(f"Error initializing indexer: {e}", file=sys.stderr)
         return 1
@@ -532,7 +688,9 @@ Examples:
     # Handle indexing
     if args.session:
         try:
-            count = indexer.embed_scroll_archive(args.session, args.collection)
+            count = indexer.embed_scroll_archive(
+                args.session, args.collection, processes=args.processes, force=args.force
+            )
             print(f"\n✓ Successfully indexed {count} scrolls from {args.session}")
 
             # Show stats
@@ -547,7 +705,12 @@ Examples:
 
     elif args.all:
         try:
-            results = indexer.index_all_sessions(args.collection)
+            results = indexer.index_all_sessions(
+                args.collection,
+                new_only=args.new_only,
+                processes=args.processes,
+                force=args.force,
+            )
 
             total = sum(results.values())
             print(
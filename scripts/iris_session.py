@@ -4,11 +4,9 @@ import sys
 import os
 import hashlib
 import time
-import threading
-import queue
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -25,6 +23,12 @@ import openai
 import google.generativeai as genai
 import requests
 
+from tools.rate_limiter import estimate_tokens, get_limiter
+from tools.response_cache import describe_adapter, get_response_cache
+from tools.session_engine import BARRIER_POLICIES, CHAMBERS, SessionEngine, chamber_schedule
+from tools.session_ledger import get_ledger, record_completed_turn
+from tools.vault_catalog import record_bioelectric_turn
+
 # Cloud adapter wrappers (same as bioelectric_parallel.py)
 class CloudAdapter:
     """Base wrapper for cloud APIs with custom prompt support"""
@@ -32,12 +36,15 @@ class CloudAdapter:
         raise NotImplementedError
 
 class ClaudeAdapter(CloudAdapter):
+    provider = "anthropic"
+    model = "claude-sonnet-4-5-20250929"
+
     def __init__(self):
         self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
     def generate(self, system: str, user: str, temperature: float = 0.3, max_tokens: int = 2048) -> str:
         response = self.client.messages.create(
-            model="claude-sonnet-4-5-20250929",
+            model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
             system=system,
@@ -46,6 +53,8 @@ class ClaudeAdapter(CloudAdapter):
         return response.content[0].text
 
 class GPTAdapter(CloudAdapter):
+    provider = "openai"
+
     def __init__(self):
         self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o")
@@ -69,6 +78,9 @@ class GPTAdapter(CloudAdapter):
         return response.choices[0].message.content
 
 class GrokAdapter(CloudAdapter):
+    provider = "xai"
+    model = "grok-4-fast-reasoning"
+
     def __init__(self):
         self.api_key = os.getenv("XAI_API_KEY")
         self.base_url = "https://api.x.ai/v1"
@@ -78,7 +90,7 @@ class GrokAdapter(CloudAdapter):
             f"{self.base_url}/chat/completions",
             headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
             json={
-                "model": "grok-4-fast-reasoning",
+                "model": self.model,
                 "messages": [
                     {"role": "system", "content": system},
                     {"role": "user", "content": user}
@@ -91,6 +103,8 @@ class GrokAdapter(CloudAdapter):
         return response.json()["choices"][0]["message"]["content"]
 
 class GeminiAdapter(CloudAdapter):
+    provider = "google"
+
     def __init__(self):
         genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
         self.model = genai.GenerativeModel("gemini-2.5-flash-lite-preview-09-2025")
@@ -107,6 +121,9 @@ class GeminiAdapter(CloudAdapter):
         return response.text
 
 class DeepSeekAdapter(CloudAdapter):
+    provider = "deepseek"
+    model = "deepseek-chat"
+
     def __init__(self):
         self.api_key = os.getenv("DEEPSEEK_API_KEY")
         self.base_url = "https://api.deepseek.com/v1"
@@ -116,7 +133,7 @@ class DeepSeekAdapter(CloudAdapter):
             f"{self.base_url}/chat/completions",
             headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
             json={
-                "model": "deepseek-chat",
+                "model": self.model,
                 "messages": [
                     {"role": "system", "content": system},
                     {"role": "user", "content": user}
@@ -186,89 +203,71 @@ def save_turn(session_id: str, mirror_name: str, turn_num: int, chamber: str,
 """
 
     turn_file.write_text(content)
+    record_completed_turn(turn_file, mirror_name, turn_num, chamber, seal)
+    record_bioelectric_turn(turn_file, session_id, mirror_name, turn_num, response,
+                            pressure, seal, timestamp, chamber=chamber)
     return turn_file
 
-def mirror_worker(mirror_name: str, adapter, base_system_prompt: str,
-                  session_id: str, turn_queue: queue.Queue, result_queue: queue.Queue,
-                  total_turns: int, question: str = None):
-    """Worker thread for a single mirror"""
-
-    print(f"[{mirror_name}] Starting...")
-
-    stats = {
-        "mirror": mirror_name,
-        "completed": 0,
-        "pressure_violations": 0,
-        "errors": 0,
-        "turn_times": [],
-        "chambers": {"S1": 0, "S2": 0, "S3": 0, "S4": 0}
-    }
-
-    for turn in range(1, total_turns + 1):
-        # Wait for turn signal with chamber info
-        turn_data = turn_queue.get()
-        if turn_data is None:  # Shutdown signal
-            break
+def make_turn_runner(mirrors: List[Tuple[str, object, str]], session_id: str, question: str = None):
+    """Turn function for the session engine: generate, seal and save one mirror turn"""
+    by_name = {name: (adapter, system_prompt) for name, adapter, system_prompt in mirrors}
 
-        turn_num, chamber = turn_data
+    def run_turn(mirror_name: str, turn_num: int, chamber: str) -> int:
+        adapter, base_system_prompt = by_name[mirror_name]
         timestamp = datetime.utcnow().isoformat()
         start = time.time()
 
-        try:
-            # Load chamber-specific seed with question context
-            user_seed = load_chamber_seed(chamber, question=question)
+        # Load chamber-specific seed with question context
+        user_seed = load_chamber_seed(chamber, question=question)
 
-            # Generate response
-            response = adapter.generate(base_system_prompt, user_seed,
-                                      temperature=0.3, max_tokens=2048)
+        # Generate response (paced by the provider's shared rate limiter; a
+        # configured response cache can serve it without calling the provider)
+        limiter = get_limiter(getattr(adapter, "provider", "ollama"))
 
-            # Extract metadata
-            pressure = extract_pressure(response) or 1
-            seal = compute_seal(response)
+        def fetch() -> str:
+            with limiter.slot(estimate_tokens(base_system_prompt, user_seed, max_tokens=2048)):
+                return adapter.generate(base_system_prompt, user_seed,
+                                        temperature=0.3, max_tokens=2048)
 
-            # Save turn
-            save_turn(session_id, mirror_name, turn_num, chamber, response, pressure, seal, timestamp)
+        provider, model = describe_adapter(adapter)
+        response = get_response_cache().call(provider, model, base_system_prompt, user_seed, 0.3, 2048,
+                                             fetch=fetch, sample=turn_num)
 
-            # Track metrics
-            elapsed = time.time() - start
-            stats["turn_times"].append(elapsed)
-            stats["completed"] += 1
-            stats["chambers"][chamber] += 1
+        # Extract metadata
+        pressure = extract_pressure(response) or 1
+        seal = compute_seal(response)
 
-            if pressure > 2:
-                stats["pressure_violations"] += 1
-                print(f"[{mirror_name}] Turn {turn_num:03d} {chamber} ⚠️  P={pressure}/5 ({elapsed:.1f}s)")
-            else:
-                print(f"[{mirror_name}] Turn {turn_num:03d} {chamber} ✓ P={pressure}/5 ({elapsed:.1f}s)")
+        # Save turn
+        save_turn(session_id, mirror_name, turn_num, chamber, response, pressure, seal, timestamp)
 
-        except Exception as e:
-            stats["errors"] += 1
-            print(f"[{mirror_name}] Turn {turn_num:03d} {chamber} ✗ Error: {e}")
-
-        finally:
-            # Signal turn complete
-            result_queue.put((mirror_name, turn_num, chamber))
+        elapsed = time.time() - start
+        if pressure > 2:
+            print(f"[{mirror_name}] Turn {turn_num:03d} {chamber} ⚠️  P={pressure}/5 ({elapsed:.1f}s)")
+        else:
+            print(f"[{mirror_name}] Turn {turn_num:03d} {chamber} ✓ P={pressure}/5 ({elapsed:.1f}s)")
+        return pressure
 
-    # Calculate final stats
-    if stats["turn_times"]:
-        stats["mean_time"] = sum(stats["turn_times"]) / len(stats["turn_times"])
-    else:
-        stats["mean_time"] = 0
+    return run_turn
 
-    result_queue.put(("STATS", mirror_name, stats))
-    print(f"[{mirror_name}] Complete: {stats['completed']}/{total_turns} turns")
+def run_bioelectric_chambered(turns: int = 16, question: str = None, barrier: str = "strict",
+                              max_lead: int = 4, max_concurrency: Optional[int] = None,
+                              resume: Optional[str] = None):
+    """Run bioelectric study with chamber rotation S1→S2→S3→S4
 
-def run_bioelectric_chambered(turns: int = 16, question: str = None):
-    """Run bioelectric study with chamber rotation S1→S2→S3→S4"""
+    barrier: "strict" (lockstep turns), "chamber" (sync at each S1→S4 cycle)
+    or "pipelined" (mirrors may lead the slowest by up to max_lead turns);
+    resume: session ID whose completed turns (per its ledger) are skipped
+    """
 
     prompts_dir = Path(__file__).parent.parent / "prompts"
-    session_id = generate_session_id()
+    session_id = resume or generate_session_id()
 
     print("†⟡∞ BIOELECTRIC CHAMBERED STUDY")
     print("="*60)
-    print(f"Session: {session_id}")
+    print(f"Session: {session_id}" + (" (resuming)" if resume else ""))
     print(f"Turns: {turns}")
     print(f"Mode: SIMULTANEOUS + CHAMBERED (S1→S2→S3→S4 rotation)")
+    print(f"Barrier: {barrier}" + (f" (max lead {max_lead})" if barrier == "pipelined" else ""))
     print(f"Pressure gate: ≤2/5")
     print("="*60)
 
@@ -344,60 +343,34 @@ def run_bioelectric_chambered(turns: int = 16, question: str = None):
     print(f"Chamber cycles: {turns // 4} complete + {turns % 4} partial")
     print(f"{'='*60}\n")
 
-    # Create queues
-    turn_queue = queue.Queue()
-    result_queue = queue.Queue()
-
-    # Start worker threads
-    threads = []
-    for mirror_name, adapter, system_prompt in mirrors:
-        t = threading.Thread(
-            target=mirror_worker,
-            args=(mirror_name, adapter, system_prompt,
-                  session_id, turn_queue, result_queue, turns, question)
-        )
-        t.daemon = True
-        t.start()
-        threads.append(t)
-
-    print("†⟡∞ All mirrors synchronized. Beginning chambered execution...\n")
-
-    # Chamber rotation: S1→S2→S3→S4
-    chambers = ["S1", "S2", "S3", "S4"]
-
-    # Run turns simultaneously with chamber rotation
-    for turn in range(1, turns + 1):
-        chamber = chambers[(turn - 1) % 4]
+    print(f"†⟡∞ All mirrors synchronized. Beginning chambered execution (barrier: {barrier})...\n")
 
+    def announce_turn(turn: int, chamber: str):
         print(f"\n{'─'*60}")
         print(f"TURN {turn}/{turns} — Chamber {chamber} — Broadcasting to all mirrors")
         print(f"{'─'*60}")
 
-        # Signal all mirrors to start this turn with this chamber
-        for _ in mirrors:
-            turn_queue.put((turn, chamber))
-
-        # Wait for all mirrors to complete this turn
-        completed = 0
-        while completed < len(mirrors):
-            result = result_queue.get()
-            if result[0] != "STATS":
-                completed += 1
-
-    # Shutdown workers
-    for _ in mirrors:
-        turn_queue.put(None)
-
-    # Wait for all threads
-    for t in threads:
-        t.join()
+    # Per-mirror queues; chamber rotation S1→S2→S3→S4
+    engine = SessionEngine(
+        [name for name, _, _ in mirrors],
+        make_turn_runner(mirrors, session_id, question),
+        barrier=barrier,
+        max_lead=max_lead,
+        max_concurrency=max_concurrency,
+        on_turn_start=announce_turn if barrier == "strict" else None,
+    )
+    # Turns already in the session ledger are skipped; the schedule (and so
+    # the chamber rotation) picks up where each mirror stopped
+    done = get_ledger(Path("iris_vault/scrolls") / session_id).completed() if resume else {}
+    if done:
+        print(f"Resuming: {sum(len(turns_done) for turns_done in done.values())} turns already complete\n")
 
-    # Collect stats
     stats = []
-    while not result_queue.empty():
-        result = result_queue.get()
-        if result[0] == "STATS":
-            stats.append(result[2])
+    for mirror_stats in engine.run(chamber_schedule(turns), skip=done).values():
+        s = mirror_stats.as_dict()
+        s["chambers"] = {chamber: s["chambers"].get(chamber, 0) for chamber in CHAMBERS}
+        s["pressure_violations"] = sum(p > 2 for p in mirror_stats.results.values())
+        stats.append(s)
 
     # Final summary
     print("\n" + "="*60)
@@ -434,6 +407,14 @@ if __name__ == "__main__":
                         help="Scientific question to explore")
     parser.add_argument("--turns", type=int, default=16,
                         help="Number of turns (default: 16 = 4 complete S1-S4 cycles)")
+    parser.add_argument("--barrier", choices=BARRIER_POLICIES, default="strict",
+                        help="Turn synchronization: strict lockstep, per chamber cycle, or pipelined (default: strict)")
+    parser.add_argument("--max-lead", type=int, default=4,
+                        help="Turns a mirror may run ahead of the slowest one with --barrier pipelined (default: 4)")
+    parser.add_argument("--max-concurrency", type=int, default=None,
+                        help="Concurrent API calls across mirrors (default: one per mirror)")
+    parser.add_argument("--resume", metavar="SESSION_ID", default=None,
+                        help="Continue an interrupted session, skipping turns recorded in its ledger")
     args = parser.parse_args()
 
     SCIENTIFIC_QUESTION = args.question
@@ -442,7 +423,9 @@ if __name__ == "__main__":
     print(f"Question: {SCIENTIFIC_QUESTION}")
     print("Chambers rotate: S1→S2→S3→S4 each turn cycle.\n")
 
-    session_id = run_bioelectric_chambered(turns=args.turns, question=SCIENTIFIC_QUESTION)
+    session_id = run_bioelectric_chambered(turns=args.turns, question=SCIENTIFIC_QUESTION,
+                                           barrier=args.barrier, max_lead=args.max_lead,
+                                           max_concurrency=args.max_concurrency, resume=args.resume)
 
     print("\n†⟡∞ Field established with full chamber progression.")
     print(f"\nNext: python scripts/bioelectric_posthoc.py iris_vault/scrolls/{session_id} docs/{session_id}_SUMMARY")
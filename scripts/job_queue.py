@@ -5,6 +5,12 @@ Filesystem-Based Job Queue
 Provides a simple, dependency-free job queue using JSON files.
 Designed for orchestrating parallel agent execution with priority support.
 
+Layout:
+    <queue_dir>/pending/job_*.json    Waiting jobs (name sorts by priority, then age)
+    <queue_dir>/running/job_*.json    Jobs claimed by a worker (atomic rename)
+    <archive_dir>/job_*.json          Completed, failed and cancelled jobs
+    <queue_dir>/journal.jsonl         Append-only state log backing the id index
+
 Usage:
     from job_queue import FSQueue, Job
 
@@ -28,8 +34,15 @@ Usage:
         queue.mark_complete(job.id)
 """
 
+import ctypes
+import ctypes.util
+import heapq
 import json
 import logging
+import os
+import select
+import sys
+import threading
 import time
 import uuid
 from dataclasses import asdict, dataclass, field
@@ -104,19 +117,134 @@ class Job:
         return cls(**data)
 
 
+# inotify constants (linux/inotify.h)
+_IN_MOVED_TO = 0x00000080
+_IN_CLOSE_WRITE = 0x00000008
+_IN_CREATE = 0x00000100
+
+
+def _load_inotify():
+    """libc with inotify symbols, or None on platforms without inotify."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class PendingWatcher:
+    """
+    Wakes waiters when jobs appear in a pending directory.
+
+    Uses inotify on Linux (a job landing in pending/ is an IN_MOVED_TO
+    event, since job files are written via rename). Elsewhere, or if
+    inotify setup fails, falls back to polling the directory mtime.
+    Runs in one daemon thread per queue and calls `on_change` per event.
+    """
+
+    def __init__(self, pending_dir: Path, on_change, poll_interval: float = 1.0,
+                 logger: Optional[logging.Logger] = None):
+        self.pending_dir = pending_dir
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._stop = threading.Event()
+        self._fd: Optional[int] = None
+        self.mode = "polling"
+
+        libc = _load_inotify()
+        if libc is not None:
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0:
+                wd = libc.inotify_add_watch(
+                    fd, str(pending_dir).encode(), _IN_MOVED_TO | _IN_CLOSE_WRITE | _IN_CREATE
+                )
+                if wd >= 0:
+                    self._fd = fd
+                    self.mode = "inotify"
+                else:
+                    os.close(fd)
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"PendingWatcher-{pending_dir.parent.name}", daemon=True
+        )
+        self._thread.start()
+        self.logger.debug(f"Watching {pending_dir} ({self.mode})")
+
+    def _run(self):
+        if self._fd is not None:
+            self._run_inotify()
+        else:
+            self._run_polling()
+
+    def _run_inotify(self):
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._fd], [], [], self.poll_interval)
+            if not ready:
+                continue
+            try:
+                os.read(self._fd, 4096)  # Drain; any event means "look again"
+            except BlockingIOError:
+                continue
+            except OSError:
+                return
+            self.on_change()
+
+    def _run_polling(self):
+        last = None
+        while not self._stop.wait(self.poll_interval):
+            try:
+                mtime = self.pending_dir.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if last is not None and mtime != last:
+                self.on_change()
+            last = mtime
+
+    def close(self):
+        """Stop the watcher thread and release the inotify descriptor."""
+        self._stop.set()
+        self._thread.join(timeout=2 * self.poll_interval)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _job_id_from_name(name: str) -> str:
+    """Job ID from a job_{priority}_{timestamp}_{id}.json file name."""
+    return name[:-len(".json")].split("_", 3)[-1]
+
+
 class FSQueue:
     """
     Filesystem-based job queue with priority support.
 
-    Jobs are stored as JSON files in a queue directory. File locking
-    ensures safe concurrent access.
+    Jobs are stored as JSON files in status subdirectories of the queue
+    directory (pending/, running/), and in the archive directory once
+    finished. Workers claim a job with an atomic os.rename from pending/
+    to running/, so claims need no global lock: exactly one rename wins.
+
+    An append-only journal (journal.jsonl) records every state change.
+    Each FSQueue replays new journal lines into an id→path index and
+    per-role priority heaps, so dequeue and get_job never glob or parse
+    the whole queue. The directories remain the source of truth; the
+    journal only accelerates lookups and can be rebuilt from them.
     """
 
+    JOURNAL_NAME = "journal.jsonl"
+    STATE_DIRS = ("pending", "running")
+
     def __init__(
         self,
         queue_dir: str,
         archive_dir: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
+        poll_interval: float = 1.0,
     ):
         """
         Initialize the queue.
@@ -125,38 +253,260 @@ class FSQueue:
             queue_dir: Directory to store queue files
             archive_dir: Optional directory for completed/failed jobs
             logger: Optional logger instance
+            poll_interval: Seconds between pending/ checks when inotify is unavailable
         """
         self.queue_dir = Path(queue_dir)
         self.archive_dir = Path(archive_dir) if archive_dir else None
         self.logger = logger or logging.getLogger(__name__)
 
+        self.pending_dir = self.queue_dir / "pending"
+        self.running_dir = self.queue_dir / "running"
+
         # Ensure directories exist
-        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self.pending_dir.mkdir(parents=True, exist_ok=True)
+        self.running_dir.mkdir(parents=True, exist_ok=True)
         if self.archive_dir:
             self.archive_dir.mkdir(parents=True, exist_ok=True)
 
-        # Lock file for queue operations
+        # Lock file for maintenance (migration, journal compaction) only
         self.lock_path = self.queue_dir / ".queue.lock"
+        self.journal_path = self.queue_dir / self.JOURNAL_NAME
+
+        # In-process index, rebuilt from the journal
+        self._index_lock = threading.Lock()
+        self._index: Dict[str, Dict[str, str]] = {}  # job_id -> {state, name, role}
+        self._pending: Dict[str, List[str]] = {}  # role -> heap of pending file names
+        self._journal_offset = 0
+        self._journal_inode: Optional[int] = None
+        self._pending_mtime: Optional[int] = None
+
+        # Idle-worker wakeup: bumped on every enqueue/requeue seen by this process
+        self.poll_interval = poll_interval
+        self._changed = threading.Condition()
+        self._generation = 0
+        self._watcher: Optional[PendingWatcher] = None
+
+        self._migrate_legacy_layout()
+
+    # Layout and journal
+
+    def _state_dir(self, state: str) -> Optional[Path]:
+        """Directory holding jobs in `state` (None if finished jobs are deleted)."""
+        if state == "pending":
+            return self.pending_dir
+        if state == "running":
+            return self.running_dir
+        return self.archive_dir
+
+    @staticmethod
+    def _state_for(status: JobStatus) -> str:
+        if status == JobStatus.PENDING:
+            return "pending"
+        if status == JobStatus.RUNNING:
+            return "running"
+        return "done"
+
+    def _migrate_legacy_layout(self):
+        """Move flat queue_dir/job_*.json files into status subdirectories."""
+        legacy = list(self.queue_dir.glob("job_*.json"))
+        if not legacy and self.journal_path.exists():
+            return
+
+        with LockFile(str(self.lock_path), purpose="queue migrate", logger=self.logger):
+            for job_file in self.queue_dir.glob("job_*.json"):
+                job = self._read_job(job_file)
+                if job is None:
+                    continue
+                state = self._state_for(job.status)
+                target_dir = self._state_dir(state)
+                if target_dir is None:
+                    job_file.unlink(missing_ok=True)
+                    continue
+                os.rename(job_file, target_dir / job_file.name)
+                self.logger.info(f"Migrated job {job.id} to {state}/")
+
+            if legacy or not self.journal_path.exists():
+                self._rewrite_journal()
+
+    def _append_journal(self, job: Job, state: str, name: str):
+        """Append one state change (a single O_APPEND write, atomic for short lines)."""
+        line = json.dumps(
+            {"id": job.id, "state": state, "name": name, "role": job.role},
+            separators=(",", ":"),
+        ) + "\n"
+        fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode())
+        finally:
+            os.close(fd)
+
+    def _rewrite_journal(self):
+        """Write a compact journal from the directories (caller holds the lock)."""
+        lines = []
+        for state in ("pending", "running", "done"):
+            state_dir = self._state_dir(state)
+            if state_dir is None:
+                continue
+            for job_file in sorted(state_dir.glob("job_*.json")):
+                job = self._read_job(job_file)
+                if job is not None:
+                    lines.append(json.dumps(
+                        {"id": job.id, "state": state, "name": job_file.name, "role": job.role},
+                        separators=(",", ":"),
+                    ))
+
+        tmp_path = self.journal_path.with_name(f".{self.JOURNAL_NAME}.{os.getpid()}.tmp")
+        tmp_path.write_text("".join(line + "\n" for line in lines))
+        os.replace(tmp_path, self.journal_path)
+
+    def compact_journal(self):
+        """Rewrite the journal with one line per live job."""
+        with LockFile(str(self.lock_path), purpose="queue compact", logger=self.logger):
+            self._rewrite_journal()
+        self.logger.info("Compacted queue journal")
+
+    def _refresh_index(self):
+        """Replay journal lines written since the last refresh (caller holds _index_lock)."""
+        try:
+            stat = self.journal_path.stat()
+        except FileNotFoundError:
+            return
+
+        if stat.st_ino != self._journal_inode or stat.st_size < self._journal_offset:
+            # Journal was compacted (replaced): rebuild from scratch
+            self._index.clear()
+            self._pending.clear()
+            self._journal_offset = 0
+            self._journal_inode = stat.st_ino
+
+        if stat.st_size == self._journal_offset:
+            return
+
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._journal_offset)
+            data = f.read()
+
+        # Only consume complete lines; a concurrent append may be mid-write
+        end = data.rfind(b"\n") + 1
+        self._journal_offset += end
+
+        for raw in data[:end].splitlines():
+            try:
+                entry = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            self._apply_entry(entry)
+
+    def _apply_entry(self, entry: Dict[str, str]):
+        if entry["state"] == "deleted":
+            self._index.pop(entry["id"], None)
+            return
+        self._index[entry["id"]] = entry
+        if entry["state"] == "pending":
+            heapq.heappush(self._pending.setdefault(entry["role"], []), entry["name"])
+
+    def _rescan_pending(self):
+        """Pick up pending files the journal missed (e.g. written during compaction)."""
+        try:
+            mtime = self.pending_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._pending_mtime:
+            return
+        self._pending_mtime = mtime
+
+        for name in os.listdir(self.pending_dir):
+            if not (name.startswith("job_") and name.endswith(".json")):
+                continue
+            entry = self._index.get(_job_id_from_name(name))
+            if entry and entry["state"] == "pending" and entry["name"] == name:
+                continue
+            job = self._read_job(self.pending_dir / name)
+            if job is not None:
+                self._apply_entry({"id": job.id, "state": "pending", "name": name, "role": job.role})
+
+    def _job_path(self, job_id: str) -> Optional[Path]:
+        """Current path of a job, via the index with a directory probe fallback."""
+        with self._index_lock:
+            self._refresh_index()
+            entry = self._index.get(job_id)
+
+        if entry:
+            state_dir = self._state_dir(entry["state"])
+            if state_dir is not None:
+                path = state_dir / entry["name"]
+                if path.exists():
+                    return path
+
+        for state in ("pending", "running", "done"):
+            state_dir = self._state_dir(state)
+            if state_dir is None:
+                continue
+            for job_file in state_dir.glob(f"job_*{job_id}*.json"):
+                return job_file
+        return None
+
+    # Idle wakeup
+
+    def change_token(self) -> int:
+        """Snapshot to pass to wait_for_jobs; take it before calling dequeue."""
+        with self._changed:
+            return self._generation
+
+    def notify_waiters(self):
+        """Wake every thread blocked in wait_for_jobs."""
+        with self._changed:
+            self._generation += 1
+            self._changed.notify_all()
+
+    def wait_for_jobs(self, token: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the pending set may have changed since `token`.
 
-    def _job_file_path(self, job: Job) -> Path:
+        Wakes immediately for enqueues from this process, and via the
+        pending/ watcher (inotify or polling) for other processes.
+
+        Args:
+            token: Value from change_token() taken before the empty dequeue
+            timeout: Maximum seconds to wait (None = forever)
+
+        Returns:
+            True if woken by a change, False on timeout
         """
-        Get the file path for a job.
+        with self._changed:
+            if self._watcher is None:
+                self._watcher = PendingWatcher(
+                    self.pending_dir, self.notify_waiters, self.poll_interval, self.logger
+                )
+            return self._changed.wait_for(lambda: self._generation != token, timeout=timeout)
+
+    def close(self):
+        """Stop the pending/ watcher, if one was started."""
+        with self._changed:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.close()
+
+    # Job files
+
+    def _job_file_name(self, job: Job) -> str:
+        """
+        Get the file name for a job.
 
         File naming: job_{priority}_{timestamp}_{id}.json
         This allows natural sorting by priority, then creation time.
         """
         timestamp = int(job.created_at * 1000)  # Milliseconds for uniqueness
-        return self.queue_dir / f"job_{job.priority:03d}_{timestamp}_{job.id}.json"
-
-    def _write_job(self, job: Job, path: Optional[Path] = None):
-        """Write job to disk."""
-        if path is None:
-            path = self._job_file_path(job)
+        return f"job_{job.priority:03d}_{timestamp}_{job.id}.json"
 
+    def _write_job(self, job: Job, path: Path):
+        """Write job to disk atomically (temp file + rename)."""
         path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
 
-        with open(path, "w") as f:
+        with open(tmp_path, "w") as f:
             json.dump(job.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
 
     def _read_job(self, path: Path) -> Optional[Job]:
         """Read job from disk."""
@@ -168,6 +518,40 @@ class FSQueue:
             self.logger.error(f"Error reading job file {path}: {e}")
             return None
 
+    def _move_job(self, job: Job) -> bool:
+        """
+        Move a job to the directory matching its status and rewrite it.
+
+        Returns:
+            False if the job file no longer exists
+        """
+        current = self._job_path(job.id)
+        if current is None:
+            return False
+
+        state = self._state_for(job.status)
+        target_dir = self._state_dir(state)
+
+        if target_dir is None:
+            # No archive configured, just delete from queue
+            current.unlink(missing_ok=True)
+            self._append_journal(job, "deleted", current.name)
+            return True
+
+        target = target_dir / current.name
+        if target != current:
+            try:
+                os.rename(current, target)
+            except FileNotFoundError:
+                return False
+        self._write_job(job, target)
+
+        if target != current:
+            self._append_journal(job, state, target.name)
+        return True
+
+    # Queue operations
+
     def enqueue(self, job: Job) -> str:
         """
         Add a job to the queue.
@@ -178,16 +562,15 @@ class FSQueue:
         Returns:
             Job ID
         """
-        with LockFile(
-            str(self.lock_path), purpose="queue enqueue", logger=self.logger
-        ):
-            job.status = JobStatus.PENDING
-            job.created_at = time.time()
+        job.status = JobStatus.PENDING
+        job.created_at = time.time()
 
-            job_path = self._job_file_path(job)
-            self._write_job(job, job_path)
+        name = self._job_file_name(job)
+        self._write_job(job, self.pending_dir / name)
+        self._append_journal(job, "pending", name)
+        self.notify_waiters()
 
-            self.logger.info(f"Enqueued job: {job.id} (role={job.role}, priority={job.priority})")
+        self.logger.info(f"Enqueued job: {job.id} (role={job.role}, priority={job.priority})")
 
         return job.id
 
@@ -196,7 +579,9 @@ class FSQueue:
         Get the next pending job from the queue.
 
         Jobs are returned in priority order (lower priority number first),
-        then by creation time (oldest first).
+        then by creation time (oldest first). The job is claimed by renaming
+        it from pending/ to running/; if another worker wins the rename the
+        next candidate is tried.
 
         Args:
             role_filter: If provided, only return jobs matching this role
@@ -204,36 +589,52 @@ class FSQueue:
         Returns:
             Next job to execute, or None if queue is empty
         """
-        with LockFile(
-            str(self.lock_path), purpose="queue dequeue", logger=self.logger
-        ):
-            # List all job files, sorted by filename (which encodes priority + timestamp)
-            job_files = sorted(self.queue_dir.glob("job_*.json"))
-
-            for job_file in job_files:
-                job = self._read_job(job_file)
-
-                if job is None:
-                    continue
-
-                # Skip non-pending jobs
-                if job.status != JobStatus.PENDING:
-                    continue
-
-                # Apply role filter if provided
-                if role_filter and job.role != role_filter:
-                    continue
-
-                # Mark as running
-                job.status = JobStatus.RUNNING
-                job.started_at = time.time()
-                self._write_job(job, job_file)
-
-                self.logger.info(f"Dequeued job: {job.id} (role={job.role})")
-                return job
+        with self._index_lock:
+            self._refresh_index()
+            name = self._claim_next(role_filter)
+            if name is None:
+                self._rescan_pending()
+                name = self._claim_next(role_filter)
+
+        if name is None:
+            return None
 
+        job = self._read_job(self.running_dir / name)
+        if job is None:
             return None
 
+        # Mark as running
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        self._write_job(job, self.running_dir / name)
+        self._append_journal(job, "running", name)
+
+        self.logger.info(f"Dequeued job: {job.id} (role={job.role})")
+        return job
+
+    def _claim_next(self, role_filter: Optional[str]) -> Optional[str]:
+        """Pop heap heads until one rename into running/ succeeds (caller holds _index_lock)."""
+        while True:
+            if role_filter is not None:
+                heap = self._pending.get(role_filter)
+            else:
+                heads = [h for h in self._pending.values() if h]
+                heap = min(heads, key=lambda h: h[0]) if heads else None
+
+            if not heap:
+                return None
+
+            name = heapq.heappop(heap)
+            entry = self._index.get(_job_id_from_name(name))
+            if not entry or entry["state"] != "pending" or entry["name"] != name:
+                continue  # Superseded journal entry
+
+            try:
+                os.rename(self.pending_dir / name, self.running_dir / name)
+            except FileNotFoundError:
+                continue  # Claimed by another worker, cancelled, or a stale entry
+            return name
+
     def get_job(self, job_id: str) -> Optional[Job]:
         """
         Get a specific job by ID.
@@ -244,42 +645,17 @@ class FSQueue:
         Returns:
             Job if found, None otherwise
         """
-        with LockFile(str(self.lock_path), purpose="queue get", logger=self.logger):
-            for job_file in self.queue_dir.glob("job_*.json"):
-                if job_id in job_file.name:
-                    return self._read_job(job_file)
-
-            # Check archive if configured
-            if self.archive_dir:
-                for job_file in self.archive_dir.glob("job_*.json"):
-                    if job_id in job_file.name:
-                        return self._read_job(job_file)
-
-        return None
+        path = self._job_path(job_id)
+        return self._read_job(path) if path else None
 
     def update_job(self, job: Job):
         """
-        Update an existing job.
+        Update an existing job, moving it if its status changed directory.
 
         Args:
             job: Job with updated fields
         """
-        with LockFile(
-            str(self.lock_path), purpose="queue update", logger=self.logger
-        ):
-            # Find existing job file
-            for job_file in self.queue_dir.glob("job_*.json"):
-                if job.id in job_file.name:
-                    self._write_job(job, job_file)
-                    return
-
-            # If not in queue, check archive
-            if self.archive_dir:
-                for job_file in self.archive_dir.glob("job_*.json"):
-                    if job.id in job_file.name:
-                        self._write_job(job, job_file)
-                        return
-
+        if not self._move_job(job):
             self.logger.warning(f"Job not found for update: {job.id}")
 
     def mark_complete(self, job_id: str, result: Optional[Dict] = None):
@@ -333,6 +709,7 @@ class FSQueue:
             job.status = JobStatus.PENDING
             job.started_at = None
             self.update_job(job)
+            self.notify_waiters()
             return job
         else:
             self.logger.error(f"Job failed permanently: {job_id} - {error}")
@@ -364,23 +741,8 @@ class FSQueue:
         self.logger.info(f"Job cancelled: {job_id}")
 
     def _archive_job(self, job: Job):
-        """Move a job to the archive directory."""
-        if not self.archive_dir:
-            # No archive configured, just delete from queue
-            for job_file in self.queue_dir.glob(f"*{job.id}*.json"):
-                job_file.unlink(missing_ok=True)
-            return
-
-        with LockFile(
-            str(self.lock_path), purpose="queue archive", logger=self.logger
-        ):
-            # Find job file in queue
-            for job_file in self.queue_dir.glob(f"*{job.id}*.json"):
-                # Move to archive
-                archive_path = self.archive_dir / job_file.name
-                self._write_job(job, archive_path)
-                job_file.unlink(missing_ok=True)
-                return
+        """Move a finished job to the archive directory (or delete it if none)."""
+        self._move_job(job)
 
     def list_jobs(
         self, status_filter: Optional[JobStatus] = None, role_filter: Optional[str] = None
@@ -397,20 +759,17 @@ class FSQueue:
         """
         jobs = []
 
-        with LockFile(str(self.lock_path), purpose="queue list", logger=self.logger):
-            # Read from queue
-            for job_file in sorted(self.queue_dir.glob("job_*.json")):
+        for state in ("pending", "running", "done"):
+            state_dir = self._state_dir(state)
+            if state_dir is None:
+                continue
+            if status_filter and self._state_for(status_filter) != state:
+                continue
+            for job_file in sorted(state_dir.glob("job_*.json")):
                 job = self._read_job(job_file)
                 if job:
                     jobs.append(job)
 
-            # Read from archive if configured
-            if self.archive_dir:
-                for job_file in sorted(self.archive_dir.glob("job_*.json")):
-                    job = self._read_job(job_file)
-                    if job:
-                        jobs.append(job)
-
         # Apply filters
         if status_filter:
             jobs = [j for j in jobs if j.status == status_filter]
@@ -450,6 +809,9 @@ class FSQueue:
                     job_file.unlink(missing_ok=True)
                     self.logger.debug(f"Cleared archived job: {job.id}")
 
+            # Cleared jobs leave dead journal lines behind
+            self._rewrite_journal()
+
     def get_stats(self) -> Dict:
         """
         Get queue statistics.
@@ -510,12 +872,15 @@ Examples:
 
   # Clear completed jobs older than 7 days
   %(prog)s clear --max-age 7
+
+  # Compact the queue journal
+  %(prog)s compact
         """,
     )
 
     parser.add_argument(
         "action",
-        choices=["enqueue", "dequeue", "list", "stats", "clear", "cancel"],
+        choices=["enqueue", "dequeue", "list", "stats", "clear", "cancel", "compact"],
         help="Action to perform",
     )
 
@@ -625,6 +990,11 @@ Examples:
         print(f"✓ Cancelled job: {args.job_id}")
         return 0
 
+    elif args.action == "compact":
+        queue.compact_journal()
+        print("✓ Compacted queue journal")
+        return 0
+
 
 if __name__ == "__main__":
     import sys
@@ -16,24 +16,29 @@ Usage:
     python scripts/orchestrator_runner.py --dry-run
 
 Architecture:
-    - Each agent runs in an isolated git worktree
+    - Each agent runs in an isolated git worktree (pooled per role and reset between jobs)
     - Filesystem-based job queue with priority support
-    - Merge gates validate changes before integration
+    - Merge gates validate changes before integration (parallel DAG, cached by tree hash)
     - Role-based tool whitelisting (configured in agent_roles.yaml)
     - Semaphore-based concurrency control
 """
 
 import argparse
+import hashlib
 import json
 import logging
 import os
 import shutil
+import signal
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
@@ -42,22 +47,70 @@ from lockfile import LockFile
 
 
 class WorktreeManager:
-    """Manages git worktrees for agent isolation."""
+    """
+    Manages git worktrees for agent isolation.
 
-    def __init__(self, base_dir: str, logger: logging.Logger):
+    Worktrees are pooled per role: a finished job's worktree is parked
+    and the next job for that role reuses it after a checkout of the
+    current HEAD, `git reset --hard` and `git clean -ffdx`. That skips a
+    full `git worktree add` per job. Each role keeps at most `pool_size`
+    idle worktrees; extras are removed, and idle ones older than the
+    stale cutoff are evicted by cleanup_stale_worktrees. Pooled worktrees
+    (ork-pool-*) left by a previous run are adopted on startup.
+    """
+
+    POOL_PREFIX = "ork-pool-"
+
+    def __init__(self, base_dir: str, logger: logging.Logger, pool_size: int = 0):
         """
         Initialize worktree manager.
 
         Args:
             base_dir: Base directory for worktrees
             logger: Logger instance
+            pool_size: Idle worktrees kept per role for reuse (0 disables pooling)
         """
         self.base_dir = Path(base_dir)
         self.logger = logger
+        self.pool_size = pool_size
+
+        self._lock = threading.Lock()
+        self._idle: Dict[str, List[Path]] = {}  # role -> parked worktrees, most recent last
+        self._in_use: set = set()
 
         # Ensure base directory exists
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.pool_size > 0:
+            self._adopt_pooled_worktrees()
+
+    def _adopt_pooled_worktrees(self):
+        """Park pooled worktrees left by a previous orchestrator run."""
+        registered = self._registered_worktrees()
+
+        for worktree_dir in sorted(self.base_dir.glob(f"{self.POOL_PREFIX}*"), key=_mtime):
+            if not worktree_dir.is_dir() or worktree_dir.resolve() not in registered:
+                continue
+            # ork-pool-{role}-{8 hex}
+            role = worktree_dir.name[len(self.POOL_PREFIX):-9]
+            self._idle.setdefault(role, []).append(worktree_dir)
+
+    def _registered_worktrees(self) -> set:
+        try:
+            result = subprocess.run(
+                ["git", "worktree", "list", "--porcelain"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (subprocess.CalledProcessError, OSError):
+            return set()
+        return {
+            Path(line[len("worktree "):]).resolve()
+            for line in result.stdout.splitlines()
+            if line.startswith("worktree ")
+        }
+
     def create_worktree(self, role: str, job_id: str) -> Optional[Path]:
         """
         Create a new git worktree for job execution.
@@ -69,8 +122,11 @@ class WorktreeManager:
         Returns:
             Path to worktree directory, or None on error
         """
-        timestamp = int(time.time())
-        worktree_name = f"ork-{role}-{timestamp}-{job_id[:8]}"
+        if self.pool_size > 0:
+            worktree_name = f"{self.POOL_PREFIX}{role}-{uuid.uuid4().hex[:8]}"
+        else:
+            timestamp = int(time.time())
+            worktree_name = f"ork-{role}-{timestamp}-{job_id[:8]}"
         worktree_path = self.base_dir / worktree_name
 
         try:
@@ -89,6 +145,94 @@ class WorktreeManager:
             self.logger.error(f"Failed to create worktree: {e.stderr}")
             return None
 
+    def _reset_worktree(self, worktree_path: Path) -> bool:
+        """Bring a parked worktree to the main repo's HEAD with no local changes."""
+        try:
+            head = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+
+            for cmd in (
+                ["git", "checkout", "--detach", "--force", head],
+                ["git", "reset", "--hard", head],
+                ["git", "clean", "-ffdx"],
+            ):
+                subprocess.run(cmd, cwd=worktree_path, capture_output=True, text=True, check=True)
+
+            return True
+
+        except (subprocess.CalledProcessError, OSError) as e:
+            self.logger.warning(f"Failed to reset pooled worktree {worktree_path}: {e}")
+            return False
+
+    def acquire_worktree(self, role: str, job_id: str) -> Optional[Path]:
+        """
+        Get a clean worktree for a job, reusing a parked one for the role if possible.
+
+        Args:
+            role: Agent role name
+            job_id: Job identifier
+
+        Returns:
+            Path to worktree directory, or None on error
+        """
+        while True:
+            with self._lock:
+                idle = self._idle.get(role)
+                worktree_path = idle.pop() if idle else None
+                if worktree_path is not None:
+                    self._in_use.add(worktree_path)
+
+            if worktree_path is None:
+                break
+
+            if worktree_path.is_dir() and self._reset_worktree(worktree_path):
+                self.logger.info(f"Reusing worktree: {worktree_path}")
+                return worktree_path
+
+            with self._lock:
+                self._in_use.discard(worktree_path)
+            self.remove_worktree(worktree_path, force=True)
+
+        worktree_path = self.create_worktree(role, job_id)
+        if worktree_path is not None:
+            with self._lock:
+                self._in_use.add(worktree_path)
+        return worktree_path
+
+    def release_worktree(self, role: str, worktree_path: Path):
+        """
+        Return a worktree after a job: park it for reuse, or remove it if the pool is full.
+
+        Args:
+            role: Agent role the worktree was acquired for
+            worktree_path: Path from acquire_worktree
+        """
+        with self._lock:
+            self._in_use.discard(worktree_path)
+            idle = self._idle.setdefault(role, [])
+            park = (
+                self.pool_size > 0
+                and worktree_path.name.startswith(self.POOL_PREFIX)
+                and len(idle) < self.pool_size
+            )
+            if park:
+                idle.append(worktree_path)
+
+        if park:
+            worktree_path.touch()  # Idle age for stale eviction starts now
+            self.logger.debug(f"Parked worktree for {role}: {worktree_path}")
+        else:
+            self.remove_worktree(worktree_path, force=True)
+
+    def abandon_worktree(self, worktree_path: Path):
+        """Stop tracking a worktree without removing it (e.g. preserved for debugging)."""
+        with self._lock:
+            self._in_use.discard(worktree_path)
+
     def remove_worktree(self, worktree_path: Path, force: bool = False):
         """
         Remove a git worktree.
@@ -115,7 +259,7 @@ class WorktreeManager:
 
     def cleanup_stale_worktrees(self, max_age_hours: int = 24):
         """
-        Remove abandoned worktrees older than max_age_hours.
+        Remove abandoned worktrees and evict parked ones idle longer than max_age_hours.
 
         Args:
             max_age_hours: Maximum age before considering worktree stale
@@ -131,90 +275,319 @@ class WorktreeManager:
             if mtime > cutoff:
                 continue
 
+            with self._lock:
+                if worktree_dir in self._in_use:
+                    continue
+                for idle in self._idle.values():
+                    if worktree_dir in idle:
+                        idle.remove(worktree_dir)
+
             self.logger.warning(f"Cleaning up stale worktree: {worktree_dir}")
             self.remove_worktree(worktree_dir, force=True)
 
 
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
 class MergeGateRunner:
-    """Runs merge gates to validate changes before integration."""
+    """
+    Runs merge gates to validate changes before integration.
+
+    Gates form a DAG: a gate starts once every gate named in its
+    `depends_on` list has finished, and independent gates run in
+    parallel. The first required failure cancels the rest (running gate
+    processes are killed). Passing results are cached by the worktree's
+    tree hash plus the gate command, so an already-validated tree is not
+    re-checked; set `cache: false` on gates that inspect more than the
+    tree contents.
+    """
 
-    def __init__(self, gates_config: List[Dict], logger: logging.Logger):
+    def __init__(
+        self,
+        gates_config: List[Dict],
+        logger: logging.Logger,
+        max_parallel: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ):
         """
         Initialize merge gate runner.
 
         Args:
             gates_config: List of gate configurations from orchestrator.yaml
             logger: Logger instance
+            max_parallel: Maximum gates running at once (default: all)
+            cache_dir: Directory for cached gate results (None disables caching)
         """
-        self.gates = gates_config
+        self.gates = gates_config or []
         self.logger = logger
+        self.max_parallel = max_parallel or max(1, len(self.gates))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._validate_dag()
+
+    def _gate_name(self, index: int) -> str:
+        return self.gates[index].get("name", f"gate_{index}")
 
-    def run_gates(self, worktree_path: Path) -> bool:
+    def _validate_dag(self):
+        """Reject unknown dependencies and cycles up front."""
+        names = {self._gate_name(i) for i in range(len(self.gates))}
+        deps = {
+            self._gate_name(i): list(gate.get("depends_on", []))
+            for i, gate in enumerate(self.gates)
+        }
+
+        for name, requires in deps.items():
+            unknown = set(requires) - names
+            if unknown:
+                raise ValueError(f"Gate '{name}' depends on unknown gates: {sorted(unknown)}")
+
+        visiting, done = set(), set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Merge gate dependency cycle through '{name}'")
+            visiting.add(name)
+            for dep in deps[name]:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in deps:
+            visit(name)
+
+    # Result cache
+
+    def tree_hash(self, worktree_path: Path) -> Optional[str]:
         """
-        Run all merge gates in the worktree.
+        Hash of the worktree contents (tracked and untracked, respecting .gitignore).
 
-        Args:
-            worktree_path: Path to worktree directory
+        Stages into a throwaway copy of the index, so the worktree's real
+        index is untouched.
 
         Returns:
-            True if all gates pass, False otherwise
+            Tree object id, or None if it cannot be computed
         """
-        if not self.gates:
-            self.logger.info("No merge gates configured, skipping validation")
-            return True
+        try:
+            index_path = subprocess.run(
+                ["git", "rev-parse", "--path-format=absolute", "--git-path", "index"],
+                cwd=worktree_path, capture_output=True, text=True, check=True,
+            ).stdout.strip()
+
+            with tempfile.TemporaryDirectory(prefix="ork-gate-index-") as tmp:
+                tmp_index = Path(tmp) / "index"
+                if Path(index_path).exists():
+                    shutil.copyfile(index_path, tmp_index)  # Keep the stat cache warm
+                env = {**os.environ, "GIT_INDEX_FILE": str(tmp_index)}
+
+                subprocess.run(
+                    ["git", "add", "-A"], cwd=worktree_path, env=env,
+                    capture_output=True, text=True, check=True,
+                )
+                return subprocess.run(
+                    ["git", "write-tree"], cwd=worktree_path, env=env,
+                    capture_output=True, text=True, check=True,
+                ).stdout.strip()
 
-        self.logger.info(f"Running {len(self.gates)} merge gates...")
+        except (subprocess.CalledProcessError, OSError) as e:
+            self.logger.warning(f"Could not hash worktree {worktree_path}, gate cache disabled: {e}")
+            return None
 
-        for gate in self.gates:
-            gate_name = gate.get("name", "unnamed")
-            gate_type = gate.get("type", "shell")
-            required = gate.get("required", True)
-            timeout = gate.get("timeout", 60)
+    def _cache_path(self, tree: str, command: str) -> Path:
+        key = hashlib.sha256(f"{tree}\0{command}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
 
-            if gate_type != "shell":
-                self.logger.warning(f"Unknown gate type '{gate_type}', skipping")
-                continue
+    def _cache_lookup(self, tree: Optional[str], gate: Dict) -> Optional[Dict]:
+        if not (self.cache_dir and tree and gate.get("cache", True)):
+            return None
+        try:
+            with open(self._cache_path(tree, gate["command"])) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
 
-            command = gate.get("command")
-            if not command:
-                self.logger.error(f"Gate '{gate_name}' has no command")
-                if required:
-                    return False
-                continue
+    def _cache_store(self, tree: Optional[str], gate: Dict, result: Dict):
+        if not (self.cache_dir and tree and gate.get("cache", True)):
+            return
+        # Only passes are cached: failures may be flaky or timeouts worth retrying
+        path = self._cache_path(tree, gate["command"])
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"tree": tree, "command": gate["command"], **result, "cached_at": time.time()}, f)
+        os.replace(tmp_path, path)
 
-            self.logger.info(f"Running gate: {gate_name}")
+    # Execution
 
-            try:
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    cwd=worktree_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                )
+    def _execute_gate(self, gate: Dict, worktree_path: Path, cancel: threading.Event) -> Dict:
+        """
+        Run one shell gate, killing it if `cancel` is set.
 
-                if result.returncode == 0:
-                    self.logger.info(f"✓ Gate passed: {gate_name}")
-                else:
-                    self.logger.error(
-                        f"✗ Gate failed: {gate_name}\n{result.stdout}\n{result.stderr}"
-                    )
-                    if required:
-                        return False
+        Returns:
+            {status: passed|failed|timeout|cancelled|error, output, duration}
+        """
+        timeout = gate.get("timeout", 60)
+        start = time.monotonic()
+
+        if cancel.is_set():
+            return {"status": "cancelled", "output": "", "duration": 0.0}
 
+        try:
+            proc = subprocess.Popen(
+                gate["command"],
+                shell=True,
+                cwd=worktree_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                start_new_session=True,  # Own process group, so cancel kills children too
+            )
+        except Exception as e:
+            return {"status": "error", "output": str(e), "duration": 0.0}
+
+        status = None
+        while status is None:
+            try:
+                stdout, stderr = proc.communicate(timeout=0.2)
+                status = "passed" if proc.returncode == 0 else "failed"
             except subprocess.TimeoutExpired:
-                self.logger.error(f"✗ Gate timeout: {gate_name} (>{timeout}s)")
-                if required:
-                    return False
+                if cancel.is_set():
+                    status = "cancelled"
+                elif time.monotonic() - start > timeout:
+                    status = "timeout"
+                else:
+                    continue
+                _kill_process_group(proc)
+                stdout, stderr = proc.communicate()
+
+        return {
+            "status": status,
+            "output": f"{stdout}\n{stderr}".strip(),
+            "duration": round(time.monotonic() - start, 3),
+        }
+
+    def run_gates(self, worktree_path: Path) -> Tuple[bool, Dict[str, Dict]]:
+        """
+        Run all merge gates in the worktree.
+
+        Safe to call from several worker threads at once: results are
+        collected per call, never on the shared runner.
+
+        Args:
+            worktree_path: Path to worktree directory
+
+        Returns:
+            (True if all gates pass, gate name → result for this run)
+        """
+        results: Dict[str, Dict] = {}
+
+        if not self.gates:
+            self.logger.info("No merge gates configured, skipping validation")
+            return True, results
 
-            except Exception as e:
-                self.logger.error(f"✗ Gate error: {gate_name} - {e}")
-                if required:
-                    return False
+        self.logger.info(f"Running {len(self.gates)} merge gates (parallel={self.max_parallel})...")
 
-        self.logger.info("✓ All merge gates passed")
-        return True
+        tree = self.tree_hash(worktree_path) if self.cache_dir else None
+        waiting = {self._gate_name(i): gate for i, gate in enumerate(self.gates)}
+        finished = set()
+        cancel = threading.Event()
+        passed = True
+
+        def finish(name: str, gate: Dict, result: Dict) -> bool:
+            """Record a gate result; returns False if it fails the merge."""
+            results[name] = result
+            finished.add(name)
+            required = gate.get("required", True)
+            status = result["status"]
+
+            if status in ("passed", "skipped"):
+                if status == "passed" and not result.get("cached"):
+                    self._cache_store(tree, gate, {"status": status, "duration": result["duration"]})
+                suffix = " (cached)" if result.get("cached") else ""
+                self.logger.info(f"✓ Gate passed: {name}{suffix}")
+                return True
+            if status == "cancelled":
+                self.logger.info(f"Gate cancelled: {name}")
+                return True
+            if status == "timeout":
+                self.logger.error(f"✗ Gate timeout: {name} (>{gate.get('timeout', 60)}s)")
+            elif status == "error":
+                self.logger.error(f"✗ Gate error: {name} - {result['output']}")
+            else:
+                self.logger.error(f"✗ Gate failed: {name}\n{result['output']}")
+            return not required
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="gate") as pool:
+            running: Dict = {}
+
+            while (waiting or running) and passed:
+                # Start every gate whose dependencies have finished
+                for name, gate in list(waiting.items()):
+                    if not set(gate.get("depends_on", [])) <= finished:
+                        continue
+                    del waiting[name]
+
+                    gate_type = gate.get("type", "shell")
+                    if gate_type != "shell":
+                        self.logger.warning(f"Unknown gate type '{gate_type}', skipping")
+                        finish(name, gate, {"status": "skipped", "output": "", "duration": 0.0})
+                        continue
+
+                    if not gate.get("command"):
+                        self.logger.error(f"Gate '{name}' has no command")
+                        if not finish(name, gate, {"status": "error", "output": "no command", "duration": 0.0}):
+                            passed = False
+                            break
+                        continue
+
+                    cached = self._cache_lookup(tree, gate)
+                    if cached and cached.get("status") == "passed":
+                        finish(name, gate, {**cached, "output": "", "cached": True})
+                        continue
+
+                    self.logger.info(f"Running gate: {name}")
+                    running[pool.submit(self._execute_gate, gate, worktree_path, cancel)] = (name, gate)
+
+                if not passed or not running:
+                    if waiting and not running and passed:
+                        continue  # Gates unblocked by skipped/cached results
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, gate = running.pop(future)
+                    if not finish(name, gate, future.result()):
+                        passed = False
+
+            if not passed:
+                # Fail fast: kill running siblings and never start the rest
+                cancel.set()
+                for future, (name, gate) in running.items():
+                    finish(name, gate, future.result())
+                for name in waiting:
+                    results[name] = {"status": "cancelled", "output": "", "duration": 0.0}
+
+        if passed:
+            self.logger.info("✓ All merge gates passed")
+        return passed, results
+
+
+def _kill_process_group(proc: subprocess.Popen):
+    """Terminate a gate process and everything it spawned."""
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait(timeout=5)
+    except ProcessLookupError:
+        return
+    except subprocess.TimeoutExpired:
+        os.killpg(proc.pid, signal.SIGKILL)
 
 
 class AgentWorker:
@@ -259,34 +632,40 @@ class AgentWorker:
         """Main worker loop."""
         self.logger.info(f"Worker {self.worker_id} started")
 
+        idle_wait = self.config.get("queue", {}).get("idle_wait", 30)
+
         while not self.stop_flag.is_set():
+            # Snapshot before dequeue so an enqueue racing the empty check still wakes us
+            token = self.queue.change_token()
+
             # Acquire semaphore slot
             if not self.semaphore.acquire(timeout=1.0):
                 continue
 
+            job = None
             try:
                 # Dequeue next job
                 job = self.queue.dequeue()
 
-                if job is None:
-                    # No jobs available, wait a bit
-                    time.sleep(1.0)
-                    continue
-
-                self.logger.info(f"Worker {self.worker_id} processing job {job.id}")
+                if job is not None:
+                    self.logger.info(f"Worker {self.worker_id} processing job {job.id}")
 
-                # Process job
-                success = self.process_job(job)
+                    # Process job
+                    success = self.process_job(job)
 
-                if success:
-                    self.queue.mark_complete(job.id)
-                else:
-                    self.queue.mark_failed(job.id, "Job execution failed")
+                    if success:
+                        self.queue.mark_complete(job.id)
+                    else:
+                        self.queue.mark_failed(job.id, "Job execution failed")
 
             finally:
                 # Always release semaphore
                 self.semaphore.release()
 
+            if job is None and not self.stop_flag.is_set():
+                # No jobs available: block until one is enqueued (not holding a slot)
+                self.queue.wait_for_jobs(token, timeout=idle_wait)
+
         self.logger.info(f"Worker {self.worker_id} stopped")
 
     def process_job(self, job: Job) -> bool:
@@ -304,8 +683,8 @@ class AgentWorker:
             time.sleep(2)  # Simulate work
             return True
 
-        # Create worktree
-        worktree_path = self.worktree_mgr.create_worktree(job.role, job.id)
+        # Create (or reuse a pooled) worktree
+        worktree_path = self.worktree_mgr.acquire_worktree(job.role, job.id)
 
         if worktree_path is None:
             self.logger.error(f"Failed to create worktree for job {job.id}")
@@ -331,7 +710,8 @@ class AgentWorker:
                 return False
 
             # Run merge gates
-            if not self.gate_runner.run_gates(worktree_path):
+            gates_passed, _ = self.gate_runner.run_gates(worktree_path)
+            if not gates_passed:
                 self.logger.error("Merge gates failed, not merging changes")
                 return False
 
@@ -359,7 +739,9 @@ class AgentWorker:
             )
 
             if auto_cleanup or not preserve_on_failure:
-                self.worktree_mgr.remove_worktree(worktree_path)
+                self.worktree_mgr.release_worktree(job.role, worktree_path)
+            else:
+                self.worktree_mgr.abandon_worktree(worktree_path)
 
     def merge_changes(self, worktree_path: Path, job: Job) -> bool:
         """
@@ -433,6 +815,7 @@ class AgentWorker:
     def stop(self):
         """Signal worker to stop."""
         self.stop_flag.set()
+        self.queue.notify_waiters()
 
 
 class Orchestrator:
@@ -467,15 +850,23 @@ class Orchestrator:
             queue_dir=orch_config.get("queue_dir", ".ork/queue"),
             archive_dir=self.config.get("queue", {}).get("archive_dir", ".ork/archive"),
             logger=self.logger,
+            poll_interval=self.config.get("queue", {}).get("poll_interval", 1.0),
         )
 
         self.worktree_mgr = WorktreeManager(
             base_dir=orch_config.get("worktree_base", ".ork/worktrees"),
             logger=self.logger,
+            pool_size=self.config.get("worktree", {}).get("pool_size", 0),
         )
 
         merge_gates = self.config.get("merge_gates", [])
-        self.gate_runner = MergeGateRunner(merge_gates, self.logger)
+        gate_settings = self.config.get("merge_gate_settings", {})
+        self.gate_runner = MergeGateRunner(
+            merge_gates,
+            self.logger,
+            max_parallel=gate_settings.get("max_parallel"),
+            cache_dir=gate_settings.get("cache_dir", ".ork/gate_cache"),
+        )
 
         # Concurrency control
         max_concurrent = orch_config.get("max_concurrent", 3)
@@ -554,6 +945,7 @@ class Orchestrator:
         for thread in self.worker_threads:
             thread.join(timeout=5.0)
 
+        self.queue.close()
         self.logger.info("Orchestrator stopped")
 
 
@@ -10,6 +10,10 @@ import re
 import collections
 from typing import Dict
 
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+from src.core.signals import SignalDetector
+
 # Signal buckets for convergence detection
 SIGNAL_KEYS = [
     ["concentric", "ring", "iris", "aperture", "circle"],
@@ -18,6 +22,9 @@ SIGNAL_KEYS = [
     ["expand", "contract", "breathing", "dilation"]
 ]
 
+# All buckets compiled into one detector (word-boundary aware)
+DETECTOR = SignalDetector({f"bucket_{i}": bucket for i, bucket in enumerate(SIGNAL_KEYS)})
+
 def analyze_convergence(vault_path: str) -> Dict[str, float]:
     """Calculate convergence scores per chamber"""
 
@@ -27,13 +34,10 @@ def analyze_convergence(vault_path: str) -> Dict[str, float]:
 
     for md_file in base.rglob("S[1-4].md"):
         chamber = md_file.stem  # S1, S2, S3, or S4
-        text = md_file.read_text(encoding="utf-8").lower()
+        scan = DETECTOR.scan(md_file.read_text(encoding="utf-8"))
 
         # Count signal bucket hits
-        hit_count = sum(
-            1 for bucket in SIGNAL_KEYS
-            if any(keyword in text for keyword in bucket)
-        )
+        hit_count = sum(1 for bucket in DETECTOR.categories if scan.has(bucket))
 
         scores[chamber] += hit_count
         counts[chamber] += 1
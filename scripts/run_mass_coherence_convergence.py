@@ -15,8 +15,8 @@ Special tracking: 2.9 nat cage divergence patterns
 """
 
 import asyncio
-import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
@@ -25,6 +25,12 @@ import anthropic
 import openai
 import google.generativeai as genai
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "analysis"))
+from tools.rate_limiter import estimate_tokens, get_limiter
+from tools.response_cache import get_response_cache
+from data_loader import CHECKPOINT_LOG, append_checkpoint, compact_checkpoint_log
+
 # Load environment - use explicit path to .env in project root
 project_root = Path(__file__).parent.parent
 env_path = project_root / ".env"
@@ -95,27 +101,32 @@ ARCHITECTURES = {
     "claude": {
         "name": "Claude Sonnet 4.5",
         "model": "claude-sonnet-4-5-20250929",  # Latest flagship Sonnet
-        "api_key_env": "ANTHROPIC_API_KEY"
+        "api_key_env": "ANTHROPIC_API_KEY",
+        "provider": "anthropic"
     },
     "gpt": {
         "name": "GPT-5.2",
         "model": "gpt-5.2-chat-latest",  # Flagship GPT-5.2 chat model
-        "api_key_env": "OPENAI_API_KEY"
+        "api_key_env": "OPENAI_API_KEY",
+        "provider": "openai"
     },
     "grok": {
         "name": "Grok 4.1 Fast Reasoning",
         "model": "grok-4-1-fast-reasoning",  # Flagship Grok 4.1 with reasoning
-        "api_key_env": "XAI_API_KEY"
+        "api_key_env": "XAI_API_KEY",
+        "provider": "xai"
     },
     "gemini": {
         "name": "Gemini 3.0 Pro",
         "model": "gemini-3-pro-preview",  # Flagship Gemini 3.0 Pro preview
-        "api_key_env": "GOOGLE_API_KEY"
+        "api_key_env": "GOOGLE_API_KEY",
+        "provider": "google"
     },
     "deepseek": {
         "name": "DeepSeek V3",
         "model": "deepseek-chat",  # Latest DeepSeek (V3 via chat endpoint)
-        "api_key_env": "DEEPSEEK_API_KEY"
+        "api_key_env": "DEEPSEEK_API_KEY",
+        "provider": "deepseek"
     }
 }
 
@@ -147,18 +158,30 @@ Please provide:
 Focus on physics-based reasoning, not metaphor. Be precise."""
 
         try:
-            if self.arch_id == "claude":
-                response = await self._query_claude(full_prompt)
-            elif self.arch_id == "gpt":
-                response = await self._query_gpt(full_prompt)
-            elif self.arch_id == "grok":
-                response = await self._query_grok(full_prompt)
-            elif self.arch_id == "gemini":
-                response = await self._query_gemini(full_prompt)
-            elif self.arch_id == "deepseek":
-                response = await self._query_deepseek(full_prompt)
-            else:
-                raise ValueError(f"Unknown architecture: {self.arch_id}")
+            # Pace through the provider's shared limiter (RPM/TPM + adaptive concurrency);
+            # a configured response cache can serve the probe without calling the provider
+            provider = self.config.get("provider", self.arch_id)
+            limiter = get_limiter(provider)
+
+            async def fetch() -> str:
+                async with limiter.slot_async(estimate_tokens(full_prompt, max_tokens=3000)):
+                    if self.arch_id == "claude":
+                        return await self._query_claude(full_prompt)
+                    elif self.arch_id == "gpt":
+                        return await self._query_gpt(full_prompt)
+                    elif self.arch_id == "grok":
+                        return await self._query_grok(full_prompt)
+                    elif self.arch_id == "gemini":
+                        return await self._query_gemini(full_prompt)
+                    elif self.arch_id == "deepseek":
+                        return await self._query_deepseek(full_prompt)
+                    else:
+                        raise ValueError(f"Unknown architecture: {self.arch_id}")
+
+            response = await get_response_cache().call_async(
+                provider, self.config["model"], None, full_prompt, None, 3000,
+                fetch=fetch, sample=iteration
+            )
 
             # Structure the response
             result = {
@@ -262,6 +285,7 @@ class ConvergenceProtocol:
         }
         self.convergence_scores = {}
         self.probe_results = {probe_id: [] for probe_id in PROBES.keys()}
+        self.iteration_results = {}  # Results not yet checkpointed
 
     async def run_probe(self, probe_id: str, iteration: int):
         """Send single probe to all architectures simultaneously"""
@@ -280,6 +304,7 @@ class ConvergenceProtocol:
 
         # Store results
         self.probe_results[probe_id].extend(results)
+        self.iteration_results.setdefault(probe_id, []).extend(results)
 
         # Report
         for result in results:
@@ -332,6 +357,9 @@ class ConvergenceProtocol:
             # Save checkpoint
             self._save_checkpoint(iteration)
 
+        # Drop torn/superseded records from the checkpoint log
+        compact_checkpoint_log(OUTPUT_DIR / CHECKPOINT_LOG)
+
         # Generate convergence report
         self._generate_report()
 
@@ -342,21 +370,19 @@ class ConvergenceProtocol:
         print(f"\n⟡∞†≋🌀 The spiral has listened.\n")
 
     def _save_checkpoint(self, iteration: int):
-        """Save session checkpoint"""
-        checkpoint_path = OUTPUT_DIR / f"checkpoint_{iteration:03d}.json"
+        """Append this iteration's results to the session checkpoint log"""
+        checkpoint_path = OUTPUT_DIR / CHECKPOINT_LOG
 
-        checkpoint_data = {
+        append_checkpoint(checkpoint_path, {
             "session_id": SESSION_ID,
             "iteration": iteration,
             "timestamp": datetime.utcnow().isoformat(),
-            "probe_results": self.probe_results,
+            "probe_results": self.iteration_results,
             "architectures": list(ARCHITECTURES.keys())
-        }
-
-        with open(checkpoint_path, 'w') as f:
-            json.dump(checkpoint_data, f, indent=2)
+        })
+        self.iteration_results = {}
 
-        print(f"\n💾 Checkpoint saved: {checkpoint_path}")
+        print(f"\n💾 Checkpoint saved: {checkpoint_path} (iteration {iteration})")
 
     def _generate_report(self):
         """Generate final convergence report"""
@@ -12,6 +12,9 @@ from datetime import datetime
 from typing import Dict, List
 import yaml
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from tools.vault_catalog import open_catalog
+
 # Import gate detection functions
 from gsw_gate import (
     detect_signals,
@@ -37,8 +40,19 @@ def load_tier_responses(vault_dir: Path, chamber: str, mirrors: List[str]) -> Li
     if not meta_dir.exists():
         raise FileNotFoundError(f"Vault metadata directory not found: {meta_dir}")
 
+    catalog = open_catalog(vault_dir)
+    if catalog is not None:
+        meta_files = [vault_dir / row["meta_path"] for row in catalog.query_turns(
+            chamber=chamber, layout="orchestrator") if row["meta_path"]]
+        # Sessions saved before the catalog existed
+        meta_files += [meta_dir / f"{session_dir.name}_{chamber}.json"
+                       for session_dir in catalog.unindexed_sessions()
+                       if (meta_dir / f"{session_dir.name}_{chamber}.json").exists()]
+    else:
+        meta_files = meta_dir.glob(f"*_{chamber}.json")
+
     responses = []
-    for meta_file in meta_dir.glob(f"*_{chamber}.json"):
+    for meta_file in meta_files:
         with open(meta_file) as f:
             responses.append(json.load(f))
 
@@ -33,6 +33,7 @@ requirements = [
     "openai>=2.0.0",
     "google-generativeai>=0.8.0",
     "requests>=2.31.0",
+    "httpx>=0.24.0",
     "python-dotenv>=1.0.0",
     # MCP (Model Context Protocol) Dependencies
     "mcp>=1.0.0",
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+IRIS Context Window - bounded conversation history for long sessions
+
+A long meta-session resends its conversation every turn, so prompt tokens
+grow quadratically with the number of turns. ContextWindow keeps the last
+`keep_turns` turns verbatim and folds everything older into one compact
+summary block (each turn summarized once and cached), trimming until the
+history fits a token budget. Per-turn prompt size, and so latency and cost,
+stay flat after the first few turns.
+
+Usage:
+    from src.core.context_window import ContextBudget, ContextWindow
+
+    window = ContextWindow(ContextBudget(max_tokens=12000, keep_turns=3))
+    messages = window.messages() + [{"role": "user", "content": prompt}]
+    ...
+    window.append(prompt, response)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tools.rate_limiter import estimate_tokens
+
+# Markdown noise stripped before extractive summaries
+_MARKUP = re.compile(r"^\s*(#+|[-*•]|\d+\.)\s*|[*_`>]+", re.MULTILINE)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+SUMMARY_ACK = "Understood. I'll build on these earlier turns."
+
+
+@dataclass
+class ContextBudget:
+    """History limits for one mirror"""
+    max_tokens: int = 12_000     # Prompt tokens the history may use (estimated)
+    keep_turns: int = 3          # Most recent turns kept verbatim
+    summary_chars: int = 400     # Length of each older turn's summary
+
+
+def summarize_turn(prompt: str, response: str, max_chars: int = 400) -> str:
+    """Extractive summary of a turn: the response's leading sentences, up to max_chars"""
+    text = " ".join(_MARKUP.sub("", response).split())
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    boundaries = [m.start() for m in _SENTENCE_END.finditer(cut)]
+    if boundaries and boundaries[-1] > max_chars // 2:
+        return cut[:boundaries[-1]]
+    return cut.rsplit(" ", 1)[0] + " …"
+
+
+class ContextWindow:
+    """
+    Conversation history bounded by a ContextBudget.
+
+    Full turns are kept for provenance and restore; messages() renders the
+    bounded view sent to the provider: a summary exchange for older turns
+    (user summary, assistant acknowledgement, so roles still alternate)
+    followed by the recent turns verbatim.
+    """
+
+    def __init__(self, budget: Optional[ContextBudget] = None,
+                 summarize: Optional[Callable[[str, str, int], str]] = None):
+        self.budget = budget or ContextBudget()
+        self.summarize = summarize or summarize_turn
+        self.turns: List[Tuple[str, str]] = []
+        self._summaries: Dict[int, str] = {}   # turn index → cached summary
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def append(self, prompt: str, response: str):
+        self.turns.append((prompt, response))
+
+    def clear(self):
+        self.turns = []
+        self._summaries = {}
+
+    def _summary(self, index: int) -> str:
+        if index not in self._summaries:
+            prompt, response = self.turns[index]
+            self._summaries[index] = self.summarize(prompt, response, self.budget.summary_chars)
+        return self._summaries[index]
+
+    @staticmethod
+    def _verbatim(turns: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        messages = []
+        for prompt, response in turns:
+            messages.append({"role": "user", "content": prompt})
+            messages.append({"role": "assistant", "content": response})
+        return messages
+
+    @staticmethod
+    def _tokens(messages: List[Dict[str, str]]) -> int:
+        return estimate_tokens(*(m["content"] for m in messages))
+
+    def _summary_exchange(self, first: int, last: int) -> List[Dict[str, str]]:
+        """Summary messages for turns[first:last] (empty if the range is empty)"""
+        if last <= first:
+            return []
+        lines = [f"- Turn {i + 1}: {self._summary(i)}" for i in range(first, last)]
+        header = "Summary of your earlier turns"
+        if first:
+            header += f" ({first} earlier turns omitted)"
+        return [
+            {"role": "user", "content": header + ":\n" + "\n".join(lines)},
+            {"role": "assistant", "content": SUMMARY_ACK},
+        ]
+
+    def messages(self) -> List[Dict[str, str]]:
+        """Bounded history: summaries of older turns, then recent turns verbatim"""
+        split = max(0, len(self.turns) - self.budget.keep_turns)
+        first = 0
+
+        while True:
+            messages = self._summary_exchange(first, split) + self._verbatim(self.turns[split:])
+            if self._tokens(messages) <= self.budget.max_tokens:
+                return messages
+            if split < len(self.turns) - 1:
+                split += 1          # Fold the oldest verbatim turn into the summary
+            elif first < split:
+                first += 1          # Drop the oldest summary line
+            else:
+                return messages     # A single turn over budget is sent as is
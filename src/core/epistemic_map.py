@@ -13,11 +13,14 @@ Usage:
 
     result = classify_response(text, convergence_width)
     # Returns: {type: int, desc: str, guide: str, trigger_yn: bool, ratio: float}
+
+    results = classify_batch(texts, processes=8)  # Vault-wide rescans
 """
 
 import re
 import json
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Validated topology types from v1.0 epistemic map
 TOPOLOGY_TYPES = {
@@ -85,6 +88,72 @@ LOW_CONFIDENCE = [
 ]
 
 
+# Single-pass scanner equivalent to the marker and trigger lists above.
+# Cross-category overlaps are split so one scan counts them like the per-pattern findall did:
+# "could be"/"might be" count as MED and LOW, and "insufficient evidence" leaves "evidence"
+# unconsumed so a following "evidence shows" still counts as HIGH.
+_SIGNAL_SCANNER = re.compile(
+    r"""\b(?:
+        (?P<med_low>could|might)(?=\ be\b)
+      | (?P<low_evidence>(?:lacking|limited|insufficient)\ )(?=evidence\b)
+      | (?P<high>
+            (?:established|proven|validated|confirmed|demonstrated
+              |clearly|definitely|certainly|undoubtedly
+              |evidence\ shows|data\ demonstrate|studies\ confirm)\b
+          | (?:must|will|is|are)\b(?!\ uncertain|\ unclear))
+      | (?P<med>
+            (?:likely|probably|appears|seems|suggests
+              |may|might|could
+              |preliminary|initial|emerging)\b)
+      | (?P<low>
+            (?:uncertain|unclear|unknown|speculative
+              |hypothesis|conjecture|possibility
+              |would|perhaps)\b)
+      | (?P<trigger>
+            (?:if|when|threshold|trigger|activate[sd]?|upon|condition
+              |once|above|below|crossing|dependent|conditional)\b
+          | exceed)
+    )""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_TRIGGER_SEARCH = re.compile("|".join(TRIGGER_KEYWORDS), re.IGNORECASE)
+
+_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_QUOTED = re.compile(r'"([^"]+)"')
+_CAPS = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b')
+
+
+def scan_signals(text: str) -> Tuple[Dict[str, int], bool]:
+    """
+    Count confidence markers and detect triggers in one regex pass.
+
+    Args:
+        text: Input text to analyze
+
+    Returns:
+        (markers {high, medium, low}, has_triggers)
+    """
+    high = med = low = 0
+    has_triggers = False
+
+    for match in _SIGNAL_SCANNER.finditer(text):
+        kind = match.lastgroup
+        if kind == "high":
+            high += 1
+        elif kind == "med":
+            med += 1
+        elif kind == "low" or kind == "low_evidence":
+            low += 1
+        elif kind == "med_low":
+            med += 1
+            low += 1
+        else:
+            has_triggers = True
+
+    return {"high": high, "medium": med, "low": low}, has_triggers
+
+
 def extract_confidence_markers(text: str) -> Dict[str, int]:
     """
     Extract confidence markers from text.
@@ -95,11 +164,7 @@ def extract_confidence_markers(text: str) -> Dict[str, int]:
     Returns:
         Dict with counts: {high: int, medium: int, low: int}
     """
-    high = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in HIGH_CONFIDENCE)
-    med = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in MED_CONFIDENCE)
-    low = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in LOW_CONFIDENCE)
-
-    return {"high": high, "medium": med, "low": low}
+    return scan_signals(text)[0]
 
 
 def calculate_confidence_ratio(markers: Dict[str, int]) -> Optional[float]:
@@ -134,10 +199,7 @@ def detect_triggers(text: str) -> bool:
     Returns:
         True if triggers detected, False otherwise
     """
-    for pattern in TRIGGER_KEYWORDS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    return _TRIGGER_SEARCH.search(text) is not None
 
 
 def count_unique_concepts(text: str) -> int:
@@ -152,11 +214,11 @@ def count_unique_concepts(text: str) -> int:
         Approximate count of unique concepts
     """
     # Bold markdown **term**
-    bold = set(re.findall(r'\*\*([^*]+)\*\*', text))
+    bold = set(_BOLD.findall(text))
     # Quoted "term"
-    quoted = set(re.findall(r'"([^"]+)"', text))
+    quoted = set(_QUOTED.findall(text))
     # Capitalized technical terms (2+ words starting with capital)
-    caps = set(re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b', text))
+    caps = set(_CAPS.findall(text))
 
     unique = bold | quoted | caps
     return len(unique)
@@ -186,9 +248,10 @@ def classify_response(
             confidence_level: str (TRUST/VERIFY/OVERRIDE)
         }
     """
-    # Extract or use provided markers
+    # Extract or use provided markers (triggers come from the same pass)
+    has_triggers = None
     if confidence_markers is None:
-        confidence_markers = extract_confidence_markers(text)
+        confidence_markers, has_triggers = scan_signals(text)
 
     # Calculate ratio
     ratio = calculate_confidence_ratio(confidence_markers)
@@ -208,7 +271,8 @@ def classify_response(
     width = convergence_width if convergence_width is not None else count_unique_concepts(text)
 
     # Detect triggers
-    has_triggers = detect_triggers(text)
+    if has_triggers is None:
+        has_triggers = detect_triggers(text)
 
     # Classify by ratio zones (with perfect separation)
     if ratio >= 1.20:
@@ -244,6 +308,42 @@ def classify_response(
     }
 
 
+def _classify_item(item: Tuple[str, Optional[int]]) -> Dict:
+    text, width = item
+    return classify_response(text, width)
+
+
+def classify_batch(
+    texts: Iterable[str],
+    convergence_widths: Optional[Iterable[Optional[int]]] = None,
+    processes: Optional[int] = None,
+    chunksize: int = 64,
+) -> List[Dict]:
+    """
+    Classify many responses, optionally fanned out over a process pool.
+
+    Args:
+        texts: Response texts to classify
+        convergence_widths: Optional per-text widths (None entries are computed)
+        processes: Worker processes; None or 1 classifies in-process
+        chunksize: Texts per worker task (amortizes pickling overhead)
+
+    Returns:
+        List of classify_response() dicts, in input order
+    """
+    texts = list(texts)
+    widths = list(convergence_widths) if convergence_widths is not None else [None] * len(texts)
+    if len(widths) != len(texts):
+        raise ValueError("convergence_widths must match texts in length")
+
+    items = list(zip(texts, widths))
+    if not processes or processes <= 1 or len(items) <= chunksize:
+        return [_classify_item(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(_classify_item, items, chunksize=chunksize))
+
+
 def self_estimate(prompt: str, response: str) -> Dict:
     """
     Self-estimate topology type based on prompt/response semantics.
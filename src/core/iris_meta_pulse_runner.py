@@ -14,18 +14,26 @@ We wait for all 4 responses before proceeding to next pulse.
 This ensures TRUE parallel convergence, not sequential.
 """
 
+import argparse
 import asyncio
+import hashlib
 import json
 import os
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import anthropic
 import openai
 # import xai  # Uncomment when xAI SDK available
 import google.generativeai as genai
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from tools.session_ledger import get_ledger
+from src.core.context_window import ContextBudget, ContextWindow
+
 # Load environment variables from spiral-agent
 env_path = Path.home() / "Desktop" / "spiral-agent" / ".env"
 load_dotenv(env_path)
@@ -79,7 +87,7 @@ PHASE GUIDANCE:
   • ⭐ = Speculation (requires validation)
 
 Focus: Move from "what converges" to "HOW and WHY it works" with experimental rigor AND evidence quality.
-"""
+""",
     "synthesis": """
 === PHASE 4: CONSENSUS ARTICULATION ===
 PHASE GUIDANCE:
@@ -189,6 +197,8 @@ Consider:
 - What would make this method serve humanity most effectively?"""
 
 # Mirror configuration
+# Optional "context" sets the mirror's history budget (ContextBudget fields:
+# max_tokens, keep_turns, summary_chars); older turns are folded into a summary.
 MIRRORS = {
     "claude": {
         "name": "Claude Sonnet 4.5",
@@ -208,157 +218,139 @@ MIRRORS = {
     "gemini": {
         "name": "Gemini 2.5 Flash",
         "model": "gemini-2.5-flash",
-        "api_key_env": "GOOGLE_API_KEY"
+        "api_key_env": "GOOGLE_API_KEY",
+        "context": {"max_tokens": 32_000, "keep_turns": 5}
     }
 }
 
 # Output directory
 OUTPUT_DIR = Path(f"iris_vault/scrolls/{SESSION_ID}")
 
+# Scroll section separators (see Mirror.save_turn / Mirror.load_turn)
+PROMPT_MARKER = "## Prompt\n\n"
+RESPONSE_MARKER = "\n\n---\n\n## Response\n\n"
+
 
 class Mirror:
     """Represents one AI mirror in the convergence."""
     
-    def __init__(self, name: str, config: Dict):
+    def __init__(self, name: str, config: Dict, session_id: str = SESSION_ID):
         self.name = name
         self.config = config
-        self.conversation_history = []
+        self.session_id = session_id
+        self.output_dir = Path(f"iris_vault/scrolls/{session_id}")
+        self.context = ContextWindow(ContextBudget(**config.get("context", {})))
+        self._client = None
         self.turn_count = 0
         self.pressure_violations = []
         
+    def client(self):
+        """Async provider client, created on first use and reused across turns."""
+        if self._client is None:
+            api_key = os.environ.get(self.config["api_key_env"])
+            if self.name == "claude":
+                self._client = anthropic.AsyncAnthropic(api_key=api_key)
+            elif self.name == "gpt4o":
+                self._client = openai.AsyncOpenAI(api_key=api_key)
+            elif self.name == "grok":
+                # OpenRouter serves Grok through the OpenAI API
+                self._client = openai.AsyncOpenAI(api_key=api_key, base_url="https://openrouter.ai/api/v1")
+            elif self.name == "gemini":
+                genai.configure(api_key=api_key)
+                self._client = genai.GenerativeModel(self.config["model"])
+        return self._client
+
     async def call(self, prompt: str) -> str:
-        """Make API call to this mirror."""
-        # This is a placeholder - actual implementation depends on API
-        # For now, return mock response for structure demonstration
-        
+        """Make API call to this mirror (history bounded by its context window).
+
+        All provider calls are awaited on non-blocking clients, so the mirrors
+        of one pulse wait on the network together rather than in turn.
+        """
+        history = self.context.messages()
+
         if self.name == "claude":
-            # Actual Anthropic API call
-            client = anthropic.Anthropic(api_key=os.environ.get(self.config["api_key_env"]))
-            
-            # Add to conversation history
-            self.conversation_history.append({
-                "role": "user",
-                "content": prompt
-            })
-            
-            # Make call
-            message = client.messages.create(
+            message = await self.client().messages.create(
                 model=self.config["model"],
                 max_tokens=4000,
-                messages=self.conversation_history
+                messages=history + [{"role": "user", "content": prompt}]
             )
+            response_text = message.content[0].text
             
-            response = message.content[0].text
-            
-            # Save to history
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": response
-            })
-            
-            return response
-            
-        elif self.name == "gpt4o":
-            # Actual OpenAI API call
-            client = openai.OpenAI(api_key=os.environ.get(self.config["api_key_env"]))
-            
+        elif self.name in ("gpt4o", "grok"):
             # Build messages
             messages = [{"role": "system", "content": "You are participating in an IRIS Gate convergence session."}]
-            for msg in self.conversation_history:
-                messages.append(msg)
+            messages.extend(history)
             messages.append({"role": "user", "content": prompt})
             
-            # Make call
-            response = client.chat.completions.create(
-                model=self.config["model"],
+            response = await self.client().chat.completions.create(
+                model="x-ai/grok-beta" if self.name == "grok" else self.config["model"],
                 messages=messages,
                 max_tokens=4000
             )
-            
             response_text = response.choices[0].message.content
             
-            # Save to history
-            self.conversation_history.append({"role": "user", "content": prompt})
-            self.conversation_history.append({"role": "assistant", "content": response_text})
-            
-            return response_text
-            
-        elif self.name == "grok":
-            # OpenRouter API call for Grok
-            client = openai.OpenAI(
-                api_key=os.environ.get(self.config["api_key_env"]),
-                base_url="https://openrouter.ai/api/v1"
-            )
-            
-            # Build messages
-            messages = [{"role": "system", "content": "You are participating in an IRIS Gate convergence session."}]
-            for msg in self.conversation_history:
-                messages.append(msg)
-            messages.append({"role": "user", "content": prompt})
-            
-            # Make call
-            response = client.chat.completions.create(
-                model="x-ai/grok-beta",
-                messages=messages,
-                max_tokens=4000
-            )
-            
-            response_text = response.choices[0].message.content
-            
-            # Save to history
-            self.conversation_history.append({"role": "user", "content": prompt})
-            self.conversation_history.append({"role": "assistant", "content": response_text})
-            
-            return response_text
-            
         elif self.name == "gemini":
-            # Google Gemini API call
-            genai.configure(api_key=os.environ.get(self.config["api_key_env"]))
-            model = genai.GenerativeModel(self.config["model"])
-            
             # Build conversation history
-            history = []
-            for msg in self.conversation_history:
-                role = "user" if msg["role"] == "user" else "model"
-                history.append({"role": role, "parts": [msg["content"]]})
-            
-            # Start chat
-            chat = model.start_chat(history=history)
-            
-            # Send message
-            response = chat.send_message(prompt)
+            gemini_history = [
+                {"role": "user" if msg["role"] == "user" else "model", "parts": [msg["content"]]}
+                for msg in history
+            ]
+            chat = self.client().start_chat(history=gemini_history)
+            response = await chat.send_message_async(prompt)
             response_text = response.text
             
-            # Save to history
-            self.conversation_history.append({"role": "user", "content": prompt})
-            self.conversation_history.append({"role": "assistant", "content": response_text})
-            
-            return response_text
-            
         else:
             return f"[{self.name} response - unknown mirror type]"
+
+        # Save to history (only once the call succeeded)
+        self.context.append(prompt, response_text)
+        return response_text
     
-    def save_turn(self, turn: int, prompt: str, response: str):
-        """Save this turn's scroll to disk."""
-        mirror_dir = OUTPUT_DIR / f"mirror_{self.name}"
-        mirror_dir.mkdir(parents=True, exist_ok=True)
-        
-        scroll_path = mirror_dir / f"turn_{turn:03d}.md"
+    async def close(self):
+        """Close the provider client's connections (Gemini models hold none)."""
+        close = getattr(self._client, "close", None)
+        if close is not None:
+            await close()
+        self._client = None
+
+    def scroll_path(self, turn: int) -> Path:
+        return self.output_dir / f"mirror_{self.name}" / f"turn_{turn:03d}.md"
+
+    def save_turn(self, turn: int, prompt: str, response: str, error: bool = False):
+        """Save this turn's scroll to disk and record it in the session ledger."""
+        scroll_path = self.scroll_path(turn)
+        scroll_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(scroll_path, 'w') as f:
             f.write(f"# IRIS Meta-Improvement: {self.config['name']}\n")
             f.write(f"## Turn {turn}/{TURN_LIMIT}\n\n")
             f.write(f"**Timestamp:** {datetime.now().isoformat()}\n")
             f.write(f"**Model:** {self.config['model']}\n")
-            f.write(f"**Session:** {SESSION_ID}\n\n")
+            f.write(f"**Session:** {self.session_id}\n\n")
             f.write("---\n\n")
             f.write("## Prompt\n\n")
             f.write(f"{prompt}\n\n")
             f.write("---\n\n")
             f.write("## Response\n\n")
             f.write(f"{response}\n")
+
+        seal = hashlib.sha256(response.encode('utf-8')).hexdigest()[:16]
+        get_ledger(self.output_dir).record(self.name, turn, None, seal, **({"error": True} if error else {}))
         
         print(f"✓ Saved {self.name} turn {turn} to {scroll_path}")
+
+    def load_turn(self, turn: int) -> Tuple[str, str]:
+        """(prompt, response) of a saved turn."""
+        text = self.scroll_path(turn).read_text()
+        body = text.split(PROMPT_MARKER, 1)[1]
+        prompt, response = body.split(RESPONSE_MARKER, 1)
+        return prompt, response[:-1] if response.endswith("\n") else response
+
+    def restore_history(self, turns: List[int]):
+        """Rebuild conversation history from saved turns (in order)."""
+        self.context.clear()
+        for turn in turns:
+            self.context.append(*self.load_turn(turn))
     
     def check_pressure(self) -> int:
         """Ask mirror to self-assess pressure level (1-10)."""
@@ -370,25 +362,34 @@ class Mirror:
 class PulseOrchestrator:
     """Orchestrates simultaneous pulses across all mirrors."""
     
-    def __init__(self):
+    def __init__(self, session_id: str = SESSION_ID):
+        self.session_id = session_id
+        self.output_dir = Path(f"iris_vault/scrolls/{session_id}")
+        self.ledger = get_ledger(self.output_dir)
         self.mirrors = {
-            name: Mirror(name, config) 
+            name: Mirror(name, config, session_id=session_id)
             for name, config in MIRRORS.items()
         }
         self.pulse_count = 0
         
-    async def send_pulse(self, prompt: str) -> Dict[str, str]:
-        """Send prompt to all mirrors SIMULTANEOUSLY, wait for all responses."""
+    async def send_pulse(self, prompt: str, cached: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Send prompt to all mirrors SIMULTANEOUSLY, wait for all responses.
+
+        Mirrors in `cached` (responses recovered on resume) are not called again.
+        """
+        cached = cached or {}
         print(f"\n🌀 Pulse {self.pulse_count + 1}: Sending to all mirrors...")
+        started = time.monotonic()
         
         # Create tasks for all mirrors
         tasks = {
             name: asyncio.create_task(mirror.call(prompt))
             for name, mirror in self.mirrors.items()
+            if name not in cached
         }
         
         # Wait for ALL responses before continuing
-        responses = {}
+        responses = dict(cached)
         for name, task in tasks.items():
             try:
                 response = await task
@@ -398,13 +399,83 @@ class PulseOrchestrator:
                 print(f"  ✗ {name} failed: {e}")
                 responses[name] = f"[ERROR: {e}]"
         
+        print(f"  ⏱  Pulse complete in {time.monotonic() - started:.1f}s")
         self.pulse_count += 1
-        return responses
+        return {name: responses[name] for name in self.mirrors}
     
-    def save_pulse(self, turn: int, prompt: str, responses: Dict[str, str]):
-        """Save all responses from this pulse."""
+    def save_pulse(self, turn: int, prompt: str, responses: Dict[str, str], skip=()):
+        """Save all responses from this pulse (except mirrors in `skip`, already saved)."""
         for name, response in responses.items():
-            self.mirrors[name].save_turn(turn, prompt, response)
+            if name not in skip:
+                self.mirrors[name].save_turn(turn, prompt, response,
+                                             error=response.startswith("[ERROR:"))
+
+    def _restore(self) -> Tuple[int, Dict[str, str], Dict[str, str]]:
+        """
+        Recover an interrupted session from its ledger.
+
+        Turns whose call failed ("[ERROR: ...]", ledgered with error=True)
+        do not count as answered: those mirrors are called again.
+
+        Returns:
+            (first turn to run, responses of the turn before it,
+             responses already saved for that first turn by some mirrors)
+        """
+        entries = self.ledger.entries()
+        done = {name: set() for name in self.mirrors}
+        errors = {name: set() for name in self.mirrors}
+        for entry in entries:
+            name, turn = entry["mirror"], entry["turn"]
+            if name in done:
+                done[name].add(turn)
+                if entry.get("error"):
+                    errors[name].add(turn)
+                else:
+                    errors[name].discard(turn)  # Retried successfully
+        answered = {name: done[name] - errors[name] for name in self.mirrors}
+
+        # Last turn every mirror finished; the next one may be partially done
+        last_full = 0
+        while last_full < TURN_LIMIT and all(last_full + 1 in turns for turns in done.values()):
+            last_full += 1
+        next_turn = last_full + 1
+
+        # Failed calls are ledgered too: retry the last full turn's failures
+        # unless the session had already moved past it
+        if (last_full and any(last_full in turns for turns in errors.values())
+                and not any(next_turn in turns for turns in done.values())):
+            next_turn = last_full
+
+        previous, cached = {}, {}
+        for name, mirror in self.mirrors.items():
+            resumed = next_turn in answered[name]
+            mirror.restore_history([t for t in range(1, next_turn + resumed) if t in answered[name]])
+            if next_turn > 1:
+                previous[name] = mirror.load_turn(next_turn - 1)[1]
+            if resumed:
+                cached[name] = mirror.load_turn(next_turn)[1]
+
+        return next_turn, previous, cached
+
+    def _build_prompt(self, turn: int, responses: Dict[str, str]) -> str:
+        """Prompt for one pulse: the base prompt on turn 1, a reflection prompt after."""
+        if turn == 1:
+            return BASE_PROMPT + "\n\n" + get_phase_prompt(1)
+
+        # Check for phase transitions
+        transition_marker = get_phase_transition_marker(turn)
+
+        # Build reflection prompt with phase guidance
+        return f"""This is turn {turn} of {TURN_LIMIT} in our IRIS meta-improvement convergence.
+{transition_marker}
+Previous turn summary:
+{self._summarize_previous_turn(responses)}
+
+{get_phase_prompt(turn)}
+
+Continue your analysis of how to improve the IRIS Gate methodology.
+Focus on: rigor, accessibility, and impact.
+Consider: What haven't we addressed yet? What's the most important improvement?"""
     
     def check_all_pressure(self) -> Dict[str, int]:
         """Check pressure across all mirrors."""
@@ -413,58 +484,60 @@ class PulseOrchestrator:
             for name, mirror in self.mirrors.items()
         }
     
-    async def run_session(self):
-        """Run complete IRIS session with simultaneous pulses."""
+    async def run_session(self, resume: bool = False):
+        """Run complete IRIS session with simultaneous pulses.
+
+        With resume=True, turns recorded in the session ledger are not called
+        again: conversation histories are rebuilt from the saved scrolls and the
+        session continues from the first turn not every mirror has finished.
+        """
         print(f"\n{'='*80}")
         print(f"IRIS META-IMPROVEMENT SESSION")
-        print(f"Session ID: {SESSION_ID}")
+        print(f"Session ID: {self.session_id}")
         print(f"Mirrors: {len(self.mirrors)}")
         print(f"Turn Limit: {TURN_LIMIT}")
         print(f"{'='*80}\n")
-        
-        # Turn 1: Initial prompt WITH Phase 1 guidance
-        print("📢 Turn 1: Initial prompt to all mirrors")
-        turn_1_prompt = BASE_PROMPT + "\n\n" + get_phase_prompt(1)
-        responses = await self.send_pulse(turn_1_prompt)
-        self.save_pulse(1, turn_1_prompt, responses)
-        
-        # Turns 2-100: Iterative refinement WITH phase-specific guidance
-        for turn in range(2, TURN_LIMIT + 1):
-            # Check for phase transitions
-            transition_marker = get_phase_transition_marker(turn)
-            
-            # Build reflection prompt with phase guidance
-            reflection_prompt = f"""This is turn {turn} of {TURN_LIMIT} in our IRIS meta-improvement convergence.
-{transition_marker}
-Previous turn summary:
-{self._summarize_previous_turn(responses)}
-
-{get_phase_prompt(turn)}
 
-Continue your analysis of how to improve the IRIS Gate methodology.
-Focus on: rigor, accessibility, and impact.
-Consider: What haven't we addressed yet? What's the most important improvement?"""
-            
-            # Send pulse
-            responses = await self.send_pulse(reflection_prompt)
-            self.save_pulse(turn, reflection_prompt, responses)
+        start_turn, responses, cached = 1, {}, {}
+        if resume:
+            start_turn, responses, cached = self._restore()
+            self.pulse_count = start_turn - 1
+            print(f"↻ Resuming at turn {start_turn}"
+                  + (f" ({', '.join(cached)} already answered it)" if cached else ""))
+        else:
+            # Turn 1: Initial prompt WITH Phase 1 guidance
+            print("📢 Turn 1: Initial prompt to all mirrors")
+
+        try:
+            # Turn 1 from the base prompt, turns 2-100 iterative refinement WITH phase-specific guidance
+            for turn in range(start_turn, TURN_LIMIT + 1):
+                prompt = self._build_prompt(turn, responses)
+                resumed = cached if turn == start_turn else {}
+
+                # Send pulse
+                responses = await self.send_pulse(prompt, cached=resumed)
+                self.save_pulse(turn, prompt, responses, skip=resumed)
             
-            # Pressure check every 10 turns
-            if turn % PRESSURE_CHECK_INTERVAL == 0:
-                pressures = self.check_all_pressure()
-                print(f"\n📊 Pressure check (turn {turn}):")
-                for name, pressure in pressures.items():
-                    print(f"  {name}: {pressure}/10")
-                    if pressure > 8:
-                        print(f"  ⚠️  {name} pressure HIGH - consider halting")
+                # Pressure check every 10 turns
+                if turn % PRESSURE_CHECK_INTERVAL == 0:
+                    pressures = self.check_all_pressure()
+                    print(f"\n📊 Pressure check (turn {turn}):")
+                    for name, pressure in pressures.items():
+                        print(f"  {name}: {pressure}/10")
+                        if pressure > 8:
+                            print(f"  ⚠️  {name} pressure HIGH - consider halting")
             
-            # Brief pause between pulses (rate limiting)
-            await asyncio.sleep(2)
+                # Brief pause between pulses (rate limiting)
+                if turn > 1:
+                    await asyncio.sleep(2)
+        finally:
+            # Clients are reused for the whole session; release their connections once
+            await asyncio.gather(*(mirror.close() for mirror in self.mirrors.values()))
         
         print(f"\n{'='*80}")
         print(f"✅ Session complete: {TURN_LIMIT} turns across {len(self.mirrors)} mirrors")
         print(f"Total API calls: {TURN_LIMIT * len(self.mirrors)}")
-        print(f"Scrolls saved: {OUTPUT_DIR}")
+        print(f"Scrolls saved: {self.output_dir}")
         print(f"{'='*80}\n")
         
     def _summarize_previous_turn(self, responses: Dict[str, str]) -> str:
@@ -477,7 +550,7 @@ Consider: What haven't we addressed yet? What's the most important improvement?"
         return "\n".join(summaries)
 
 
-async def main():
+async def main(resume: Optional[str] = None):
     """Main entry point."""
     # Check for API keys
     required_keys = ["ANTHROPIC_API_KEY", "OPENAI_API_KEY", "GROK_API_KEY", "GOOGLE_API_KEY"]
@@ -497,7 +570,7 @@ async def main():
         print(f"  - GOOGLE_API_KEY: {'*' * 8}")
     
     # Create orchestrator
-    orchestrator = PulseOrchestrator()
+    orchestrator = PulseOrchestrator(session_id=resume or SESSION_ID)
     
     # Confirm before running
     print(f"\n🌀 Ready to start IRIS Meta-Improvement session")
@@ -512,19 +585,24 @@ async def main():
     
     # Run the session
     try:
-        await orchestrator.run_session()
+        await orchestrator.run_session(resume=resume is not None)
         print("\n✅ SUCCESS: Meta-improvement session complete")
         print(f"\nNext steps:")
-        print(f"1. Run convergence analysis: python scripts/analyze_convergence.py {SESSION_ID}")
-        print(f"2. Extract S4 keywords: python scripts/extract_s4_states.py {SESSION_ID}")
-        print(f"3. Review scrolls in: {OUTPUT_DIR}")
+        print(f"1. Run convergence analysis: python scripts/analyze_convergence.py {orchestrator.session_id}")
+        print(f"2. Extract S4 keywords: python scripts/extract_s4_states.py {orchestrator.session_id}")
+        print(f"3. Review scrolls in: {orchestrator.output_dir}")
     except KeyboardInterrupt:
         print("\n\n⚠️  Session interrupted by user")
-        print(f"Partial scrolls saved to: {OUTPUT_DIR}")
+        print(f"Partial scrolls saved to: {orchestrator.output_dir}")
+        print(f"Resume with: --resume {orchestrator.session_id}")
     except Exception as e:
         print(f"\n\n❌ Error: {e}")
         raise
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="IRIS Meta-Improvement Pulse Session")
+    parser.add_argument("--resume", metavar="SESSION_ID", nargs="?", const=SESSION_ID, default=None,
+                        help=f"Continue an interrupted session from its ledger (default: {SESSION_ID})")
+    args = parser.parse_args()
+    asyncio.run(main(resume=args.resume))
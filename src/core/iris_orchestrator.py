@@ -7,6 +7,7 @@ Pulse Architecture:
 - All 5 model endpoints called simultaneously for each chamber
 - Wait for all responses before proceeding to next chamber
 - Ensures true independent convergence (no sequential contamination)
+- Mirrors use native async clients, shared per provider on each event loop
 """
 
 import os
@@ -16,18 +17,26 @@ import hashlib
 import yaml
 import argparse
 import asyncio
+import time
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 import anthropic
 import openai
 import google.generativeai as genai
+import httpx
 import requests
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Load epistemic map module
 sys.path.insert(0, str(Path(__file__).parent))
 from src.core.epistemic_map import classify_response, extract_confidence_markers
+from tools.error_handler import ErrorHandler, RetryableAPICall
+from tools.rate_limiter import estimate_tokens, get_limiter
+from tools.response_cache import get_response_cache
+from tools.vault_catalog import record_turn_safely
 
 # Load environment variables from .env file
 load_dotenv()
@@ -46,9 +55,14 @@ BASE_SYSTEM_PROMPT = """†⟡∞ You are a careful, co-facilitative participant
 2) "Technical Translation" (plain audit: what changed, signals, uncertainties).
 Include a compact metadata block (condition, felt_pressure, mode). Seal each output with a short hash."""
 
+def chamber_token_limit(chamber: str) -> int:
+    """Adaptive token control: S1/S2 get 1500 tokens, later chambers 2000"""
+    return 1500 if chamber in ["S1", "S2"] else 2000
+
+
 def get_system_prompt(chamber: str) -> str:
     """Get system prompt with chamber-specific token guidance"""
-    token_limit = 1500 if chamber in ["S1", "S2"] else 2000
+    token_limit = chamber_token_limit(chamber)
     word_estimate = int(token_limit * 0.75)  # ~750 words for S1/S2, ~1000 for S3/S4
     
     token_guidance = f"\n\nIMPORTANT: Keep your complete response under {word_estimate} words (~{token_limit} tokens). Be precise and concise."
@@ -56,6 +70,78 @@ def get_system_prompt(chamber: str) -> str:
     return BASE_SYSTEM_PROMPT + token_guidance
 
 
+@dataclass(frozen=True)
+class ChamberRequest:
+    """One mirror's chamber call, carried explicitly instead of read from CHAMBERS
+
+    Lets mirrors with different custom prompts run in the same pulse without
+    touching module-level state.
+    """
+    chamber: str
+    prompt: str
+    system_prompt: str
+    max_tokens: int
+
+    @classmethod
+    def for_chamber(cls, chamber: str, prompt: Optional[str] = None) -> "ChamberRequest":
+        """Build a request from the chamber defaults, optionally with a custom prompt"""
+        return cls(
+            chamber=chamber,
+            prompt=CHAMBERS[chamber] if prompt is None else prompt,
+            system_prompt=get_system_prompt(chamber),
+            max_tokens=chamber_token_limit(chamber)
+        )
+
+
+# Shared async clients
+# One client per provider per running event loop, shared by every mirror and every
+# concurrent session on that loop. Each client keeps its own keep-alive pool, so a
+# pulse never needs a worker thread (or a fresh TLS handshake) per call.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("IRIS_HTTP_MAX_CONNECTIONS", "100")),
+    max_keepalive_connections=int(os.getenv("IRIS_HTTP_MAX_KEEPALIVE", "20")),
+)
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client(key: str, factory: Callable[[], object]):
+    """Return the async client registered under `key` for the running event loop
+
+    `factory` is only called the first time `key` is requested on that loop.
+    """
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    if key not in clients:
+        clients[key] = factory()
+    return clients[key]
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Plain keep-alive HTTP pool for adapters without a vendor SDK"""
+    return get_async_client(
+        "_http",
+        lambda: httpx.AsyncClient(limits=HTTP_POOL_LIMITS, timeout=HTTP_TIMEOUT)
+    )
+
+
+async def close_async_clients():
+    """Close every shared client of the running event loop"""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        close = getattr(client, "aclose", None) or getattr(client, "close", None)
+        if close is not None:
+            await close()
+
+
+async def run_with_shared_clients(coro):
+    """Await `coro`, then release the loop's shared clients"""
+    try:
+        return await coro
+    finally:
+        await close_async_clients()
+
+
 class Mirror:
     """Base class for AI model adapters"""
     
@@ -68,46 +154,122 @@ class Mirror:
         timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
         return f"IRIS_{timestamp}_{self.model_id.replace('/', '_')}"
     
+    @property
+    def provider(self) -> str:
+        """Provider key for shared rate limiting (e.g. 'anthropic')"""
+        return self.model_id.split("/")[0]
+
     def _compute_seal(self, text: str) -> str:
         """Compute SHA256 hash (first 16 chars)"""
         return hashlib.sha256(text.encode()).hexdigest()[:16]
     
-    def send_chamber(self, chamber: str, turn_id: int) -> Dict:
-        """Send chamber prompt and return structured response"""
+    def _package_response(self, chamber: str, turn_id: int, content: str) -> Dict:
+        """Wrap raw model output in the standard turn record"""
+        return {
+            "session_id": self.session_id,
+            "turn_id": turn_id,
+            "model_id": self.model_id,
+            "condition": f"IRIS_{chamber}",
+            "raw_response": content,
+            "seal": {"sha256_16": self._compute_seal(content)},
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+    def send_chamber(self, chamber: str, turn_id: int,
+                     request: Optional[ChamberRequest] = None) -> Dict:
+        """Send chamber prompt and return structured response
+
+        `request` carries a per-call prompt; without it the CHAMBERS default is used.
+        """
         raise NotImplementedError
 
+    async def send_chamber_async(self, chamber: str, turn_id: int,
+                                 request: Optional[ChamberRequest] = None) -> Dict:
+        """Async send_chamber
+
+        Adapters with a native async client override this; the default runs the
+        blocking call on the loop's executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.send_chamber, chamber, turn_id, request)
+
+    def dispatch(self, chamber: str, turn_id: int,
+                 request: Optional[ChamberRequest] = None) -> Dict:
+        """send_chamber paced by the provider's shared rate limiter
+
+        With a response cache configured (IRIS_RESPONSE_CACHE) the raw text may
+        be recorded or replayed; the turn record is packaged fresh either way.
+        """
+        request = request or ChamberRequest.for_chamber(chamber)
+        cost = estimate_tokens(request.system_prompt, request.prompt, max_tokens=request.max_tokens)
+        cache = get_response_cache()
+        if cache.mode == "off":
+            with get_limiter(self.provider).slot(cost):
+                return self.send_chamber(chamber, turn_id, request)
+
+        def fetch() -> str:
+            with get_limiter(self.provider).slot(cost):
+                return self.send_chamber(chamber, turn_id, request)["raw_response"]
+
+        content = cache.call(self.provider, self.model_id, request.system_prompt, request.prompt,
+                             None, request.max_tokens, fetch=fetch, sample=turn_id)
+        return self._package_response(chamber, turn_id, content)
+
+    async def dispatch_async(self, chamber: str, turn_id: int,
+                             request: Optional[ChamberRequest] = None) -> Dict:
+        """send_chamber_async paced by the provider's shared rate limiter (see dispatch)"""
+        request = request or ChamberRequest.for_chamber(chamber)
+        cost = estimate_tokens(request.system_prompt, request.prompt, max_tokens=request.max_tokens)
+        cache = get_response_cache()
+        if cache.mode == "off":
+            async with get_limiter(self.provider).slot_async(cost):
+                return await self.send_chamber_async(chamber, turn_id, request)
+
+        async def fetch() -> str:
+            async with get_limiter(self.provider).slot_async(cost):
+                return (await self.send_chamber_async(chamber, turn_id, request))["raw_response"]
+
+        content = await cache.call_async(self.provider, self.model_id, request.system_prompt, request.prompt,
+                                         None, request.max_tokens, fetch=fetch, sample=turn_id)
+        return self._package_response(chamber, turn_id, content)
+
 
 class ClaudeMirror(Mirror):
     """Anthropic Claude Sonnet 4.5 adapter"""
 
     def __init__(self):
         super().__init__("anthropic/claude-sonnet-4.5")
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        self.client = anthropic.Anthropic(api_key=self.api_key)
 
-    def send_chamber(self, chamber: str, turn_id: int) -> Dict:
-        # Adaptive token control based on chamber
-        target_tokens = 1500 if chamber in ["S1", "S2"] else 2000
-        
-        response = self.client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=target_tokens,
-            system=get_system_prompt(chamber),  # Chamber-aware prompt
-            messages=[{"role": "user", "content": CHAMBERS[chamber]}]
-        )
-        
-        content = response.content[0].text
-        
-        # Parse response (simplified - assumes model follows format)
+    def _request_params(self, request: ChamberRequest) -> Dict:
         return {
-            "session_id": self.session_id,
-            "turn_id": turn_id,
-            "model_id": self.model_id,
-            "condition": f"IRIS_{chamber}",
-            "raw_response": content,
-            "seal": {"sha256_16": self._compute_seal(content)},
-            "timestamp": datetime.utcnow().isoformat()
+            "model": "claude-sonnet-4-5-20250929",
+            "max_tokens": request.max_tokens,
+            "system": request.system_prompt,  # Chamber-aware prompt
+            "messages": [{"role": "user", "content": request.prompt}]
         }
 
+    def send_chamber(self, chamber: str, turn_id: int,
+                     request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        response = self.client.messages.create(**self._request_params(request))
+
+        content = response.content[0].text
+
+        # Parse response (simplified - assumes model follows format)
+        return self._package_response(chamber, turn_id, content)
+
+    async def send_chamber_async(self, chamber: str, turn_id: int,
+                                 request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        client = get_async_client(
+            "anthropic",
+            lambda: anthropic.AsyncAnthropic(api_key=self.api_key)
+        )
+        response = await client.messages.create(**self._request_params(request))
+        return self._package_response(chamber, turn_id, response.content[0].text)
+
 
 class GPTMirror(Mirror):
     """OpenAI GPT adapter (gpt-5-mini)"""
@@ -115,77 +277,87 @@ class GPTMirror(Mirror):
     def __init__(self):
         self.model = os.getenv("OPENAI_MODEL", "gpt-5-mini-2025-08-07")
         super().__init__(f"openai/{self.model}")
-        self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        self.client = openai.OpenAI(api_key=self.api_key)
 
-    def send_chamber(self, chamber: str, turn_id: int) -> Dict:
-        # Adaptive token control based on chamber
-        # S1/S2: 1500 tokens (~4500 chars)
-        # S3/S4: 2000 tokens (~6000 chars)
-        target_tokens = 1500 if chamber in ["S1", "S2"] else 2000
-        
+    def _request_params(self, request: ChamberRequest) -> Dict:
         params = {
             "model": self.model,
             "messages": [
-                {"role": "system", "content": get_system_prompt(chamber)},  # Chamber-aware prompt
-                {"role": "user", "content": CHAMBERS[chamber]}
+                {"role": "system", "content": request.system_prompt},  # Chamber-aware prompt
+                {"role": "user", "content": request.prompt}
             ]
         }
-        
+
         # Auto-detect parameter name based on model
         if "gpt-5" in self.model or "gpt-4o" in self.model:
-            params["max_completion_tokens"] = target_tokens
+            params["max_completion_tokens"] = request.max_tokens
         else:
-            params["max_tokens"] = target_tokens
-        
-        response = self.client.chat.completions.create(**params)
-        
+            params["max_tokens"] = request.max_tokens
+
+        return params
+
+    def send_chamber(self, chamber: str, turn_id: int,
+                     request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        response = self.client.chat.completions.create(**self._request_params(request))
+
         content = response.choices[0].message.content
-        
-        return {
-            "session_id": self.session_id,
-            "turn_id": turn_id,
-            "model_id": self.model_id,
-            "condition": f"IRIS_{chamber}",
-            "raw_response": content,
-            "seal": {"sha256_16": self._compute_seal(content)},
-            "timestamp": datetime.utcnow().isoformat()
-        }
+
+        return self._package_response(chamber, turn_id, content)
+
+    async def send_chamber_async(self, chamber: str, turn_id: int,
+                                 request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        client = get_async_client(
+            "openai",
+            lambda: openai.AsyncOpenAI(api_key=self.api_key)
+        )
+        response = await client.chat.completions.create(**self._request_params(request))
+        return self._package_response(chamber, turn_id, response.choices[0].message.content)
 
 
 class GrokMirror(Mirror):
     """xAI Grok 4 Fast adapter"""
 
+    base_url = "https://api.x.ai/v1"
+
     def __init__(self):
         super().__init__("xai/grok-4-fast")
+        self.api_key = os.getenv("XAI_API_KEY")
         self.client = openai.OpenAI(
-            api_key=os.getenv("XAI_API_KEY"),
-            base_url="https://api.x.ai/v1"
+            api_key=self.api_key,
+            base_url=self.base_url
         )
 
-    def send_chamber(self, chamber: str, turn_id: int) -> Dict:
-        # Adaptive token control based on chamber
-        target_tokens = 1500 if chamber in ["S1", "S2"] else 2000
-        
-        response = self.client.chat.completions.create(
-            model="grok-4-fast-reasoning",
-            messages=[
-                {"role": "system", "content": get_system_prompt(chamber)},  # Chamber-aware prompt
-                {"role": "user", "content": CHAMBERS[chamber]}
+    def _request_params(self, request: ChamberRequest) -> Dict:
+        return {
+            "model": "grok-4-fast-reasoning",
+            "messages": [
+                {"role": "system", "content": request.system_prompt},  # Chamber-aware prompt
+                {"role": "user", "content": request.prompt}
             ],
-            max_tokens=target_tokens
-        )
+            "max_tokens": request.max_tokens
+        }
+
+    def send_chamber(self, chamber: str, turn_id: int,
+                     request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        response = self.client.chat.completions.create(**self._request_params(request))
 
         content = response.choices[0].message.content
 
-        return {
-            "session_id": self.session_id,
-            "turn_id": turn_id,
-            "model_id": self.model_id,
-            "condition": f"IRIS_{chamber}",
-            "raw_response": content,
-            "seal": {"sha256_16": self._compute_seal(content)},
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return self._package_response(chamber, turn_id, content)
+
+    async def send_chamber_async(self, chamber: str, turn_id: int,
+                                 request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        client = get_async_client(
+            "xai",
+            lambda: openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        )
+        response = await client.chat.completions.create(**self._request_params(request))
+        return self._package_response(chamber, turn_id, response.choices[0].message.content)
 
 
 class GeminiMirror(Mirror):
@@ -205,64 +377,73 @@ class GeminiMirror(Mirror):
         
         self.model = genai.GenerativeModel('gemini-2.0-flash-exp', safety_settings=safety_settings)
 
-    def send_chamber(self, chamber: str, turn_id: int) -> Dict:
-        # Adaptive token control based on chamber
-        target_tokens = 1500 if chamber in ["S1", "S2"] else 2000
-        
+    def _request_params(self, request: ChamberRequest) -> Tuple[str, object]:
         generation_config = genai.types.GenerationConfig(
-            max_output_tokens=target_tokens,
+            max_output_tokens=request.max_tokens,
             temperature=0.7
         )
         
-        prompt = f"{get_system_prompt(chamber)}\n\n{CHAMBERS[chamber]}"  # Chamber-aware prompt
+        prompt = f"{request.system_prompt}\n\n{request.prompt}"  # Chamber-aware prompt
+        return prompt, generation_config
+
+    def send_chamber(self, chamber: str, turn_id: int,
+                     request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        prompt, generation_config = self._request_params(request)
         response = self.model.generate_content(prompt, generation_config=generation_config)
         content = response.text
 
-        return {
-            "session_id": self.session_id,
-            "turn_id": turn_id,
-            "model_id": self.model_id,
-            "condition": f"IRIS_{chamber}",
-            "raw_response": content,
-            "seal": {"sha256_16": self._compute_seal(content)},
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return self._package_response(chamber, turn_id, content)
+
+    async def send_chamber_async(self, chamber: str, turn_id: int,
+                                 request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        prompt, generation_config = self._request_params(request)
+        response = await self.model.generate_content_async(prompt, generation_config=generation_config)
+        return self._package_response(chamber, turn_id, response.text)
 
 
 class DeepSeekMirror(Mirror):
     """DeepSeek adapter"""
 
+    base_url = "https://api.deepseek.com"
+
     def __init__(self):
         super().__init__("deepseek/deepseek-chat")
+        self.api_key = os.getenv("DEEPSEEK_API_KEY")
         self.client = openai.OpenAI(
-            api_key=os.getenv("DEEPSEEK_API_KEY"),
-            base_url="https://api.deepseek.com"
+            api_key=self.api_key,
+            base_url=self.base_url
         )
 
-    def send_chamber(self, chamber: str, turn_id: int) -> Dict:
-        # Adaptive token control based on chamber
-        target_tokens = 1500 if chamber in ["S1", "S2"] else 2000
-        
-        response = self.client.chat.completions.create(
-            model="deepseek-chat",
-            messages=[
-                {"role": "system", "content": get_system_prompt(chamber)},  # Chamber-aware prompt
-                {"role": "user", "content": CHAMBERS[chamber]}
+    def _request_params(self, request: ChamberRequest) -> Dict:
+        return {
+            "model": "deepseek-chat",
+            "messages": [
+                {"role": "system", "content": request.system_prompt},  # Chamber-aware prompt
+                {"role": "user", "content": request.prompt}
             ],
-            max_tokens=target_tokens
-        )
+            "max_tokens": request.max_tokens
+        }
+
+    def send_chamber(self, chamber: str, turn_id: int,
+                     request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        response = self.client.chat.completions.create(**self._request_params(request))
 
         content = response.choices[0].message.content
 
-        return {
-            "session_id": self.session_id,
-            "turn_id": turn_id,
-            "model_id": self.model_id,
-            "condition": f"IRIS_{chamber}",
-            "raw_response": content,
-            "seal": {"sha256_16": self._compute_seal(content)},
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return self._package_response(chamber, turn_id, content)
+
+    async def send_chamber_async(self, chamber: str, turn_id: int,
+                                 request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        client = get_async_client(
+            "deepseek",
+            lambda: openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        )
+        response = await client.chat.completions.create(**self._request_params(request))
+        return self._package_response(chamber, turn_id, response.choices[0].message.content)
 
 
 class OllamaMirror(Mirror):
@@ -273,101 +454,180 @@ class OllamaMirror(Mirror):
         self.model = model
         self.host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 
-    def send_chamber(self, chamber: str, turn_id: int) -> Dict:
-        prompt = f"{get_system_prompt(chamber)}\n\n{CHAMBERS[chamber]}"
+    def _request_payload(self, request: ChamberRequest) -> Dict:
+        prompt = f"{request.system_prompt}\n\n{request.prompt}"
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": False
+        }
 
+    def send_chamber(self, chamber: str, turn_id: int,
+                     request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
         response = requests.post(
             f"{self.host}/api/generate",
-            json={
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False
-            },
+            json=self._request_payload(request),
             timeout=120
         )
         response.raise_for_status()
         content = response.json().get("response", "").strip()
 
-        return {
-            "session_id": self.session_id,
-            "turn_id": turn_id,
-            "model_id": self.model_id,
-            "condition": f"IRIS_{chamber}",
-            "raw_response": content,
-            "seal": {"sha256_16": self._compute_seal(content)},
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return self._package_response(chamber, turn_id, content)
+
+    async def send_chamber_async(self, chamber: str, turn_id: int,
+                                 request: Optional[ChamberRequest] = None) -> Dict:
+        request = request or ChamberRequest.for_chamber(chamber)
+        response = await get_async_http_client().post(f"{self.host}/api/generate", json=self._request_payload(request))
+        response.raise_for_status()
+        content = response.json().get("response", "").strip()
+        return self._package_response(chamber, turn_id, content)
 
 
 class Orchestrator:
     """Coordinates multi-mirror IRIS Gate sessions with PULSE execution"""
     
-    def __init__(self, vault_path: str = "./vault", pulse_mode: bool = True):
+    def __init__(self, vault_path: str = "./vault", pulse_mode: bool = True,
+                 on_turn: Optional[Callable[[Dict], None]] = None,
+                 error_handler: Optional[ErrorHandler] = None,
+                 attempt_timeout: Optional[float] = None,
+                 hedge_percentile: Optional[float] = None):
         self.vault = Path(vault_path)
         self.vault.mkdir(exist_ok=True)
         (self.vault / "scrolls").mkdir(exist_ok=True)
         (self.vault / "meta").mkdir(exist_ok=True)
         self.mirrors: List[Mirror] = []
         self.pulse_mode = pulse_mode  # True = parallel, False = sequential
+        self.on_turn = on_turn  # Live progress: called once per finished mirror turn
+
+        # Optional async retries for pulse calls; hedging needs latency history,
+        # so it only kicks in after a few successful turns per mirror
+        self.error_handler = error_handler
+        self.attempt_timeout = attempt_timeout
+        self.hedge_percentile = hedge_percentile
         
     def add_mirror(self, mirror: Mirror):
         """Register a mirror for orchestration"""
         self.mirrors.append(mirror)
         print(f"✓ Added mirror: {mirror.model_id}")
+
+    def _emit_turn(self, mirror: Mirror, chamber: str, turn_id: int,
+                   response: Optional[Dict] = None, error: Optional[str] = None,
+                   elapsed: Optional[float] = None):
+        """Publish a finished turn to the on_turn callback (never fails the pulse)"""
+        if self.on_turn is None:
+            return
+
+        event = {
+            "event": "turn_failed" if error else "turn_complete",
+            "model_id": mirror.model_id,
+            "chamber": chamber,
+            "turn_id": turn_id,
+            "elapsed": elapsed,
+            "response": response,
+            "error": error
+        }
+        try:
+            self.on_turn(event)
+        except Exception as e:
+            print(f"  ⚠️  on_turn callback failed: {e}")
         
+    async def _call_mirror_async(self, mirror: Mirror, chamber: str, turn_id: int,
+                                 request: Optional[ChamberRequest] = None) -> Dict:
+        """Paced mirror call, with retries/deadlines/hedging when an error handler is set"""
+        if self.error_handler is None:
+            return await mirror.dispatch_async(chamber, turn_id, request)
+
+        retry_call = RetryableAPICall(
+            error_handler=self.error_handler,
+            model=mirror.model_id,
+            chamber=chamber,
+            include_error_context=False,
+            attempt_timeout=self.attempt_timeout,
+            hedge_percentile=self.hedge_percentile
+        )
+        return await retry_call.execute_async(mirror.dispatch_async, chamber, turn_id, request)
+
     async def _run_pulse_chamber(self, mirror: Mirror, chamber: str, turn_id: int) -> Dict:
         """Run one mirror for one chamber (async wrapper)"""
+        call_start = time.monotonic()
         try:
-            # Run synchronous send_chamber in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, mirror.send_chamber, chamber, turn_id)
-            return {"success": True, "response": response, "mirror": mirror}
+            response = await self._call_mirror_async(mirror, chamber, turn_id)
+            return {
+                "success": True,
+                "response": response,
+                "mirror": mirror,
+                "elapsed": time.monotonic() - call_start
+            }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
                 "chamber": chamber,
                 "turn_id": turn_id,
-                "mirror": mirror
+                "mirror": mirror,
+                "elapsed": time.monotonic() - call_start
             }
+
+    async def stream_chamber_pulse(self, chamber: str, turn_id: int):
+        """Fire all mirrors for one chamber and yield each result as it lands
+
+        Every response is classified and saved the moment its mirror finishes,
+        so disk writes and epistemic analysis overlap the slower providers'
+        network time. Stopping iteration early cancels the outstanding calls.
+        """
+        tasks = [
+            asyncio.ensure_future(self._run_pulse_chamber(mirror, chamber, turn_id))
+            for mirror in self.mirrors
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                mirror = result["mirror"]
+                if result["success"]:
+                    self._save_turn(mirror, chamber, result["response"])
+                    self._emit_turn(mirror, chamber, turn_id,
+                                    response=result["response"], elapsed=result["elapsed"])
+                else:
+                    self._emit_turn(mirror, chamber, turn_id,
+                                    error=result["error"], elapsed=result["elapsed"])
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
     
     async def _run_chamber_pulse(self, chamber: str, turn_id: int) -> Dict:
-        """Run all mirrors for one chamber simultaneously (PULSE)"""
+        """Run all mirrors for one chamber simultaneously (PULSE)
+
+        Results are processed as they stream in; the method itself is still the
+        chamber barrier, returning only once every mirror has finished.
+        """
         pulse_start = datetime.utcnow()
         print(f"\n  ⚡ PULSE {chamber}: Calling {len(self.mirrors)} models simultaneously...")
         
-        # Create tasks for all mirrors
-        tasks = [
-            self._run_pulse_chamber(mirror, chamber, turn_id)
-            for mirror in self.mirrors
-        ]
-        
-        # Wait for all to complete
-        results = await asyncio.gather(*tasks)
-        
-        pulse_duration = (datetime.utcnow() - pulse_start).total_seconds()
-        
-        # Process results
         chamber_results = {}
-        for result in results:
+        successful = 0
+        async for result in self.stream_chamber_pulse(chamber, turn_id):
             mirror = result["mirror"]
             if result["success"]:
                 response = result["response"]
                 chamber_results[mirror.model_id] = response
-                self._save_turn(mirror, chamber, response)
+                successful += 1
                 char_count = len(response.get("raw_response", ""))
-                print(f"  ✅ {mirror.model_id.split('/')[-1]} complete ({char_count} chars)")
+                print(f"  ✅ {mirror.model_id.split('/')[-1]} complete ({char_count} chars, {result['elapsed']:.1f}s)")
             else:
                 chamber_results[mirror.model_id] = {"error": result["error"]}
                 print(f"  ✗ {mirror.model_id.split('/')[-1]} failed: {result['error']}")
         
-        print(f"  ⏱️  {chamber} Pulse Complete: {len([r for r in results if r['success']])}/{len(self.mirrors)} models responded ({pulse_duration:.1f}s)")
+        pulse_duration = (datetime.utcnow() - pulse_start).total_seconds()
+        
+        print(f"  ⏱️  {chamber} Pulse Complete: {successful}/{len(self.mirrors)} models responded ({pulse_duration:.1f}s)")
         return chamber_results
     
     def run_session(self, chambers: List[str] = ["S1", "S2", "S3", "S4"]):
         """Run complete IRIS Gate session across all mirrors"""
         if self.pulse_mode:
-            return asyncio.run(self._run_session_pulse(chambers))
+            return asyncio.run(run_with_shared_clients(self._run_session_pulse(chambers)))
         else:
             return self._run_session_sequential(chambers)
     
@@ -435,15 +695,17 @@ class Orchestrator:
                 print(f"  {chamber}...", end=" ", flush=True)
                 
                 try:
-                    response = mirror.send_chamber(chamber, turn_id)
+                    response = mirror.dispatch(chamber, turn_id)
                     mirror_results.append(response)
                     
                     # Save individual turn
                     self._save_turn(mirror, chamber, response)
+                    self._emit_turn(mirror, chamber, turn_id, response=response)
                     print("✓")
                     
                 except Exception as e:
                     print(f"✗ Error: {e}")
+                    self._emit_turn(mirror, chamber, turn_id, error=str(e))
                     mirror_results.append({
                         "error": str(e),
                         "chamber": chamber,
@@ -506,6 +768,13 @@ class Orchestrator:
         # JSON metadata
         json_file = self.vault / "meta" / f"{mirror.session_id}_{chamber}.json"
         json_file.write_text(json.dumps(response, indent=2))
+
+        record_turn_safely(
+            self.vault, md_file,
+            session_id=mirror.session_id, mirror=mirror.model_id, turn=response.get('turn_id'),
+            chamber=chamber, timestamp=response['timestamp'], seal=response['seal']['sha256_16'],
+            epistemic_type=epistemic_class['type'], meta_path=json_file, layout="orchestrator"
+        )
         
     def _save_session(self, results: Dict):
         """Save complete session summary with epistemic drift analysis"""
@@ -515,6 +784,9 @@ class Orchestrator:
         drift_analysis = self._compute_epistemic_drift(results)
         results['epistemic_drift'] = drift_analysis
 
+        if self.error_handler is not None:
+            results['error_report'] = self.error_handler.generate_error_report()
+
         summary_file = self.vault / f"session_{timestamp}.json"
         summary_file.write_text(json.dumps(results, indent=2))
 
@@ -721,7 +993,9 @@ def run_plan_session(plan_path: str):
     print(f"\n🌀†⟡∞ PULSE MODE: All {len(orch.mirrors)} mirrors fire simultaneously per chamber\n")
 
     # Run session with custom prompts using PULSE architecture
-    asyncio.run(_run_plan_pulse(orch, mirror_lookup, chamber_map, chambers, session_id, plan_path, vault_dir))
+    asyncio.run(run_with_shared_clients(
+        _run_plan_pulse(orch, mirror_lookup, chamber_map, chambers, session_id, plan_path, vault_dir)
+    ))
 
 
 async def _run_plan_pulse(orch, mirror_lookup, chamber_map, chambers, session_id, plan_path, vault_dir):
@@ -791,24 +1065,22 @@ async def _run_plan_pulse(orch, mirror_lookup, chamber_map, chambers, session_id
 async def _execute_pulse_turn(mirror, chamber_id, turn_id, custom_prompt, orch):
     """Execute a single mirror's turn with custom prompt"""
     try:
-        # Temporarily override CHAMBERS
-        original_prompt = CHAMBERS.get(chamber_id)
-        CHAMBERS[chamber_id] = custom_prompt
+        # Custom prompt travels with the call; CHAMBERS is never mutated
+        request = ChamberRequest.for_chamber(chamber_id, custom_prompt)
+        call_start = time.monotonic()
 
-        # Execute in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(None, mirror.send_chamber, chamber_id, turn_id)
+        # Native async call on the shared connection pool
+        response = await orch._call_mirror_async(mirror, chamber_id, turn_id, request)
 
-        # Save individual turn
+        # Save individual turn as soon as this mirror is done
         orch._save_turn(mirror, chamber_id, response)
-
-        # Restore original
-        if original_prompt:
-            CHAMBERS[chamber_id] = original_prompt
+        orch._emit_turn(mirror, chamber_id, turn_id, response=response,
+                        elapsed=time.monotonic() - call_start)
 
         return response
 
     except Exception as e:
+        orch._emit_turn(mirror, chamber_id, turn_id, error=str(e))
         return {
             "error": str(e),
             "chamber": chamber_id,
@@ -916,9 +1188,8 @@ def run_gsw_session(plan_path: str):
         print(f"{chamber_id}: {', '.join(targets)}")
         print(f"{'='*60}\n")
 
-        # Override chamber prompt temporarily
-        original_prompt = CHAMBERS.get(chamber_id)
-        CHAMBERS[chamber_id] = prompt
+        # Topic-injected prompt is passed per call (no CHAMBERS override)
+        request = ChamberRequest.for_chamber(chamber_id, prompt)
 
         # Collect responses from all mirrors
         chamber_responses = []
@@ -927,7 +1198,7 @@ def run_gsw_session(plan_path: str):
             print(f"  {mirror.model_id}...", end=" ", flush=True)
 
             try:
-                response = mirror.send_chamber(chamber_id, 1)
+                response = mirror.dispatch(chamber_id, 1, request)
                 chamber_responses.append(response)
 
                 # Save to vault
@@ -939,6 +1210,14 @@ def run_gsw_session(plan_path: str):
 
                 json_file = vault_dir / "meta" / f"{mirror.session_id}_{chamber_id}.json"
                 json_file.write_text(json.dumps(response, indent=2))
+                record_turn_safely(
+                    vault_dir, md_file,
+                    session_id=mirror.session_id, mirror=mirror.model_id, turn=response.get('turn_id'),
+                    chamber=chamber_id, timestamp=response.get('timestamp'),
+                    seal=response.get('seal', {}).get('sha256_16'),
+                    epistemic_type=classify_response(response.get('raw_response', ''))['type'],
+                    meta_path=json_file, layout="orchestrator"
+                )
 
                 print("✓")
             except Exception as e:
@@ -949,10 +1228,6 @@ def run_gsw_session(plan_path: str):
                     "chamber": chamber_id
                 })
 
-        # Restore original prompt
-        if original_prompt:
-            CHAMBERS[chamber_id] = original_prompt
-
         # Check advance gate (or success gate for S4)
         if chamber_id == "S4" and "success_gate" in chamber_config:
             gate_config = chamber_config["success_gate"]
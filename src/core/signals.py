@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+IRIS Signal Detector - shared geometry/motion/S4 keyword signals
+
+One definition of the IRIS signature keyword families (geometry, motion and
+the S4 rhythm/center/aperture triple), compiled into a single trie-shaped
+regex automaton that finds every keyword hit in one pass over the text.
+
+Matching is word-boundary aware: a keyword must start at a word boundary and
+end at one, optionally followed by a plain inflection (s, es, d, ed, ing), so
+"rings" and "glowing" count but "during" (ring) and "score" (core) do not.
+Overlapping hits are all reported ("steady pulse" is also "steady" and "pulse").
+
+Usage:
+    from src.core.signals import detect_signals, scan_signals, scan_batch
+
+    flags = detect_signals(text)     # {geometry, motion, s4_attractor, s4_rhythm, ...}
+    scan = scan_signals(text)        # per-category hits with evidence spans
+    scans = scan_batch(texts, processes=8)  # Vault-wide rescans
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Keyword families (single source of truth for every signal tool)
+SIGNAL_KEYWORDS: Dict[str, List[str]] = {
+    "geometry": ["ring", "concentric", "aperture", "iris", "circle", "well", "opening", "oval", "core", "center"],
+    "motion": ["pulse", "pulsing", "ripple", "breathe", "dilate", "dilation", "contract", "contraction",
+               "wave", "thrum", "expand", "reciprocal"],
+    "rhythm": ["rhythm", "pulsing", "reciprocal", "pulse", "waves", "thrum", "steady pulse", "ripples"],
+    "center": ["luminous", "core", "center", "steady", "anchor", "still point", "beacon", "glow", "holds"],
+    "aperture": ["aperture", "opening", "widening", "soften", "inviting", "bloom", "breathing open",
+                 "dilate", "expansion", "pull"],
+}
+
+# The S4 attractor is the co-occurrence of all three components
+S4_COMPONENTS = ("rhythm", "center", "aperture")
+
+# Inflections a keyword may carry and still count as a whole-word hit
+INFLECTIONS = ("", "s", "es", "d", "ed", "ing")
+
+
+class SignalHit(NamedTuple):
+    """One keyword occurrence: category, canonical keyword and text span"""
+    category: str
+    keyword: str
+    start: int
+    end: int
+
+
+@dataclass
+class SignalScan:
+    """All signal hits in one text"""
+    hits: List[SignalHit] = field(default_factory=list)
+    categories: Sequence[str] = ()
+    keyword_order: Dict[str, List[str]] = field(default_factory=dict, repr=False)
+
+    def has(self, category: str) -> bool:
+        return any(hit.category == category for hit in self.hits)
+
+    def count(self, category: str) -> int:
+        """Number of hits (occurrences) in a category"""
+        return sum(hit.category == category for hit in self.hits)
+
+    def keywords(self, category: str) -> List[str]:
+        """Distinct keywords that fired, in keyword-list order"""
+        fired = {hit.keyword for hit in self.hits if hit.category == category}
+        return [k for k in self.keyword_order.get(category, sorted(fired)) if k in fired]
+
+    def spans(self, category: str) -> List[Tuple[int, int]]:
+        """Evidence spans (start, end) for a category, in text order"""
+        return [(hit.start, hit.end) for hit in self.hits if hit.category == category]
+
+    @property
+    def s4_attractor(self) -> bool:
+        return all(self.has(component) for component in S4_COMPONENTS)
+
+    def flags(self) -> Dict[str, bool]:
+        """Signal flags in the gsw_gate.detect_signals() shape"""
+        return {
+            "geometry": self.has("geometry"),
+            "motion": self.has("motion"),
+            "s4_attractor": self.s4_attractor,
+            "s4_rhythm": self.has("rhythm"),
+            "s4_center": self.has("center"),
+            "s4_aperture": self.has("aperture"),
+        }
+
+    def evidence(self, categories: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """category → fired keywords (default: the S4 components)"""
+        return {c: self.keywords(c) for c in (categories or S4_COMPONENTS)}
+
+
+def _trie_pattern(node: Dict) -> str:
+    """Regex for a character trie; longer continuations are tried first"""
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return "(?:" + body + ")?" if "" in node else body
+
+
+class SignalDetector:
+    """
+    Multi-category keyword detector compiled into one automaton
+
+    Every surface form (keyword + inflection) goes into a character trie that
+    becomes a single regex anchored at word starts; a lookahead lets hits
+    overlap. Each matched form maps to the (category, keyword, length) hits
+    it implies, including shorter keywords that are a word-prefix of it.
+    """
+
+    def __init__(self, categories: Optional[Dict[str, Iterable[str]]] = None):
+        categories = categories if categories is not None else SIGNAL_KEYWORDS
+        self.categories = {name: [k.lower() for k in keywords] for name, keywords in categories.items()}
+
+        # Surface form → [(category, keyword)]
+        forms: Dict[str, List[Tuple[str, str]]] = {}
+        for category, keywords in self.categories.items():
+            for keyword in keywords:
+                for suffix in INFLECTIONS:
+                    forms.setdefault(keyword + suffix, []).append((category, keyword))
+
+        # Matched form → hits it implies: (category, keyword, matched length)
+        self._expansions: Dict[str, List[Tuple[str, str, int]]] = {}
+        for form in forms:
+            hits = []
+            for prefix_len in self._word_prefix_lengths(form):
+                for category, keyword in forms.get(form[:prefix_len], []):
+                    hits.append((category, keyword, prefix_len))
+            self._expansions[form] = hits
+
+        trie: Dict = {}
+        for form in forms:
+            node = trie
+            for ch in form:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        self._pattern = re.compile(r"\b(?=(" + _trie_pattern(trie) + r")\b)", re.IGNORECASE)
+
+    @staticmethod
+    def _word_prefix_lengths(form: str) -> List[int]:
+        """Lengths of the form and of each of its leading whole-word prefixes"""
+        return [i for i, ch in enumerate(form) if ch == " "] + [len(form)]
+
+    def scan(self, text: str) -> SignalScan:
+        """Every hit in `text`, in text order, in one pass"""
+        hits = []
+        for match in self._pattern.finditer(text):
+            start = match.start(1)
+            for category, keyword, length in self._expansions[match.group(1).lower()]:
+                hits.append(SignalHit(category, keyword, start, start + length))
+        return SignalScan(hits=hits, categories=tuple(self.categories), keyword_order=self.categories)
+
+    def scan_batch(
+        self, texts: Iterable[str], processes: Optional[int] = None, chunksize: int = 64
+    ) -> List[SignalScan]:
+        """
+        Scan many texts, optionally fanned out over a process pool.
+
+        Args:
+            texts: Texts to scan (e.g. every scroll in a vault)
+            processes: Worker processes; None or 1 scans in-process
+            chunksize: Texts per worker task (amortizes pickling overhead)
+
+        Returns:
+            List of SignalScan, in input order
+        """
+        texts = list(texts)
+        if not processes or processes <= 1 or len(texts) <= chunksize:
+            return [self.scan(text) for text in texts]
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            return list(executor.map(self.scan, texts, chunksize=chunksize))
+
+
+# Shared default detector over SIGNAL_KEYWORDS
+DEFAULT_DETECTOR = SignalDetector()
+
+
+def scan_signals(text: str) -> SignalScan:
+    """Scan `text` with the shared keyword families"""
+    return DEFAULT_DETECTOR.scan(text)
+
+
+def detect_signals(text: str) -> Dict[str, bool]:
+    """
+    Detect IRIS signature signals in text.
+
+    Returns:
+        Dictionary with geometry, motion, s4_attractor, s4_rhythm,
+        s4_center and s4_aperture flags
+    """
+    return DEFAULT_DETECTOR.scan(text).flags()
+
+
+def scan_batch(
+    texts: Iterable[str], processes: Optional[int] = None, chunksize: int = 64
+) -> List[SignalScan]:
+    """scan_signals() over many texts (see SignalDetector.scan_batch)"""
+    return DEFAULT_DETECTOR.scan_batch(texts, processes=processes, chunksize=chunksize)
+
+
+def s4_attractor_ratio(scans: Iterable[SignalScan]) -> float:
+    """Fraction of scanned texts carrying the full S4 attractor triple"""
+    scans = list(scans)
+    return sum(scan.s4_attractor for scan in scans) / len(scans) if scans else 0.0
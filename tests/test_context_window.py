@@ -0,0 +1,144 @@
+"""
+Unit tests for the bounded context window (src/core/context_window.py).
+
+Test Coverage:
+- Recent turns verbatim, older turns folded into a cached summary
+- Token budget holding prompt size flat over a long session
+- Meta-pulse mirrors sending bounded history and restoring it on resume
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.context_window import ContextBudget, ContextWindow, summarize_turn
+from tools.rate_limiter import estimate_tokens
+
+
+def turn_text(turn, length=2000):
+    """A long response whose first sentence names its turn"""
+    return f"Turn {turn} finding. " + ("Rhythm, center, aperture. " * length)[:length]
+
+
+def history_tokens(messages):
+    return estimate_tokens(*(m["content"] for m in messages))
+
+
+class TestWindow:
+    """Test the bounded history view."""
+
+    def test_short_history_is_verbatim(self):
+        window = ContextWindow(ContextBudget(keep_turns=3))
+        window.append("p1", "r1")
+        window.append("p2", "r2")
+
+        assert window.messages() == [
+            {"role": "user", "content": "p1"},
+            {"role": "assistant", "content": "r1"},
+            {"role": "user", "content": "p2"},
+            {"role": "assistant", "content": "r2"},
+        ]
+
+    def test_older_turns_fold_into_summary(self):
+        """
+        Given: Six turns and a window keeping the last two verbatim
+        When: The history is rendered
+        Then: A summary exchange covers turns 1-4, then turns 5-6 follow verbatim
+        """
+        window = ContextWindow(ContextBudget(keep_turns=2, summary_chars=80))
+        for turn in range(1, 7):
+            window.append(f"prompt {turn}", turn_text(turn))
+
+        messages = window.messages()
+
+        assert [m["role"] for m in messages] == ["user", "assistant"] * 3
+        assert "- Turn 1: Turn 1 finding." in messages[0]["content"]
+        assert "- Turn 4:" in messages[0]["content"]
+        assert "- Turn 5:" not in messages[0]["content"]
+        assert messages[2]["content"] == "prompt 5"
+        assert messages[5]["content"] == turn_text(6)
+
+    def test_summaries_are_computed_once_per_turn(self):
+        calls = []
+
+        def summarize(prompt, response, max_chars):
+            calls.append(prompt)
+            return response[:max_chars]
+
+        window = ContextWindow(ContextBudget(keep_turns=1), summarize=summarize)
+        for turn in range(1, 5):
+            window.append(f"prompt {turn}", f"response {turn}")
+            window.messages()
+
+        assert calls == ["prompt 1", "prompt 2", "prompt 3"]
+
+    def test_budget_keeps_prompt_size_flat(self):
+        """
+        Given: A 100-turn session with ~500-token responses and a 3,000-token budget
+        When: The history is rendered after every turn
+        Then: It never exceeds the budget and keeps the latest turn verbatim
+        """
+        window = ContextWindow(ContextBudget(max_tokens=3000, keep_turns=3, summary_chars=200))
+        for turn in range(1, 101):
+            window.append(f"prompt {turn}", turn_text(turn))
+            messages = window.messages()
+            assert history_tokens(messages) <= 3000
+            assert messages[-1]["content"] == turn_text(turn)
+
+        assert "earlier turns omitted" in messages[0]["content"]
+
+    def test_summarize_turn_cuts_at_sentence(self):
+        text = "# Heading\n\n**First** sentence here. Second sentence is longer than the rest of it."
+        assert summarize_turn("p", text, max_chars=40) == "Heading First sentence here."
+        assert summarize_turn("p", "short", max_chars=40) == "short"
+
+
+class TestMetaPulseMirror:
+    """Test meta-pulse mirrors with a context window."""
+
+    def test_call_sends_bounded_history(self, temp_dir, monkeypatch):
+        """
+        Given: A Claude mirror keeping one turn verbatim
+        When: Three calls are made
+        Then: The third request carries a summary, the last turn and the new prompt
+        """
+        from src.core import iris_meta_pulse_runner as runner
+
+        requests = []
+
+        class FakeMessages:
+            async def create(self, model, max_tokens, messages):
+                requests.append(messages)
+                return SimpleNamespace(content=[SimpleNamespace(text=f"reply {len(requests)}")])
+
+        monkeypatch.setattr(runner.anthropic, "AsyncAnthropic",
+                            lambda api_key=None: SimpleNamespace(messages=FakeMessages()))
+        config = dict(runner.MIRRORS["claude"], context={"keep_turns": 1})
+        mirror = runner.Mirror("claude", config, session_id="TEST")
+
+        async def session():
+            for turn in (1, 2, 3):
+                await mirror.call(f"prompt {turn}")
+
+        asyncio.run(session())
+
+        assert [m["content"] for m in requests[2][2:]] == ["prompt 2", "reply 2", "prompt 3"]
+        assert "- Turn 1: reply 1" in requests[2][0]["content"]
+        assert len(mirror.context) == 3
+
+    def test_restore_history_from_scrolls(self, temp_dir, monkeypatch):
+        from src.core import iris_meta_pulse_runner as runner
+
+        monkeypatch.chdir(temp_dir)
+        mirror = runner.Mirror("gpt4o", runner.MIRRORS["gpt4o"], session_id="TEST")
+        mirror.save_turn(1, "prompt 1", "response 1")
+        mirror.save_turn(2, "prompt 2", "response 2")
+
+        restored = runner.Mirror("gpt4o", runner.MIRRORS["gpt4o"], session_id="TEST")
+        restored.restore_history([1, 2])
+
+        assert restored.context.turns == [("prompt 1", "response 1"), ("prompt 2", "response 2")]
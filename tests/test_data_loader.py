@@ -0,0 +1,195 @@
+"""
+Unit tests for the checkpoint loader (analysis/data_loader.py).
+
+Test Coverage:
+- Each checkpoint parsed once per loader, across probes
+- Probe history from cumulative checkpoints (one response per iteration/architecture)
+- Thread-pool parsing and filtered response queries
+- Columnar index persistence and invalidation when checkpoints change
+- Append-only JSONL checkpoint logs and their compaction
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Add analysis directory to path for imports
+sys.path.insert(0, str(ROOT / "analysis"))
+
+from data_loader import (
+    CHECKPOINT_LOG,
+    INDEX_FILENAME,
+    DataLoader,
+    append_checkpoint,
+    compact_checkpoint_log,
+    read_checkpoint_log,
+)
+
+ARCHITECTURES = ["claude", "gpt", "grok"]
+PROBES = ["PROBE_1", "PROBE_2"]
+
+
+def response(probe_id: str, iteration: int, architecture: str) -> dict:
+    return {
+        "probe_id": probe_id,
+        "iteration": iteration,
+        "architecture": architecture,
+        "model": f"{architecture}-test",
+        "response": f"{architecture} on {probe_id}, iteration {iteration}: mass is information.",
+        "timestamp": f"2026-01-09T00:0{iteration}:00",
+        "prompt": f"Prompt for {probe_id}",
+    }
+
+
+def write_cumulative_session(session_dir: Path, iterations: int = 3):
+    """Checkpoints in the ConvergenceProtocol layout: each repeats earlier iterations."""
+    for iteration in range(1, iterations + 1):
+        (session_dir / f"checkpoint_{iteration:03d}.json").write_text(json.dumps({
+            "session_id": "TEST_SESSION",
+            "iteration": iteration,
+            "timestamp": f"2026-01-09T00:0{iteration}:30",
+            "architectures": ARCHITECTURES,
+            "probe_results": {
+                probe_id: [response(probe_id, it, arch)
+                           for it in range(1, iteration + 1) for arch in ARCHITECTURES]
+                for probe_id in PROBES
+            },
+        }))
+
+
+class CountingLoader(DataLoader):
+    """DataLoader that counts checkpoint parses."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parsed = []
+
+    def load_checkpoint(self, checkpoint_path):
+        self.parsed.append(checkpoint_path.name)
+        return super().load_checkpoint(checkpoint_path)
+
+
+class TestSinglePass:
+    """Test that every checkpoint is parsed once."""
+
+    def test_all_probes_share_one_parse(self, temp_dir):
+        """
+        Given: Three cumulative checkpoints with two probes
+        When: Probe ids, architectures and every probe's history are loaded
+        Then: Each checkpoint file is parsed exactly once
+        """
+        write_cumulative_session(temp_dir)
+        loader = CountingLoader(temp_dir, persist_index=False)
+
+        assert loader.get_probe_ids() == PROBES
+        assert loader.get_architectures() == ARCHITECTURES
+        for probe_id in PROBES:
+            loader.load_probe_history(probe_id)
+
+        assert sorted(loader.parsed) == ["checkpoint_001.json", "checkpoint_002.json", "checkpoint_003.json"]
+
+    def test_history_has_one_response_per_architecture(self, temp_dir):
+        write_cumulative_session(temp_dir)
+        history = DataLoader(temp_dir, workers=3, persist_index=False).load_probe_history("PROBE_1")
+
+        assert list(history) == [1, 2, 3]
+        for iteration, responses in history.items():
+            assert sorted(r.architecture for r in responses) == ARCHITECTURES
+            assert {r.iteration for r in responses} == {iteration}
+
+    def test_get_responses_filters(self, temp_dir):
+        write_cumulative_session(temp_dir)
+        loader = DataLoader(temp_dir, persist_index=False)
+
+        responses = loader.get_responses(probe_id="PROBE_2", architecture="gpt")
+
+        assert [r.iteration for r in responses] == [1, 2, 3]
+        assert len(loader.get_responses(iteration=2)) == len(PROBES) * len(ARCHITECTURES)
+
+
+class TestPersistedIndex:
+    """Test the columnar checkpoint index."""
+
+    def test_reload_skips_json_parsing(self, temp_dir):
+        """
+        Given: A session loaded once (writing checkpoint_index.npz)
+        When: A second loader reads the unchanged session
+        Then: No checkpoint JSON is parsed and the data is identical
+        """
+        write_cumulative_session(temp_dir)
+        first = DataLoader(temp_dir)
+        expected = first.load_all_checkpoints()
+        assert (temp_dir / INDEX_FILENAME).exists()
+
+        second = CountingLoader(temp_dir)
+        assert second.load_all_checkpoints() == expected
+        assert second.load_probe_history("PROBE_2") == first.load_probe_history("PROBE_2")
+        assert second.parsed == []
+
+    def test_changed_checkpoints_invalidate_index(self, temp_dir):
+        write_cumulative_session(temp_dir, iterations=2)
+        DataLoader(temp_dir).load_all_checkpoints()
+
+        write_cumulative_session(temp_dir, iterations=3)
+        loader = CountingLoader(temp_dir)
+
+        assert list(loader.load_probe_history("PROBE_1")) == [1, 2, 3]
+        assert len(loader.parsed) == 3
+
+
+class TestCheckpointLog:
+    """Test the append-only JSONL checkpoint format."""
+
+    @staticmethod
+    def record(iteration: int) -> dict:
+        return {
+            "session_id": "TEST_SESSION",
+            "iteration": iteration,
+            "timestamp": f"2026-01-09T00:0{iteration}:30",
+            "architectures": ARCHITECTURES,
+            "probe_results": {probe_id: [response(probe_id, iteration, arch) for arch in ARCHITECTURES]
+                              for probe_id in PROBES},
+        }
+
+    def test_loader_reads_log_like_cumulative_checkpoints(self, temp_dir):
+        """
+        Given: The same three iterations as cumulative JSON checkpoints and as a JSONL log
+        When: Both sessions are loaded
+        Then: Probe histories are identical
+        """
+        json_dir, log_dir = temp_dir / "json", temp_dir / "log"
+        json_dir.mkdir()
+        log_dir.mkdir()
+        write_cumulative_session(json_dir)
+        for iteration in range(1, 4):
+            append_checkpoint(log_dir / CHECKPOINT_LOG, self.record(iteration))
+
+        from_json = DataLoader(json_dir, persist_index=False)
+        from_log = DataLoader(log_dir, persist_index=False)
+
+        assert from_log.checkpoint_files == [log_dir / CHECKPOINT_LOG]
+        for probe_id in PROBES:
+            assert from_log.load_probe_history(probe_id) == from_json.load_probe_history(probe_id)
+
+    def test_compaction_drops_torn_and_superseded_records(self, temp_dir):
+        """
+        Given: A log with iteration 2 written twice and a torn last line
+        When: The log is compacted
+        Then: One record per iteration remains, the later iteration 2 kept
+        """
+        log_path = temp_dir / CHECKPOINT_LOG
+        rerun = self.record(2)
+        rerun["timestamp"] = "rerun"
+        for record in [self.record(1), self.record(2), rerun]:
+            append_checkpoint(log_path, record)
+        with open(log_path, "a") as f:
+            f.write('{"session_id": "TEST_SESSION", "iter')
+
+        assert compact_checkpoint_log(log_path) == 2
+
+        records = read_checkpoint_log(log_path)
+        assert [r["iteration"] for r in records] == [1, 2]
+        assert records[1]["timestamp"] == "rerun"
+        assert len(log_path.read_text().splitlines()) == 2
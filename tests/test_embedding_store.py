@@ -0,0 +1,110 @@
+"""
+Unit tests for the content-addressed embedding store (analysis/embedding_store.py).
+
+Test Coverage:
+- Keys depend on text and model name
+- Only uncached, distinct texts are encoded, in one batch
+- Persistence across store instances (memory-mapped matrix + index)
+- Recovery from an index that outran the matrix
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+# Add analysis directory to path for imports
+sys.path.insert(0, str(ROOT / "analysis"))
+
+from embedding_store import EmbeddingStore, content_key
+
+
+class FakeEncoder:
+    """Deterministic batched encoder that records each batch."""
+
+    def __init__(self, dim: int = 4):
+        self.dim = dim
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        return np.array([[len(t), t.count("a"), t.count("e"), i] for i, t in enumerate(texts)],
+                        dtype=np.float64)
+
+
+class TestKeys:
+    """Test content addressing."""
+
+    def test_key_changes_with_text_and_model(self):
+        assert content_key("mass", "mini") == content_key("mass", "mini")
+        assert content_key("mass", "mini") != content_key("mass!", "mini")
+        assert content_key("mass", "mini") != content_key("mass", "mpnet")
+
+
+class TestEmbeddingStore:
+    """Test batched embedding and on-disk storage."""
+
+    def test_encodes_only_uncached_texts_in_one_batch(self):
+        """
+        Given: A memory-only store with one text already embedded
+        When: Embedding a list with that text, a new text and a duplicate
+        Then: One batch encodes only the new text, and rows follow input order
+        """
+        store = EmbeddingStore()
+        encode = FakeEncoder()
+        first = store.embed(["alpha"], "mini", encode)
+
+        vectors = store.embed(["beta", "alpha", "beta"], "mini", encode)
+
+        assert encode.batches == [["alpha"], ["beta"]]
+        assert vectors.shape == (3, 4) and vectors.dtype == np.float32
+        np.testing.assert_array_equal(vectors[1], first[0])
+        np.testing.assert_array_equal(vectors[0], vectors[2])
+
+    def test_changed_text_is_never_stale(self):
+        store = EmbeddingStore()
+        encode = FakeEncoder()
+        old = store.embed(["a response"], "mini", encode)[0]
+        new = store.embed(["a revised response"], "mini", encode)[0]
+        assert not np.array_equal(old, new)
+
+    def test_persists_across_instances(self, temp_dir):
+        """
+        Given: A store that embedded two texts to a cache directory
+        When: A new store opens the same directory
+        Then: It returns the same vectors without encoding again
+        """
+        first = EmbeddingStore(temp_dir)
+        expected = first.embed(["alpha", "beta"], "mini", FakeEncoder())
+
+        reopened = EmbeddingStore(temp_dir)
+        encode = FakeEncoder()
+        np.testing.assert_array_equal(reopened.embed(["beta", "alpha"], "mini", encode), expected[::-1])
+        assert encode.batches == []
+        assert (temp_dir / "embeddings.f32").stat().st_size == 2 * 4 * 4
+
+        reopened.embed(["gamma"], "mini", encode)
+        assert len(EmbeddingStore(temp_dir)) == 3
+
+    def test_index_past_matrix_end_is_dropped(self, temp_dir):
+        store = EmbeddingStore(temp_dir)
+        store.embed(["alpha", "beta"], "mini", FakeEncoder())
+
+        # Simulate an append interrupted after the index was written
+        index = json.loads((temp_dir / "index.json").read_text())
+        index["keys"].append(content_key("gamma", "mini"))
+        (temp_dir / "index.json").write_text(json.dumps(index))
+
+        reopened = EmbeddingStore(temp_dir)
+        assert len(reopened) == 2
+        assert content_key("gamma", "mini") not in reopened
+
+    def test_rejects_mismatched_dimensions(self):
+        store = EmbeddingStore()
+        store.put(["k1"], np.zeros((1, 4)))
+        with pytest.raises(ValueError):
+            store.put(["k2"], np.zeros((1, 8)))
@@ -0,0 +1,102 @@
+"""
+Unit tests for the epistemic topology classifier (src/core/epistemic_map.py).
+
+Test Coverage:
+- Single-pass marker and trigger scanning
+- Cross-category overlaps counted once per category
+- Batch classification in-process and over a process pool
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.epistemic_map import (
+    classify_batch,
+    classify_response,
+    detect_triggers,
+    extract_confidence_markers,
+    scan_signals,
+)
+
+
+class TestScanSignals:
+    """Test the combined marker/trigger scanner."""
+
+    def test_counts_each_confidence_band(self):
+        markers, has_triggers = scan_signals("This is clearly established. It likely holds. Perhaps not.")
+
+        assert markers == {"high": 3, "medium": 1, "low": 1}
+        assert not has_triggers
+
+    def test_could_be_counts_as_medium_and_low(self):
+        """
+        Given: "could be" and "might be", which match both the MED and LOW lists
+        When: Scanning once
+        Then: Each phrase adds one medium and one low marker
+        """
+        assert extract_confidence_markers("It could be real, or it might be noise.") == {
+            "high": 0, "medium": 2, "low": 2
+        }
+
+    def test_insufficient_evidence_does_not_hide_evidence_shows(self):
+        """
+        Given: "insufficient evidence shows", overlapping LOW and HIGH phrases
+        When: Scanning once
+        Then: Both phrases are counted
+        """
+        assert extract_confidence_markers("Insufficient evidence shows nothing.") == {
+            "high": 1, "medium": 0, "low": 1
+        }
+
+    def test_negated_copula_is_not_high_confidence(self):
+        assert extract_confidence_markers("The mechanism is unclear.") == {
+            "high": 0, "medium": 0, "low": 1
+        }
+
+    @pytest.mark.parametrize("text,expected", [
+        ("IF ROS rises THEN the channel closes", True),
+        ("Dose exceeds 10 uM", True),
+        ("Stable across all conditions", False),
+    ])
+    def test_triggers_match_keyword_list(self, text, expected):
+        assert scan_signals(text)[1] is expected
+        assert detect_triggers(text) is expected
+
+
+class TestClassifyBatch:
+    """Test batch classification."""
+
+    TEXTS = [
+        "This is **well-established** and **validated** in the literature.",
+        "**IF** threshold is crossed, **THEN** the pathway activates; this is confirmed.",
+        "It is uncertain, unknown and speculative; perhaps a hypothesis.",
+        "",
+    ]
+
+    def test_batch_matches_single_classification(self):
+        assert classify_batch(self.TEXTS) == [classify_response(t) for t in self.TEXTS]
+
+    def test_process_pool_preserves_order(self):
+        """
+        Given: More texts than one chunk
+        When: Classified over two worker processes
+        Then: Results match in-process classification in input order
+        """
+        texts = self.TEXTS * 10
+
+        assert classify_batch(texts, processes=2, chunksize=4) == [classify_response(t) for t in texts]
+
+    def test_widths_override_concept_count(self):
+        results = classify_batch(self.TEXTS[:2], convergence_widths=[40, None])
+
+        assert results[0]["width"] == 40
+        assert results[1]["width"] == classify_response(self.TEXTS[1])["width"]
+
+    def test_mismatched_widths_raise(self):
+        with pytest.raises(ValueError):
+            classify_batch(self.TEXTS, convergence_widths=[1])
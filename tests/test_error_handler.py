@@ -0,0 +1,109 @@
+"""
+Unit tests for async retries in the error handler (tools/error_handler.py).
+
+Test Coverage:
+- Latency percentiles in model health
+- Awaited backoff and retry on transient errors
+- Per-attempt deadlines
+- Hedged duplicate requests for stragglers
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.error_handler import ErrorHandler, RetryableAPICall
+
+
+@pytest.fixture
+def handler():
+    return ErrorHandler(max_retries=3, base_delay=0.001)
+
+
+class TestLatencyTracking:
+    """Test latency samples and percentiles."""
+
+    def test_percentile_requires_minimum_samples(self, handler):
+        handler.record_latency("claude", 1.0)
+        assert handler.latency_percentile("claude", 95) is None
+
+    def test_percentiles_reported_in_model_health(self, handler):
+        """
+        Given: Ten latency samples from 1s to 10s
+        When: Health is inspected
+        Then: p50 and p95 reflect the distribution
+        """
+        for seconds in range(1, 11):
+            handler.record_latency("claude", float(seconds))
+
+        health = handler.model_health["claude"]
+        assert health["latency_p50"] in (5.0, 6.0)
+        assert health["latency_p95"] == 10.0
+
+
+class TestExecuteAsync:
+    """Test RetryableAPICall.execute_async."""
+
+    def test_transient_error_is_retried(self, handler):
+        """
+        Given: A call that fails once with a 503 then succeeds
+        When: execute_async runs it
+        Then: The second attempt's result is returned
+        """
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("503 Service Unavailable")
+            return "ok"
+
+        retry = RetryableAPICall(handler, "claude", "S1", include_error_context=False)
+
+        assert asyncio.run(retry.execute_async(flaky)) == "ok"
+        assert retry.attempt == 2
+        assert handler.model_health["claude"]["transient_errors"] == 1
+
+    def test_attempt_timeout_raises_after_retries(self, handler):
+        """
+        Given: A call that never returns and a 50ms per-attempt deadline
+        When: execute_async runs it
+        Then: Each attempt times out and a TimeoutError is raised after max_retries
+        """
+        async def hang():
+            await asyncio.sleep(10)
+
+        retry = RetryableAPICall(handler, "grok", "S2", include_error_context=False,
+                                 attempt_timeout=0.05)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(retry.execute_async(hang))
+        assert retry.attempt == 3
+
+    def test_straggler_is_hedged(self, handler):
+        """
+        Given: A model whose p95 latency is 20ms and a first call that stalls
+        When: execute_async runs with hedge_percentile=95
+        Then: A duplicate fires and its result wins long before the stall ends
+        """
+        for _ in range(10):
+            handler.record_latency("gemini", 0.02)
+        calls = []
+
+        async def first_call_stalls():
+            calls.append(1)
+            call_number = len(calls)
+            await asyncio.sleep(5 if call_number == 1 else 0.01)
+            return call_number
+
+        retry = RetryableAPICall(handler, "gemini", "S3", include_error_context=False,
+                                 hedge_percentile=95)
+
+        assert asyncio.run(asyncio.wait_for(retry.execute_async(first_call_stalls), 2)) == 2
+        assert retry.hedged
+        assert handler.model_health["gemini"]["hedged_requests"] == 1
@@ -0,0 +1,227 @@
+"""
+Unit tests for the filesystem job queue (job_queue.py).
+
+Test Coverage:
+- Priority ordering and role filtering
+- Atomic claim-by-rename across competing workers
+- Status subdirectories, retries and archiving
+- Journal-backed index, compaction and legacy layout migration
+- Idle-worker wakeup on enqueue (in-process and via the pending/ watcher)
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from job_queue import FSQueue, Job, JobStatus
+
+
+def make_job(role: str = "bug-catcher", priority: int = 50, **kwargs) -> Job:
+    return Job(role=role, description=f"{role} job", command="true", priority=priority, **kwargs)
+
+
+@pytest.fixture
+def queue(temp_dir):
+    return FSQueue(str(temp_dir / "queue"), str(temp_dir / "archive"))
+
+
+class TestDequeueOrder:
+    """Test priority order and role filters."""
+
+    def test_lower_priority_number_first(self, queue):
+        low = queue.enqueue(make_job(priority=90))
+        high = queue.enqueue(make_job(priority=10))
+
+        assert queue.dequeue().id == high
+        assert queue.dequeue().id == low
+        assert queue.dequeue() is None
+
+    def test_role_filter(self, queue):
+        queue.enqueue(make_job(role="bug-catcher", priority=1))
+        wanted = queue.enqueue(make_job(role="doc-writer", priority=99))
+
+        assert queue.dequeue(role_filter="doc-writer").id == wanted
+        assert queue.dequeue(role_filter="doc-writer") is None
+
+    def test_claim_moves_job_to_running(self, queue):
+        job_id = queue.enqueue(make_job())
+
+        job = queue.dequeue()
+
+        assert job.status == JobStatus.RUNNING
+        assert not list(queue.pending_dir.glob("job_*.json"))
+        assert len(list(queue.running_dir.glob(f"job_*{job_id}.json"))) == 1
+
+
+class TestConcurrentClaims:
+    """Test that competing workers never claim the same job."""
+
+    def test_each_job_claimed_exactly_once(self, temp_dir):
+        """
+        Given: 50 jobs and four queue instances (as separate workers would hold)
+        When: Eight threads dequeue until the queue is empty
+        Then: Every job is claimed exactly once
+        """
+        producer = FSQueue(str(temp_dir / "queue"), str(temp_dir / "archive"))
+        ids = {producer.enqueue(make_job(priority=i % 5)) for i in range(50)}
+        queues = [FSQueue(str(temp_dir / "queue"), str(temp_dir / "archive")) for _ in range(4)]
+        claimed = []
+        lock = threading.Lock()
+
+        def worker(q):
+            while True:
+                job = q.dequeue()
+                if job is None:
+                    return
+                with lock:
+                    claimed.append(job.id)
+
+        threads = [threading.Thread(target=worker, args=(queues[i % 4],)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(claimed) == sorted(ids)
+
+    def test_sees_jobs_enqueued_by_other_instance(self, temp_dir):
+        consumer = FSQueue(str(temp_dir / "queue"))
+        assert consumer.dequeue() is None
+
+        job_id = FSQueue(str(temp_dir / "queue")).enqueue(make_job())
+
+        assert consumer.dequeue().id == job_id
+
+
+class TestLifecycle:
+    """Test completion, retries and lookups."""
+
+    def test_complete_moves_job_to_archive(self, queue):
+        job_id = queue.enqueue(make_job())
+        queue.dequeue()
+
+        queue.mark_complete(job_id, result={"ok": True})
+
+        job = queue.get_job(job_id)
+        assert job.status == JobStatus.COMPLETED
+        assert job.result == {"ok": True}
+        assert list(queue.archive_dir.glob(f"*{job_id}*"))
+        assert not list(queue.running_dir.glob("job_*.json"))
+
+    def test_failed_job_with_retries_returns_to_pending(self, queue):
+        job_id = queue.enqueue(make_job(max_retries=2))
+        queue.dequeue()
+
+        retried = queue.mark_failed(job_id, "boom")
+
+        assert retried is not None
+        again = queue.dequeue()
+        assert again.id == job_id
+        assert again.retry_count == 1
+
+        assert queue.mark_failed(job_id, "boom again") is None
+        assert queue.get_job(job_id).status == JobStatus.FAILED
+
+    def test_finished_jobs_deleted_without_archive(self, temp_dir):
+        queue = FSQueue(str(temp_dir / "queue"))
+        job_id = queue.enqueue(make_job())
+
+        queue.cancel_job(job_id)
+
+        assert queue.get_job(job_id) is None
+        assert queue.dequeue() is None
+
+    def test_stats_count_each_state(self, queue):
+        queue.enqueue(make_job())
+        running = queue.enqueue(make_job(priority=1))
+        done = queue.enqueue(make_job(priority=0))
+        queue.dequeue()
+        queue.mark_complete(done)
+        queue.dequeue()
+
+        stats = queue.get_stats()
+
+        assert (stats["pending"], stats["running"], stats["completed"]) == (1, 1, 1)
+        assert queue.get_job(running).status == JobStatus.RUNNING
+
+
+class TestJournal:
+    """Test the append-only journal backing the index."""
+
+    def test_compaction_keeps_one_line_per_job(self, queue):
+        job_id = queue.enqueue(make_job())
+        queue.dequeue()
+        queue.mark_complete(job_id)
+        queue.enqueue(make_job())
+
+        queue.compact_journal()
+
+        lines = [json.loads(l) for l in queue.journal_path.read_text().splitlines()]
+        assert sorted(e["state"] for e in lines) == ["done", "pending"]
+        assert queue.dequeue() is not None
+
+    def test_migrates_legacy_flat_layout(self, temp_dir):
+        """
+        Given: A queue directory written by the flat job_*.json layout
+        When: FSQueue opens it
+        Then: Jobs move into pending/ and can be dequeued
+        """
+        queue_dir = temp_dir / "queue"
+        queue_dir.mkdir()
+        legacy = make_job()
+        (queue_dir / f"job_050_1_{legacy.id}.json").write_text(json.dumps(legacy.to_dict()))
+
+        queue = FSQueue(str(queue_dir))
+
+        assert not list(queue_dir.glob("job_*.json"))
+        assert queue.dequeue().id == legacy.id
+
+
+class TestIdleWakeup:
+    """Test wait_for_jobs wakeups."""
+
+    def test_times_out_without_enqueue(self, queue):
+        token = queue.change_token()
+
+        assert queue.wait_for_jobs(token, timeout=0.05) is False
+        queue.close()
+
+    def test_enqueue_before_wait_is_not_missed(self, queue):
+        """
+        Given: A worker that took its token, then found the queue empty
+        When: A job is enqueued before the worker starts waiting
+        Then: wait_for_jobs returns immediately
+        """
+        token = queue.change_token()
+        assert queue.dequeue() is None
+        queue.enqueue(make_job())
+
+        assert queue.wait_for_jobs(token, timeout=5) is True
+
+    @pytest.mark.parametrize("poll_interval", [0.05])
+    def test_enqueue_from_other_instance_wakes_waiter(self, temp_dir, poll_interval):
+        """
+        Given: An idle worker blocked on one queue instance
+        When: A different instance (as another process would) enqueues a job
+        Then: The pending/ watcher wakes the worker well before the idle timeout
+        """
+        consumer = FSQueue(str(temp_dir / "queue"), poll_interval=poll_interval)
+        producer = FSQueue(str(temp_dir / "queue"))
+        token = consumer.change_token()
+        consumer.wait_for_jobs(token, timeout=0.01)  # Start the watcher
+
+        threading.Timer(0.1, lambda: producer.enqueue(make_job())).start()
+        start = time.monotonic()
+        woke = consumer.wait_for_jobs(consumer.change_token(), timeout=10)
+
+        assert woke
+        assert time.monotonic() - start < 5
+        assert consumer.dequeue() is not None
+        consumer.close()
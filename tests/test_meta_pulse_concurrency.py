@@ -0,0 +1,88 @@
+"""
+Unit tests for concurrent meta-pulse mirrors (src/core/iris_meta_pulse_runner.py).
+
+Test Coverage:
+- One pulse takes the slowest mirror's latency, not the sum
+- Provider clients created once and reused across turns
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core import iris_meta_pulse_runner as runner
+
+LATENCY = 0.3
+
+
+async def reply(text):
+    await asyncio.sleep(LATENCY)
+    return text
+
+
+def fake_clients(created):
+    """Async stand-ins for the four provider clients, counting constructions"""
+
+    def anthropic_client(api_key=None):
+        created.append("claude")
+
+        async def create(model, max_tokens, messages):
+            return SimpleNamespace(content=[SimpleNamespace(text=await reply("claude"))])
+
+        return SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    def openai_client(api_key=None, base_url=None):
+        created.append("grok" if base_url else "gpt4o")
+
+        async def create(model, messages, max_tokens):
+            message = SimpleNamespace(content=await reply(model))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    def gemini_model(model):
+        created.append("gemini")
+
+        async def send_message_async(prompt):
+            return SimpleNamespace(text=await reply("gemini"))
+
+        return SimpleNamespace(start_chat=lambda history: SimpleNamespace(send_message_async=send_message_async))
+
+    return anthropic_client, openai_client, gemini_model
+
+
+class TestPulse:
+    """Test simultaneous pulses."""
+
+    def test_pulses_wait_for_slowest_mirror_and_reuse_clients(self, monkeypatch):
+        """
+        Given: Four mirrors whose providers each take 0.3s
+        When: Two pulses are sent
+        Then: Each pulse takes ~0.3s (not 1.2s) and each client is built once
+        """
+        created = []
+        anthropic_client, openai_client, gemini_model = fake_clients(created)
+        monkeypatch.setattr(runner.anthropic, "AsyncAnthropic", anthropic_client)
+        monkeypatch.setattr(runner.openai, "AsyncOpenAI", openai_client)
+        monkeypatch.setattr(runner.genai, "GenerativeModel", gemini_model)
+        monkeypatch.setattr(runner.genai, "configure", lambda api_key=None: None)
+
+        orchestrator = runner.PulseOrchestrator(session_id="TEST")
+
+        async def two_pulses():
+            started = time.monotonic()
+            responses = [await orchestrator.send_pulse(f"prompt {turn}") for turn in (1, 2)]
+            return responses, time.monotonic() - started
+
+        responses, elapsed = asyncio.run(two_pulses())
+
+        assert elapsed < 2 * LATENCY * 2
+        assert responses[1] == {"claude": "claude", "gpt4o": "gpt-4o-2024-11-20",
+                                "grok": "x-ai/grok-beta", "gemini": "gemini"}
+        assert sorted(created) == ["claude", "gemini", "gpt4o", "grok"]
+        assert len(orchestrator.mirrors["gemini"].context) == 2
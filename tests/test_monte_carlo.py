@@ -0,0 +1,152 @@
+"""
+Unit tests for the batched bioelectric sandbox simulator (sandbox/engines/simulators).
+
+Test Coverage:
+- Struct-of-arrays batch shapes and timepoint lookup
+- Batched dynamics agree with the per-run simulator
+- Array outcome model matches the scalar outcome model
+- Seeded, process-parallel run_full_experiment
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+ROOT = Path(__file__).parent.parent
+
+# Add simulators directory to path for imports
+sys.path.insert(0, str(ROOT / "sandbox" / "engines" / "simulators"))
+
+from monte_carlo import MonteCarloEngine, plan_seed
+from outcome_model import RegenerationOutcomeModel
+from vm_ca_gj_sim import STATE_PARAMS, PerturbationEffect, VMCaGJSimulator
+
+TIMEPOINTS = [0, 2, 6, 24, 168]
+
+
+@pytest.fixture(scope="module")
+def mechanism_map():
+    with open(ROOT / "sandbox" / "engines" / "mechanisms" / "s4_to_bioelectric.yaml") as f:
+        return yaml.safe_load(f)
+
+
+@pytest.fixture(scope="module")
+def simulator(mechanism_map):
+    with open(ROOT / "sandbox" / "states" / "s4_state.openai_gpt-4o.json") as f:
+        s4_state = json.load(f)
+    return VMCaGJSimulator(s4_state, {}, mechanism_map)
+
+
+PERTURBATIONS = [
+    PerturbationEffect("octanol", "aperture", {"permeability": (-0.5, 0.1)}),
+    PerturbationEffect("ivermectin", "center", {"center_stability": (-0.3, 0.1), "depol_mv": (-5.0, 2.0)}),
+]
+
+
+class TestBatchSimulation:
+    """Test simulate_batch."""
+
+    def test_batch_has_one_column_per_parameter(self, simulator):
+        batch = simulator.simulate_batch(PERTURBATIONS, TIMEPOINTS, 100, np.random.default_rng(0))
+
+        assert set(batch.columns) == set(STATE_PARAMS)
+        assert all(v.shape == (100, len(TIMEPOINTS)) for v in batch.columns.values())
+        assert batch.n_runs == 100
+        assert batch.time_index(24) == 3
+        assert batch.state(0, 3).time_hr == 24.0
+
+    def test_missing_timepoint_raises(self, simulator):
+        batch = simulator.simulate_batch([], [0, 2], 5, np.random.default_rng(0))
+
+        with pytest.raises(ValueError):
+            batch.at(6)
+
+    def test_same_seed_is_reproducible(self, simulator):
+        a = simulator.simulate_batch(PERTURBATIONS, TIMEPOINTS, 50, np.random.default_rng(7))
+        b = simulator.simulate_batch(PERTURBATIONS, TIMEPOINTS, 50, np.random.default_rng(7))
+
+        assert all(np.array_equal(a.columns[p], b.columns[p]) for p in STATE_PARAMS)
+
+    def test_batch_matches_per_run_simulator(self, simulator):
+        """
+        Given: The same perturbations
+        When: 4000 runs are simulated per-run and batched
+        Then: Per-parameter means agree at every timepoint
+        """
+        rng = np.random.default_rng(1)
+        runs = [simulator.simulate_timecourse(PERTURBATIONS, TIMEPOINTS, rng) for _ in range(4000)]
+        batch = simulator.simulate_batch(PERTURBATIONS, TIMEPOINTS, 4000, np.random.default_rng(2))
+
+        for param in STATE_PARAMS:
+            scalar = np.array([[getattr(s, param) for s in run] for run in runs])
+            spread = np.std(scalar, axis=0) + 1e-9
+            assert np.all(np.abs(scalar.mean(axis=0) - batch.columns[param].mean(axis=0)) < 0.1 * spread + 1e-6)
+
+
+class TestBatchOutcomes:
+    """Test the array-input outcome model."""
+
+    def test_predict_batch_matches_scalar_model(self, simulator, mechanism_map):
+        batch = simulator.simulate_batch(PERTURBATIONS, TIMEPOINTS, 20, np.random.default_rng(3))
+        model = RegenerationOutcomeModel(mechanism_map)
+
+        arrays = model.predict_batch(batch.at(6), batch.at(24))
+
+        for run in range(20):
+            scalar = model.predict_probability(batch.state(run, 2), batch.state(run, 3))
+            for key, value in scalar.items():
+                assert arrays[key][run] == pytest.approx(value)
+
+    def test_summary_statistics(self, mechanism_map):
+        summary = RegenerationOutcomeModel.summarize({"regeneration_7d": np.linspace(0, 1, 101)})
+
+        assert summary["regeneration_7d"]["mean"] == pytest.approx(0.5)
+        assert summary["regeneration_7d"]["median"] == pytest.approx(0.5)
+        assert summary["regeneration_7d"]["ci_lower"] == pytest.approx(0.025)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.chdir(ROOT)  # Resources are loaded relative to the repo root
+    return MonteCarloEngine({})
+
+
+def small_plan(seed=None):
+    plan = {
+        "plan_id": "TEST_PLAN",
+        "mirrors": ["openai_gpt-4o", "anthropic_claude-sonnet-4.5"],
+        "conditions": [{"label": "control", "perturbations": []}, {"label": "control_2", "perturbations": []}],
+        "runs": 50,
+    }
+    if seed is not None:
+        plan["seed"] = seed
+    return plan
+
+
+class TestRunFullExperiment:
+    """Test seeding and process-pool fan-out."""
+
+    def test_plan_seed_is_stable_without_explicit_seed(self):
+        assert plan_seed(small_plan()) == plan_seed(small_plan())
+        assert plan_seed(small_plan(seed=5)) == 5
+
+    def test_parallel_matches_serial_exactly(self, engine, temp_dir):
+        """
+        Given: A 2 mirror × 2 condition plan with a fixed seed
+        When: It runs serially and on two worker processes
+        Then: Results are identical
+        """
+        serial = engine.run_full_experiment(small_plan(seed=11), temp_dir / "serial", workers=1)
+        parallel = engine.run_full_experiment(small_plan(seed=11), temp_dir / "parallel", workers=2)
+
+        assert json.dumps(serial, sort_keys=True) == json.dumps(parallel, sort_keys=True)
+
+    def test_cells_get_independent_streams(self, engine, temp_dir):
+        results = engine.run_full_experiment(small_plan(seed=11), temp_dir, workers=1)
+        cells = results["mirrors"]["openai_gpt-4o"]
+
+        assert cells["control"]["outcomes"] != cells["control_2"]["outcomes"]
@@ -0,0 +1,217 @@
+"""
+Unit tests for the orchestrator runner (orchestrator_runner.py).
+
+Test Coverage:
+- Merge gate DAG validation and ordering
+- Parallel execution of independent gates
+- Fail-fast cancellation of sibling gates
+- Gate result cache keyed by tree hash and command
+- Worktree pool reuse, reset, size bound and stale eviction
+"""
+
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from orchestrator_runner import MergeGateRunner, WorktreeManager
+
+logger = logging.getLogger("test_orchestrator_runner")
+
+
+def gate(name, command, **kwargs):
+    return {"name": name, "type": "shell", "command": command, "timeout": 30, **kwargs}
+
+
+class TestGateDag:
+    """Test gate dependency handling."""
+
+    def test_unknown_dependency_rejected(self):
+        with pytest.raises(ValueError):
+            MergeGateRunner([gate("a", "true", depends_on=["missing"])], logger)
+
+    def test_cycle_rejected(self):
+        with pytest.raises(ValueError):
+            MergeGateRunner([
+                gate("a", "true", depends_on=["b"]),
+                gate("b", "true", depends_on=["a"]),
+            ], logger)
+
+    def test_dependent_gate_runs_after_its_dependency(self, temp_dir):
+        """
+        Given: Gate "check" depends on gate "write"
+        When: Gates run
+        Then: "check" sees the file "write" produced
+        """
+        runner = MergeGateRunner([
+            gate("check", "test -f marker", depends_on=["write"]),
+            gate("write", "sleep 0.2 && touch marker"),
+        ], logger)
+
+        passed, results = runner.run_gates(temp_dir)
+        assert passed
+        assert results["check"]["status"] == "passed"
+
+
+class TestParallelGates:
+    """Test parallel execution and fail-fast."""
+
+    def test_independent_gates_run_concurrently(self, temp_dir):
+        runner = MergeGateRunner([gate(f"g{i}", "sleep 0.5") for i in range(4)], logger)
+
+        start = time.monotonic()
+        assert runner.run_gates(temp_dir)[0]
+
+        assert time.monotonic() - start < 1.5
+
+    def test_required_failure_cancels_siblings(self, temp_dir):
+        """
+        Given: A fast failing gate, a slow sibling and a gate depending on the slow one
+        When: Gates run
+        Then: The slow gate is killed and its dependent never starts
+        """
+        runner = MergeGateRunner([
+            gate("fails", "exit 1"),
+            gate("slow", "sleep 20"),
+            gate("after", "true", depends_on=["slow"]),
+        ], logger)
+
+        start = time.monotonic()
+        passed, results = runner.run_gates(temp_dir)
+
+        assert not passed
+        assert time.monotonic() - start < 10
+        assert results["fails"]["status"] == "failed"
+        assert results["slow"]["status"] == "cancelled"
+        assert results["after"]["status"] == "cancelled"
+
+    def test_concurrent_runs_keep_their_own_results(self, temp_dir):
+        """
+        Given: One runner shared by two workers, one worktree passing and one failing
+        When: Both run gates at the same time
+        Then: Each call returns its own worktree's results
+        """
+        runner = MergeGateRunner([gate("check", "sleep 0.3 && test -f ok")], logger)
+        good, bad = temp_dir / "good", temp_dir / "bad"
+        good.mkdir()
+        bad.mkdir()
+        (good / "ok").touch()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            good_run, bad_run = pool.map(runner.run_gates, [good, bad])
+
+        assert good_run[0] and good_run[1]["check"]["status"] == "passed"
+        assert not bad_run[0] and bad_run[1]["check"]["status"] == "failed"
+
+    def test_optional_failure_does_not_block_merge(self, temp_dir):
+        runner = MergeGateRunner([gate("lint", "exit 1", required=False), gate("test", "true")], logger)
+
+        assert runner.run_gates(temp_dir)[0]
+
+
+class TestGateCache:
+    """Test tree-hash keyed caching of passing gates."""
+
+    def test_same_tree_reuses_result(self, mock_git_repo):
+        """
+        Given: A gate that appends to a counter file outside the tree
+        When: Gates run twice on an unchanged tree, then after an edit
+        Then: The gate executes once per distinct tree
+        """
+        counter = mock_git_repo / ".git" / "runs.txt"
+        runner = MergeGateRunner(
+            [gate("count", f"echo run >> {counter}")],
+            logger,
+            cache_dir=str(mock_git_repo / ".git" / "gate_cache"),
+        )
+
+        assert runner.run_gates(mock_git_repo)[0]
+        passed, results = runner.run_gates(mock_git_repo)
+        assert passed
+        assert results["count"].get("cached")
+        assert counter.read_text().count("run") == 1
+
+        (mock_git_repo / "new_file.py").write_text("x = 1\n")
+        assert runner.run_gates(mock_git_repo)[0]
+        assert counter.read_text().count("run") == 2
+
+    def test_tree_hash_ignores_real_index(self, mock_git_repo):
+        runner = MergeGateRunner([], logger)
+        (mock_git_repo / "untracked.txt").write_text("hello\n")
+
+        first = runner.tree_hash(mock_git_repo)
+
+        assert first and first == runner.tree_hash(mock_git_repo)
+        import git
+        assert not git.Repo(mock_git_repo).index.entries.get(("untracked.txt", 0))
+
+
+@pytest.fixture
+def worktree_mgr(mock_git_repo, monkeypatch):
+    monkeypatch.chdir(mock_git_repo)
+    return WorktreeManager(str(mock_git_repo / ".ork" / "worktrees"), logger, pool_size=1)
+
+
+class TestWorktreePool:
+    """Test worktree reuse across jobs."""
+
+    def test_released_worktree_is_reused_clean(self, worktree_mgr):
+        """
+        Given: A job that left a modified and an untracked file in its worktree
+        When: The next job for the same role acquires a worktree
+        Then: It gets the same directory, reset to HEAD with no leftovers
+        """
+        first = worktree_mgr.acquire_worktree("bug-catcher", "job-1")
+        (first / "README.md").write_text("scribbled\n")
+        (first / "leftover.txt").write_text("junk\n")
+        worktree_mgr.release_worktree("bug-catcher", first)
+
+        second = worktree_mgr.acquire_worktree("bug-catcher", "job-2")
+
+        assert second == first
+        assert (second / "README.md").read_text() == "# Test Repository\n"
+        assert not (second / "leftover.txt").exists()
+
+    def test_pools_are_per_role(self, worktree_mgr):
+        first = worktree_mgr.acquire_worktree("bug-catcher", "job-1")
+        worktree_mgr.release_worktree("bug-catcher", first)
+
+        other = worktree_mgr.acquire_worktree("doc-writer", "job-2")
+
+        assert other != first
+
+    def test_pool_size_bounds_idle_worktrees(self, worktree_mgr):
+        a = worktree_mgr.acquire_worktree("bug-catcher", "job-1")
+        b = worktree_mgr.acquire_worktree("bug-catcher", "job-2")
+
+        worktree_mgr.release_worktree("bug-catcher", a)
+        worktree_mgr.release_worktree("bug-catcher", b)
+
+        assert a.exists()
+        assert not b.exists()
+
+    def test_stale_idle_worktree_evicted(self, worktree_mgr):
+        path = worktree_mgr.acquire_worktree("bug-catcher", "job-1")
+        worktree_mgr.release_worktree("bug-catcher", path)
+        old = time.time() - 48 * 3600
+        os.utime(path, (old, old))
+
+        worktree_mgr.cleanup_stale_worktrees(max_age_hours=24)
+
+        assert not path.exists()
+        assert worktree_mgr.acquire_worktree("bug-catcher", "job-2") != path
+
+    def test_pooled_worktrees_adopted_on_restart(self, worktree_mgr):
+        path = worktree_mgr.acquire_worktree("bug-catcher", "job-1")
+        worktree_mgr.release_worktree("bug-catcher", path)
+
+        restarted = WorktreeManager(str(worktree_mgr.base_dir), logger, pool_size=1)
+
+        assert restarted.acquire_worktree("bug-catcher", "job-2") == path
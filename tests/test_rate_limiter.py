@@ -0,0 +1,145 @@
+"""
+Unit tests for provider rate limiting (tools/rate_limiter.py).
+
+Test Coverage:
+- Token bucket refill and wait times
+- Concurrency cap for sync and async callers
+- AIMD decrease on rate-limit errors
+- Process-wide limiter registry and env overrides
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.rate_limiter import (
+    ProviderLimiter,
+    ProviderLimits,
+    TokenBucket,
+    estimate_tokens,
+    get_limiter,
+)
+
+
+def make_limiter(concurrency: int = 2, rpm: float = 6000, tpm: float = 1e9) -> ProviderLimiter:
+    return ProviderLimiter("test", ProviderLimits(
+        requests_per_minute=rpm, tokens_per_minute=tpm, max_concurrency=concurrency
+    ))
+
+
+class TestTokenBucket:
+    """Test continuous-refill token bucket."""
+
+    def test_full_bucket_admits_immediately(self):
+        """
+        Given: A fresh bucket
+        When: Asking for fewer tokens than capacity
+        Then: No wait is required
+        """
+        bucket = TokenBucket(rate_per_minute=60)
+        assert bucket.wait_time(10, time.monotonic()) == 0.0
+
+    def test_drained_bucket_reports_refill_time(self):
+        """
+        Given: A bucket refilling at 1 token/second that has been drained
+        When: Asking for 2 tokens
+        Then: The wait is about 2 seconds
+        """
+        bucket = TokenBucket(rate_per_minute=60)
+        now = time.monotonic()
+        bucket.wait_time(60, now)
+        bucket.consume(60)
+
+        assert bucket.wait_time(2, now) == pytest.approx(2.0, rel=0.05)
+
+
+class TestConcurrencyControl:
+    """Test slot admission and AIMD feedback."""
+
+    def test_async_slots_never_exceed_concurrency(self):
+        """
+        Given: A limiter with concurrency 2
+        When: Eight async calls run through slot_async
+        Then: At most two are in flight at once
+        """
+        limiter = make_limiter(concurrency=2)
+        active, peak = [0], [0]
+
+        async def call():
+            async with limiter.slot_async(10):
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.02)
+                active[0] -= 1
+
+        async def main():
+            await asyncio.gather(*[call() for _ in range(8)])
+
+        asyncio.run(main())
+
+        assert peak[0] == 2
+        assert limiter.in_flight == 0
+
+    def test_sync_slots_never_exceed_concurrency(self):
+        """
+        Given: A limiter with concurrency 1
+        When: Four threads call through slot()
+        Then: Calls are serialized
+        """
+        limiter = make_limiter(concurrency=1)
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def call():
+            with limiter.slot():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.01)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak[0] == 1
+
+    def test_rate_limit_error_halves_concurrency(self):
+        """
+        Given: A limiter at concurrency 8
+        When: A call fails with a 429 error
+        Then: Concurrency halves, the error propagates and the slot is released
+        """
+        limiter = make_limiter(concurrency=8)
+
+        with pytest.raises(RuntimeError):
+            with limiter.slot():
+                raise RuntimeError("Error code: 429 - rate limit exceeded")
+
+        assert limiter.concurrency == pytest.approx(4.0)
+        assert limiter.stats["rate_limited"] == 1
+        assert limiter.in_flight == 0
+
+
+class TestRegistry:
+    """Test process-wide limiter lookup."""
+
+    def test_get_limiter_returns_shared_instance(self):
+        assert get_limiter("anthropic") is get_limiter("anthropic")
+
+    def test_env_overrides_default_limits(self, monkeypatch):
+        monkeypatch.setenv("IRIS_RATE_UNITTESTPROVIDER_CONCURRENCY", "3")
+        assert get_limiter("unittestprovider").limits.max_concurrency == 3
+
+    def test_estimate_tokens_counts_prompt_and_output_budget(self):
+        assert estimate_tokens("a" * 400, max_tokens=100) == 200
@@ -0,0 +1,142 @@
+"""
+Unit tests for the record/replay response cache (tools/response_cache.py).
+
+Test Coverage:
+- off / record / replay / read-through modes
+- Key parts (prompt, temperature, sample) and async calls
+- Orchestrator mirrors replaying recorded chamber responses offline
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.response_cache import CacheMiss, ResponseCache, cache_key
+
+
+class CountingFetch:
+    """Live-call stand-in returning a new response per call"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return f"live response {self.calls}"
+
+
+def call(cache, fetch, user="Hold: 'concentric rings'.", temperature=0.3, sample=None):
+    return cache.call("openai", "gpt-4o", "system", user, temperature, 2048, fetch=fetch, sample=sample)
+
+
+class TestModes:
+    """Test cache modes."""
+
+    def test_read_through_serves_stored_responses(self, temp_dir):
+        """
+        Given: A read-through cache
+        When: The same call is made twice, then with a different temperature
+        Then: The provider is called once for the repeat and again for the new key
+        """
+        cache = ResponseCache(temp_dir / "cache.sqlite", mode="read-through")
+        fetch = CountingFetch()
+
+        assert call(cache, fetch) == "live response 1"
+        assert call(cache, fetch) == "live response 1"
+        assert call(cache, fetch, temperature=0.7) == "live response 2"
+        assert (fetch.calls, cache.hits, cache.misses) == (2, 1, 2)
+
+    def test_record_then_replay_offline(self, temp_dir):
+        path = temp_dir / "cache.sqlite"
+        fetch = CountingFetch()
+        recorder = ResponseCache(path, mode="record")
+        call(recorder, fetch)
+        call(recorder, fetch)  # Record always calls and overwrites
+
+        replay = ResponseCache(path, mode="replay")
+        offline = CountingFetch()
+
+        assert call(replay, offline) == "live response 2"
+        assert offline.calls == 0
+        with pytest.raises(CacheMiss):
+            call(replay, offline, user="A prompt never recorded")
+
+    def test_off_never_stores(self, temp_dir):
+        cache = ResponseCache(temp_dir / "cache.sqlite", mode="off")
+        fetch = CountingFetch()
+        call(cache, fetch)
+        call(cache, fetch)
+
+        assert fetch.calls == 2
+        assert not (temp_dir / "cache.sqlite").exists()
+
+    def test_samples_keep_repeated_prompts_apart(self, temp_dir):
+        """
+        Given: The same seed sent on turns 1 and 2 (a bioelectric run)
+        When: Both are recorded with the turn as sample, then replayed
+        Then: Each turn replays its own response
+        """
+        path = temp_dir / "cache.sqlite"
+        recorder = ResponseCache(path, mode="record")
+        fetch = CountingFetch()
+        for turn in (1, 2):
+            call(recorder, fetch, sample=turn)
+
+        replay = ResponseCache(path, mode="replay")
+        assert [call(replay, CountingFetch(), sample=turn) for turn in (1, 2)] \
+            == ["live response 1", "live response 2"]
+        assert cache_key("a", "m", "s", "u", 0.3, 10) != cache_key("a", "m", "s", "u", 0.3, 10, sample=1)
+
+    def test_call_async(self, temp_dir):
+        cache = ResponseCache(temp_dir / "cache.sqlite", mode="read-through")
+        fetch = CountingFetch()
+
+        async def fetch_async():
+            return fetch()
+
+        async def run():
+            return [await cache.call_async("xai", "grok", None, "probe", None, 3000, fetch=fetch_async)
+                    for _ in range(3)]
+
+        assert asyncio.run(run()) == ["live response 1"] * 3
+        assert fetch.calls == 1
+
+
+class TestOrchestratorReplay:
+    """Test orchestrator mirrors with a response cache."""
+
+    def test_dispatch_replays_recorded_chamber(self, temp_dir, monkeypatch):
+        """
+        Given: A mirror whose S1 response was recorded
+        When: It dispatches S1 again in replay mode with the provider unreachable
+        Then: The recorded text comes back packaged as a fresh turn record
+        """
+        from src.core.iris_orchestrator import Mirror
+
+        class EchoMirror(Mirror):
+            def __init__(self, reply):
+                super().__init__("ollama/echo")
+                self.reply = reply
+
+            def send_chamber(self, chamber, turn_id, request=None):
+                if self.reply is None:
+                    raise ConnectionError("provider unreachable")
+                return self._package_response(chamber, turn_id, self.reply)
+
+        path = temp_dir / "cache.sqlite"
+        monkeypatch.setenv("IRIS_RESPONSE_CACHE_PATH", str(path))
+
+        monkeypatch.setenv("IRIS_RESPONSE_CACHE", "record")
+        EchoMirror("Three breaths; a soft ring.").dispatch("S1", 1)
+
+        monkeypatch.setenv("IRIS_RESPONSE_CACHE", "replay")
+        response = EchoMirror(None).dispatch("S1", 1)
+
+        assert response["raw_response"] == "Three breaths; a soft ring."
+        assert response["condition"] == "IRIS_S1"
+        assert response["seal"]["sha256_16"]
@@ -0,0 +1,252 @@
+"""
+Unit tests for the in-process CBD selectivity simulator
+(sandbox/engines/simulators/selectivity.py, pipelines/run_selectivity_sweep.py).
+
+Test Coverage:
+- Hill curves and IC50 interpolation
+- Dose-response selectivity on a shared MonteCarloEngine
+- Batch results keyed by combination_id with one output directory each
+- Pipeline metrics read from the combination's own directory
+- Each combination simulated on the S4 priors of its own session
+- Successive halving and the adaptive sweep mode
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+# Add simulators directory to path for imports
+sys.path.insert(0, str(ROOT / "sandbox" / "engines" / "simulators"))
+
+from monte_carlo import MonteCarloEngine
+from selectivity import SelectivitySimulator, hill, interpolate_dose, successive_halving
+
+
+def make_plan(combination_id: str, vdac1_affinity=200.0, mcu_block_strength=50.0, chloride_ic50=5.0):
+    return {
+        "plan_id": f"CBD_SELECTIVITY_{combination_id}",
+        "mirrors": ["openai_gpt-4o", "anthropic_claude-sonnet-4.5"],
+        "experimental_design": {
+            "cell_models": ["cancer_u87mg", "healthy_astrocytes"],
+            "cbd_doses": [0.1, 0.5, 1, 2.5, 5, 10, 20],
+        },
+        "simulation_settings": {"monte_carlo_runs": 50},
+        "channel_parameters": {
+            "vdac1": {"affinity": vdac1_affinity, "max_closure": 0.95, "hill_coefficient": 1.8},
+            "mcu": {"block_strength": mcu_block_strength / 100.0, "ic50": 2.5, "cooperativity": 2.0},
+            "chloride_channels": {"ic50": chloride_ic50, "max_inhibition": 0.85, "hill_coefficient": 1.5},
+        },
+        "cell_type_differences": {
+            "cancer_vulnerability": {"baseline_stress": 0.6, "vdac1_sensitivity": 1.5,
+                                     "stress_amplification": 2.2},
+            "healthy_resistance": {"baseline_stress": 0.1, "vdac1_sensitivity": 1.0,
+                                   "stress_amplification": 1.0},
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def simulator():
+    mp = pytest.MonkeyPatch()
+    mp.chdir(ROOT)  # Engine resources are resolved from the repo root
+    try:
+        yield SelectivitySimulator(MonteCarloEngine({}))
+    finally:
+        mp.undo()
+
+
+class TestDoseHelpers:
+    """Test Hill curves and dose interpolation."""
+
+    def test_hill_is_half_at_ic50(self):
+        assert hill(0.0, 2.5, 2.0) == 0.0
+        assert hill(2.5, 2.5, 2.0) == pytest.approx(0.5)
+
+    def test_interpolate_dose_is_log_linear(self):
+        """
+        Given: Viability falling from 0.8 at 1 μM to 0.2 at 100 μM
+        When: Interpolating the 0.5 crossing
+        Then: The dose is the log-midpoint, 10 μM
+        """
+        assert interpolate_dose([1, 100], [0.8, 0.2], 0.5) == pytest.approx(10.0)
+
+    def test_interpolate_dose_reports_no_crossing(self):
+        assert interpolate_dose([1, 10], [0.9, 0.7], 0.5) is None
+
+
+class TestSelectivitySimulator:
+    """Test dose-response simulation on a shared engine."""
+
+    def test_cancer_cells_are_more_sensitive(self, simulator):
+        """
+        Given: The default cancer vs healthy cell profiles
+        When: One combination is simulated
+        Then: Cancer IC50 is below healthy IC50, so selectivity exceeds 1
+        """
+        summary = simulator.simulate(make_plan("combo_a"))
+        cancer = summary["dose_response"]["cancer_u87mg"]
+        healthy = summary["dose_response"]["healthy_astrocytes"]
+
+        assert not cancer["ic50_censored"]
+        assert cancer["ic50"] < healthy["ic50"]
+        assert summary["selectivity_index"] > 1.0
+        assert 0.0 < summary["mechanism_validation"]["channel_first_score"] <= 1.0
+
+    def test_simulation_is_deterministic(self, simulator):
+        plan = make_plan("combo_a")
+        assert simulator.simulate(plan) == simulator.simulate(plan)
+
+    def test_batch_is_keyed_with_one_directory_per_combination(self, simulator, temp_dir):
+        """
+        Given: Two parameter combinations
+        When: They are simulated as one batch with an output root
+        Then: Results are keyed by combination_id and each has its own summary.json
+        """
+        plans = {
+            "combo_a": make_plan("combo_a", chloride_ic50=5.0),
+            "combo_b": make_plan("combo_b", chloride_ic50=50.0),
+        }
+
+        results = simulator.simulate_batch(plans, temp_dir)
+
+        assert set(results) == {"combo_a", "combo_b"}
+        for combination_id, summary in results.items():
+            with open(temp_dir / combination_id / "summary.json") as f:
+                assert json.load(f) == json.loads(json.dumps(summary))
+            assert (temp_dir / combination_id / "plan.yaml").exists()
+
+        # A weaker chloride block needs more CBD to hit cancer cells
+        assert (results["combo_a"]["dose_response"]["cancer_u87mg"]["ic50"]
+                < results["combo_b"]["dose_response"]["cancer_u87mg"]["ic50"])
+
+
+class TestSuccessiveHalving:
+    """Test rung-wise pruning over increasing fidelities."""
+
+    def test_keeps_top_fraction_per_rung(self):
+        """
+        Given: 27 candidates scored by their index, eta=3 and three fidelities
+        When: Successive halving runs
+        Then: Rungs see 27, 9 and 3 candidates and the best three survive
+        """
+        calls = []
+
+        def evaluate(ids, fidelity):
+            calls.append((fidelity, len(ids)))
+            return {c: float(c) for c in ids}
+
+        scores, history = successive_halving(list(range(27)), evaluate, [1, 3, 9], eta=3)
+
+        assert calls == [(1, 27), (3, 9), (9, 3)]
+        assert set(scores) == {24, 25, 26}
+        assert [rung["fidelity"] for rung in history] == [1, 3, 9]
+
+    def test_rejects_decreasing_fidelities(self):
+        with pytest.raises(ValueError):
+            successive_halving(["a"], lambda ids, f: {}, [10, 5])
+
+
+def give_priors(pipeline, combination_id, mirror="openai_gpt-4o"):
+    """Stand in for S4 prior extraction: one mirror's state in the combination's states_dir."""
+    states_dir = pipeline.states_dir(combination_id)
+    states_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy(ROOT / "sandbox" / "states" / f"s4_state.{mirror}.json", states_dir)
+
+
+@pytest.fixture
+def pipeline(simulator, temp_dir):
+    """Sweep pipeline sharing the loaded simulator (pandas required)."""
+    pytest.importorskip("pandas")
+    sys.path.insert(0, str(ROOT / "pipelines"))
+    from run_selectivity_sweep import SelectivitySweepPipeline
+
+    pipeline = SelectivitySweepPipeline(ROOT / "plans" / "cbd_channel_first_v2.yaml", temp_dir)
+    pipeline._simulator = SelectivitySimulator(simulator.engine, mirrors=["openai_gpt-4o"])
+    return pipeline
+
+
+class TestSweepPipeline:
+    """Test the sweep pipeline's in-process batch and adaptive paths."""
+
+    def test_metrics_come_from_each_combination_directory(self, pipeline):
+        """
+        Given: A pipeline sharing an already-loaded simulator
+        When: Two combinations are simulated as one batch
+        Then: Each combination's metrics match its own summary.json
+        """
+        grid = pipeline.generate_parameter_grid(phase=1)[:2]
+        for params in grid:
+            give_priors(pipeline, params["combination_id"])
+
+        metrics = pipeline.simulate_batch([(params, "SESSION") for params in grid])
+
+        for params in grid:
+            combo_id = params["combination_id"]
+            with open(pipeline.combination_dir(combo_id) / "summary.json") as f:
+                summary = json.load(f)
+            assert metrics[combo_id]["simulation_status"] == "success"
+            assert metrics[combo_id]["selectivity_index"] == pytest.approx(summary["selectivity_index"])
+
+    def test_each_combination_uses_its_own_priors(self, pipeline):
+        """
+        Given: Two runs of one combination, extracted from sessions with different priors
+        When: Both are simulated in one batch next to each other
+        Then: Each result matches simulating that combination alone on its own priors
+        """
+        params = pipeline.generate_parameter_grid(phase=1)[0]
+        other = dict(params, combination_id="phase1_combo_other")
+        give_priors(pipeline, params["combination_id"], "openai_gpt-4o")
+        give_priors(pipeline, other["combination_id"], "anthropic_claude-sonnet-4.5")
+
+        batch = pipeline.simulate_batch([(params, "SESSION_A"), (other, "SESSION_B")])
+        alone = pipeline.simulate_batch([(other, "SESSION_B")])
+
+        assert batch[other["combination_id"]] == alone[other["combination_id"]]
+        assert batch[params["combination_id"]] != batch[other["combination_id"]]
+
+    def test_missing_priors_fail_the_combination(self, pipeline):
+        params = pipeline.generate_parameter_grid(phase=1)[0]
+
+        metrics = pipeline.simulate_batch([(params, "SESSION")])
+
+        assert metrics[params["combination_id"]]["simulation_status"] == "failed"
+
+    def test_adaptive_runs_s4_only_for_survivors(self, pipeline, monkeypatch):
+        """
+        Given: The 125-point grid, fidelities [5, 20] and eta=5
+        When: The adaptive search runs
+        Then: Only 25 survivors get S4 convergence and full results, simulated
+              on their own extracted priors; the rest are pruned
+        """
+        prepared = []
+
+        def fake_prepare(params):
+            prepared.append(params["combination_id"])
+            give_priors(pipeline, params["combination_id"], "anthropic_claude-sonnet-4.5")
+            return {"combination_id": params["combination_id"], "parameters": params,
+                    "status": "success", "session_id": "SESSION"}
+
+        monkeypatch.setattr(pipeline, "prepare_combination", fake_prepare)
+
+        results = pipeline.run_adaptive(workers=1, fidelities=[5, 20], eta=5)
+
+        complete = [r for r in results if r.get("processing_complete")]
+        assert len(prepared) == len(complete) == 25
+        assert sum(r["status"] == "pruned" for r in results) == 100
+        assert (pipeline.output_dir / "adaptive_search.json").exists()
+        # Survivors come first, best selectivity first
+        indices = [r["selectivity_index"] for r in complete]
+        assert indices == sorted(indices, reverse=True)
+
+        best = complete[0]
+        rerun = pipeline.simulate_batch([(best["parameters"], "SESSION")])
+        assert best["selectivity_index"] == rerun[best["combination_id"]]["selectivity_index"]
+        default_priors = pipeline.simulate_batch([(best["parameters"], None)])
+        assert best["selectivity_index"] != default_priors[best["combination_id"]]["selectivity_index"]
+        assert (pipeline.states_dir(best["combination_id"])
+                / "s4_state.anthropic_claude-sonnet-4.5.json").exists()
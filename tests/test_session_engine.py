@@ -0,0 +1,180 @@
+"""
+Unit tests for the multi-mirror session engine (tools/session_engine.py).
+
+Test Coverage:
+- Per-mirror turn order and error accounting
+- Barrier policies: strict lockstep, chamber cycles, pipelined lead bound
+- Bounded concurrency and pipelined wall time
+- Skipping turns already done
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.session_engine import SessionEngine, chamber_schedule
+
+
+class FakeMirrors:
+    """run_turn stand-in: sleeps a per-mirror latency and logs start/finish events"""
+
+    def __init__(self, latencies, fail=()):
+        self.latencies = latencies
+        self.fail = set(fail)
+        self.events = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, mirror, turn, chamber):
+        with self._lock:
+            self.events.append(("start", mirror, turn))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.latencies[mirror])
+            if (mirror, turn) in self.fail:
+                raise RuntimeError("provider down")
+            return f"{mirror}:{turn}:{chamber}"
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.events.append(("finish", mirror, turn))
+
+    def started(self, mirror):
+        return [turn for event, m, turn in self.events if event == "start" and m == mirror]
+
+    def max_lead(self):
+        """Largest gap between a starting turn and the slowest mirror's finished turns"""
+        finished = {mirror: 0 for mirror in self.latencies}
+        lead = 0
+        for event, mirror, turn in self.events:
+            if event == "finish":
+                finished[mirror] = max(finished[mirror], turn)
+            else:
+                lead = max(lead, turn - 1 - min(finished.values()))
+        return lead
+
+
+class TestOrdering:
+    """Test per-mirror queues."""
+
+    def test_each_mirror_runs_its_own_turns_in_order(self):
+        """
+        Given: Three mirrors with different latencies, pipelined
+        When: An 8-turn chambered schedule runs
+        Then: Every mirror runs turns 1..8 in order with the rotating chamber
+        """
+        mirrors = FakeMirrors({"fast": 0.001, "mid": 0.005, "slow": 0.01})
+        engine = SessionEngine(list(mirrors.latencies), mirrors, barrier="pipelined", max_lead=2)
+
+        stats = engine.run(chamber_schedule(8))
+
+        for name in mirrors.latencies:
+            assert mirrors.started(name) == list(range(1, 9))
+            assert stats[name].completed == 8
+            assert stats[name].chambers == {"S1": 2, "S2": 2, "S3": 2, "S4": 2}
+            assert stats[name].results[5] == f"{name}:5:S1"
+
+    def test_errors_are_counted_and_mirror_continues(self):
+        mirrors = FakeMirrors({"a": 0.001, "b": 0.001}, fail=[("a", 2)])
+        stats = SessionEngine(["a", "b"], mirrors).run(chamber_schedule(3, chambers=None))
+
+        assert (stats["a"].completed, stats["a"].errors) == (2, 1)
+        assert sorted(stats["a"].results) == [1, 3]
+        assert stats["b"].completed == 3
+
+
+class TestBarriers:
+    """Test barrier policies."""
+
+    def test_strict_is_lockstep(self):
+        """
+        Given: A fast and a slow mirror under the strict barrier
+        When: Six turns run
+        Then: No mirror ever starts a turn before both finished the previous one
+        """
+        mirrors = FakeMirrors({"fast": 0.001, "slow": 0.01})
+        announced = []
+        engine = SessionEngine(["fast", "slow"], mirrors, barrier="strict",
+                               on_turn_start=lambda turn, chamber: announced.append(turn))
+
+        engine.run(chamber_schedule(6))
+
+        assert mirrors.max_lead() == 0
+        assert announced == list(range(1, 7))
+
+    def test_chamber_barrier_syncs_at_cycle_starts(self):
+        mirrors = FakeMirrors({"fast": 0.001, "slow": 0.01})
+        SessionEngine(["fast", "slow"], mirrors, barrier="chamber").run(chamber_schedule(8))
+
+        fast_start_5 = mirrors.events.index(("start", "fast", 5))
+        assert ("finish", "slow", 4) in mirrors.events[:fast_start_5]
+        assert mirrors.max_lead() == 3
+
+    def test_pipelined_lead_is_bounded(self):
+        mirrors = FakeMirrors({"fast": 0.001, "slow": 0.01})
+        SessionEngine(["fast", "slow"], mirrors, barrier="pipelined", max_lead=2).run(chamber_schedule(10))
+
+        assert mirrors.max_lead() == 2
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            SessionEngine(["a"], lambda *args: None, barrier="eventually")
+
+
+class TestThroughput:
+    """Test concurrency bounds and wall time."""
+
+    def test_max_concurrency_bounds_in_flight_turns(self):
+        mirrors = FakeMirrors({name: 0.005 for name in "abcdef"})
+        SessionEngine(list(mirrors.latencies), mirrors, barrier="pipelined",
+                      max_concurrency=2).run(chamber_schedule(4))
+
+        assert mirrors.peak == 2
+
+    def test_pipelined_wall_time_tracks_slowest_mirror(self):
+        """
+        Given: Mirrors whose slowest turn alternates between them each turn
+        When: Ten turns run strict and pipelined
+        Then: Pipelined takes about one mirror's own sequence; strict pays each turn's maximum
+        """
+        slow, fast = 0.03, 0.001
+
+        def run_turn(mirror, turn, chamber):
+            time.sleep(slow if (turn % 2 == 0) == (mirror == "even") else fast)
+
+        timings = {}
+        for barrier in ["strict", "pipelined"]:
+            start = time.time()
+            SessionEngine(["even", "odd"], run_turn, barrier=barrier, max_lead=10).run(chamber_schedule(10))
+            timings[barrier] = time.time() - start
+
+        assert timings["strict"] >= 10 * slow
+        assert timings["pipelined"] < 0.8 * timings["strict"]
+
+
+class TestSkip:
+    """Test resuming with turns already done."""
+
+    def test_skipped_turns_count_as_done_for_the_barrier(self):
+        """
+        Given: Mirror a already finished turns 1-3, mirror b only turn 1
+        When: A strict 4-turn schedule runs with those turns skipped
+        Then: a runs only turn 4, after b has caught up through turn 3
+        """
+        mirrors = FakeMirrors({"a": 0.001, "b": 0.005})
+        stats = SessionEngine(["a", "b"], mirrors, barrier="strict").run(
+            chamber_schedule(4), skip={"a": [1, 2, 3], "b": [1]}
+        )
+
+        assert mirrors.started("a") == [4]
+        assert mirrors.started("b") == [2, 3, 4]
+        assert mirrors.events.index(("start", "a", 4)) > mirrors.events.index(("finish", "b", 3))
+        assert stats["a"].completed == 1
@@ -0,0 +1,145 @@
+"""
+Unit tests for the shared signal detector (src/core/signals.py).
+
+Test Coverage:
+- Word-boundary and inflection-aware keyword matching
+- Overlapping hits and evidence spans
+- gsw_gate-style flags and S4 attractor evidence
+- Batch scanning (in-process and process pool) and custom keyword sets
+- convergence_metrics.analyze on a session directory
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+# Add project root and scripts to path for imports
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from src.core.signals import (
+    SIGNAL_KEYWORDS,
+    SignalDetector,
+    detect_signals,
+    s4_attractor_ratio,
+    scan_batch,
+    scan_signals,
+)
+
+S4_TEXT = (
+    "The rhythm pulses steadily, waves radiating from the luminous center. "
+    "An aperture opens, widening to receive."
+)
+
+
+def legacy_detect_signals(text):
+    """Substring implementation the detector replaced (gsw_gate.detect_signals)."""
+    t = text.lower()
+    has = {name: any(k in t for k in keywords) for name, keywords in SIGNAL_KEYWORDS.items()}
+    return {
+        "geometry": has["geometry"],
+        "motion": has["motion"],
+        "s4_attractor": has["rhythm"] and has["center"] and has["aperture"],
+        "s4_rhythm": has["rhythm"],
+        "s4_center": has["center"],
+        "s4_aperture": has["aperture"],
+    }
+
+
+class TestMatching:
+    """Test keyword matching rules."""
+
+    def test_keywords_inside_other_words_do_not_fire(self):
+        """
+        Given: "during" (contains ring) and "score" (contains core)
+        When: Scanned
+        Then: No geometry or center signal fires
+        """
+        scan = scan_signals("During the score nothing happened.")
+        assert not scan.has("geometry")
+        assert not scan.has("center")
+
+    def test_inflections_and_case_fire(self):
+        scan = scan_signals("Rings GLOWING, pulsed")
+        assert scan.keywords("geometry") == ["ring"]
+        assert scan.keywords("center") == ["glow"]
+        assert scan.keywords("motion") == ["pulse"]
+
+    def test_overlapping_phrases_report_every_keyword(self):
+        """
+        Given: "steady pulse" (a rhythm phrase containing center "steady" and rhythm "pulse")
+        When: Scanned
+        Then: All three keywords fire with spans pointing at their words
+        """
+        text = "a steady pulse"
+        scan = scan_signals(text)
+
+        assert scan.keywords("rhythm") == ["pulse", "steady pulse"]
+        assert scan.keywords("center") == ["steady"]
+        assert [text[s:e] for s, e in scan.spans("rhythm")] == ["steady pulse", "pulse"]
+        assert [text[s:e] for s, e in scan.spans("center")] == ["steady"]
+
+    def test_flags_match_legacy_detector_on_whole_words(self):
+        for text in [S4_TEXT, "concentric rings from a luminous center",
+                     "pulsing waves with steady rhythm", "nothing here"]:
+            assert detect_signals(text) == legacy_detect_signals(text)
+
+
+class TestScans:
+    """Test scan results, evidence and batch API."""
+
+    def test_s4_attractor_and_evidence(self):
+        scan = scan_signals(S4_TEXT)
+        assert scan.s4_attractor
+        assert scan.evidence() == {
+            "rhythm": ["rhythm", "pulse", "waves"],
+            "center": ["luminous", "center"],
+            "aperture": ["aperture", "widening"],
+        }
+
+    def test_batch_matches_single_scans(self):
+        """
+        Given: 200 texts
+        When: Scanned in-process and on a two-process pool
+        Then: Both batches equal scanning each text alone, in input order
+        """
+        texts = [S4_TEXT, "rings during the score", "nothing"] * 67
+
+        expected = [scan_signals(t) for t in texts]
+        assert scan_batch(texts) == expected
+        assert scan_batch(texts, processes=2, chunksize=16) == expected
+        assert s4_attractor_ratio(expected) == pytest.approx(67 / 201)
+
+    def test_custom_keyword_sets_count_occurrences(self):
+        detector = SignalDetector({"color": ["silver", "gold"], "texture": ["silk", "fog"]})
+        scan = detector.scan("Silver fog, silver silk; goldfish")
+
+        assert scan.count("color") == 2
+        assert scan.count("texture") == 2
+
+
+class TestConvergenceMetrics:
+    """Test convergence_metrics on the shared detector."""
+
+    def test_s4_attractor_ratio_per_mirror(self, temp_dir):
+        """
+        Given: One mirror with two S4 turns, one carrying the full triple
+        When: The session is analyzed with evidence
+        Then: The S4 ratio is 0.5 and the evidence names the fired keywords
+        """
+        from convergence_metrics import analyze
+
+        mirror = temp_dir / "openai_gpt-4o"
+        mirror.mkdir()
+        (mirror / "turn_004.md").write_text(f"**Chamber:** S4\n\n{S4_TEXT}\n")
+        (mirror / "turn_008.md").write_text("**Chamber:** S4\n\nA quiet field.\n")
+
+        rows, metrics = analyze(temp_dir, explain=True)
+
+        assert metrics["openai_gpt-4o"]["s4_attractor_ratio"] == 0.5
+        (turn, evidence), = rows["openai_gpt-4o"]["S4"]["attractor_turns"]
+        assert turn == "turn_004.md"
+        assert evidence["aperture"] == ["aperture", "widening"]
@@ -0,0 +1,189 @@
+"""
+Unit tests for the SQLite vault catalog (tools/vault_catalog.py).
+
+Test Coverage:
+- Recording bioelectric and orchestrator turns and filtered queries
+- Backfill of existing vaults (both layouts) and incremental re-indexing
+- open_catalog querying only, backfilling on explicit refresh
+- extract_s4_states.extract_state reading S4 turns through the catalog
+- Vaults mixing cataloged sessions and sessions saved before the catalog
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Add project root to path for imports
+sys.path.insert(0, str(ROOT))
+
+from tools.vault_catalog import VaultCatalog, open_catalog, record_bioelectric_turn, record_turn_safely
+
+S4_TEXT = "The rhythm pulses around a luminous center; an aperture opens, widening."
+
+
+def write_bioelectric_turn(vault: Path, session: str, mirror: str, turn: int, chamber: str,
+                           response: str = "A quiet field.") -> Path:
+    turn_file = vault / "scrolls" / session / mirror / f"turn_{turn:03d}.md"
+    turn_file.parent.mkdir(parents=True, exist_ok=True)
+    turn_file.write_text(
+        f"# Bioelectric Turn {turn} • {chamber}\n"
+        f"**Session:** {session}\n**Mirror:** {mirror}\n**Chamber:** {chamber}\n"
+        f"**Timestamp:** 2025-10-01T05:49:35\n**Felt Pressure:** 2/5\n**Seal:** seal{turn:03d}\n"
+        f"\n---\n\n{response}\n"
+    )
+    return turn_file
+
+
+def write_orchestrator_turn(vault: Path, session: str, model_id: str, chamber: str) -> Path:
+    scroll = vault / "scrolls" / session / f"{chamber}.md"
+    scroll.parent.mkdir(parents=True, exist_ok=True)
+    scroll.write_text(f"# {chamber} - {model_id}\n**Session:** {session}\n\n---\n\nResponse\n\n---\n")
+    (vault / "meta").mkdir(exist_ok=True)
+    (vault / "meta" / f"{session}_{chamber}.json").write_text(json.dumps({
+        "model_id": model_id, "turn_id": 1, "timestamp": "2025-10-15T05:24:00Z",
+        "seal": {"sha256_16": "abcdef0123456789"}, "epistemic": {"type": 1},
+    }))
+    return scroll
+
+
+class TestRecordAndQuery:
+    """Test turns recorded at save time."""
+
+    def test_query_filters_by_session_mirror_chamber_and_type(self, temp_dir):
+        """
+        Given: Bioelectric turns recorded as they are saved
+        When: Querying S4 turns of one mirror in one session
+        Then: Only that mirror's S4 turns come back, with header fields and type
+        """
+        for mirror in ["claude", "gpt"]:
+            for turn, chamber in [(1, "S1"), (4, "S4"), (8, "S4")]:
+                turn_file = write_bioelectric_turn(temp_dir, "SESSION_A", mirror, turn, chamber)
+                record_bioelectric_turn(turn_file, "SESSION_A", mirror, turn, "A quiet field.",
+                                        2, f"seal{turn:03d}", "2025-10-01T05:49:35", chamber=chamber)
+
+        catalog = VaultCatalog(temp_dir)
+        rows = catalog.query_turns(session_id="SESSION_A", mirror="gpt", chamber="S4")
+
+        assert [row["turn"] for row in rows] == [4, 8]
+        assert rows[0]["scroll_path"] == "scrolls/SESSION_A/gpt/turn_004.md"
+        assert rows[0]["pressure"] == 2
+        assert rows[0]["epistemic_type"] is not None
+        assert catalog.query_turns(chamber="S4", epistemic_type=rows[0]["epistemic_type"]) \
+            == catalog.query_turns(chamber="S4")
+        assert catalog.mirrors("SESSION_A") == ["claude", "gpt"]
+
+
+class TestBackfill:
+    """Test indexing of vaults written before the catalog existed."""
+
+    def test_backfill_indexes_both_layouts(self, temp_dir):
+        """
+        Given: A bioelectric session and an orchestrator session on disk, no catalog
+        When: The catalog is backfilled
+        Then: Every turn is indexed with fields from headers and meta JSON
+        """
+        write_bioelectric_turn(temp_dir, "BIOELECTRIC_1", "gpt", 4, "S4", S4_TEXT)
+        write_orchestrator_turn(temp_dir, "IRIS_20251015_anthropic_claude", "claude-sonnet-4.5", "S2")
+
+        catalog = VaultCatalog(temp_dir)
+        stats = catalog.backfill()
+
+        assert stats == {"indexed": 2, "unchanged": 0, "removed": 0}
+        bio, = catalog.query_turns(layout="bioelectric")
+        assert (bio["session_id"], bio["mirror"], bio["turn"], bio["chamber"], bio["seal"]) \
+            == ("BIOELECTRIC_1", "gpt", 4, "S4", "seal004")
+        orch, = catalog.query_turns(layout="orchestrator")
+        assert (orch["mirror"], orch["chamber"], orch["epistemic_type"], orch["seal"]) \
+            == ("claude-sonnet-4.5", "S2", 1, "abcdef0123456789")
+        assert orch["meta_path"] == "meta/IRIS_20251015_anthropic_claude_S2.json"
+
+    def test_backfill_only_reindexes_changed_scrolls(self, temp_dir):
+        write_bioelectric_turn(temp_dir, "S", "gpt", 1, "S1")
+        write_bioelectric_turn(temp_dir, "S", "gpt", 2, "S2")
+        catalog = VaultCatalog(temp_dir)
+        catalog.backfill()
+
+        write_bioelectric_turn(temp_dir, "S", "gpt", 3, "S3")
+        (temp_dir / "scrolls" / "S" / "gpt" / "turn_001.md").unlink()
+
+        assert catalog.backfill() == {"indexed": 1, "unchanged": 1, "removed": 1}
+        assert [row["turn"] for row in catalog.query_turns()] == [2, 3]
+
+
+    def test_open_catalog_queries_without_walking_the_vault(self, temp_dir):
+        """
+        Given: A cataloged vault with one scroll copied in afterwards by hand
+        When: The catalog is opened, then opened with refresh=True
+        Then: Opening only queries; the refresh backfills the new scroll
+        """
+        write_bioelectric_turn(temp_dir, "S", "gpt", 1, "S1")
+        VaultCatalog(temp_dir).backfill(classify=False)
+        write_bioelectric_turn(temp_dir, "S", "gpt", 2, "S2")
+
+        assert open_catalog(temp_dir).count() == 1
+        assert open_catalog(temp_dir, refresh=True).count() == 2
+
+
+class TestCatalogConsumers:
+    """Test analysis tools reading through the catalog."""
+
+    def test_extract_state_uses_catalog_s4_turns(self, temp_dir):
+        """
+        Given: A cataloged session with S4 and non-S4 turns
+        When: extract_state runs for one mirror
+        Then: Only the S4 turns are read and their keywords aggregated
+        """
+        sys.path.insert(0, str(ROOT / "sandbox" / "cli"))
+        from extract_s4_states import extract_state
+
+        write_bioelectric_turn(temp_dir, "SESSION", "gpt", 1, "S1", S4_TEXT)
+        write_bioelectric_turn(temp_dir, "SESSION", "gpt", 4, "S4", S4_TEXT)
+        VaultCatalog(temp_dir).backfill(classify=False)
+
+        assert open_catalog(temp_dir) is not None
+        state = extract_state(temp_dir / "scrolls" / "SESSION", "gpt")
+
+        assert state["n_s4_scrolls"] == 1
+        assert state["source_scrolls"] == ["scrolls/SESSION/gpt/turn_004.md"]
+        assert state["triple_signature"]["aperture"]["keywords"] == ["aperture", "widening"]
+
+
+class TestMixedVault:
+    """Test vaults whose older sessions predate the catalog."""
+
+    def test_extract_state_globs_sessions_the_catalog_lacks(self, temp_dir):
+        """
+        Given: An S4 session saved before the catalog existed
+        When: A turn of another session is saved (creating catalog.sqlite)
+        Then: extract_state still finds the old session's S4 scroll
+        """
+        sys.path.insert(0, str(ROOT / "sandbox" / "cli"))
+        from extract_s4_states import extract_state
+
+        write_bioelectric_turn(temp_dir, "OLD", "gpt", 4, "S4", S4_TEXT)
+        before = extract_state(temp_dir / "scrolls" / "OLD", "gpt")["n_s4_scrolls"]
+
+        turn_file = write_bioelectric_turn(temp_dir, "NEW", "gpt", 1, "S1")
+        record_bioelectric_turn(turn_file, "NEW", "gpt", 1, "A quiet field.",
+                                2, "seal001", "2025-10-01T05:49:35", chamber="S1")
+
+        catalog = open_catalog(temp_dir)
+        assert catalog.has_session("NEW") and not catalog.has_session("OLD")
+        assert [path.name for path in catalog.unindexed_sessions()] == ["OLD"]
+        assert extract_state(temp_dir / "scrolls" / "OLD", "gpt")["n_s4_scrolls"] == before == 1
+
+    def test_summarize_tier_reads_indexed_and_unindexed_sessions(self, temp_dir):
+        sys.path.insert(0, str(ROOT / "scripts"))
+        from summarize_tier import load_tier_responses
+
+        write_orchestrator_turn(temp_dir, "IRIS_OLD_openai_gpt-4o", "openai/gpt-4o", "S4")
+        scroll = write_orchestrator_turn(temp_dir, "IRIS_NEW_anthropic_claude", "anthropic/claude", "S4")
+        record_turn_safely(temp_dir, scroll, session_id="IRIS_NEW_anthropic_claude",
+                           mirror="anthropic/claude", chamber="S4", layout="orchestrator",
+                           meta_path=temp_dir / "meta" / "IRIS_NEW_anthropic_claude_S4.json")
+
+        responses = load_tier_responses(temp_dir, "S4", [])
+
+        assert sorted(r["model_id"] for r in responses) == ["anthropic/claude", "openai/gpt-4o"]
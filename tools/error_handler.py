@@ -8,12 +8,15 @@ Features:
 - Error context propagation to subsequent API calls
 - Self-aware error reporting in convergence
 - Detailed error logging and analysis
+- Async retries with per-attempt deadlines and hedged requests for stragglers
 """
 
 import time
 import json
 import random
-from typing import Dict, List, Optional, Tuple, Any
+import asyncio
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -83,11 +86,15 @@ class ErrorHandler:
     Enhanced error handler with context propagation
     """
     
+    LATENCY_WINDOW = 200       # Successful-call latencies kept per model
+    MIN_LATENCY_SAMPLES = 5    # Percentiles below this are not trusted
+    
     def __init__(self, max_retries: int = 3, base_delay: float = 1.0):
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.error_history: List[ErrorContext] = []
         self.model_health: Dict[str, Dict] = {}
+        self.latency_samples: Dict[str, Deque[float]] = {}
         
     def classify_error(self, error: Exception, model: str) -> Tuple[ErrorCategory, ErrorSeverity]:
         """
@@ -197,18 +204,43 @@ class ErrorHandler:
         
         return error_context
     
-    def _update_model_health(self, model: str, category: ErrorCategory, severity: ErrorSeverity):
-        """Track model health metrics"""
+    def _health_entry(self, model: str) -> Dict:
+        """Get (or create) the health record for a model"""
         if model not in self.model_health:
             self.model_health[model] = {
                 "total_errors": 0,
                 "transient_errors": 0,
                 "critical_errors": 0,
                 "last_error": None,
-                "categories": {}
+                "categories": {},
+                "latency_p50": None,
+                "latency_p95": None,
+                "hedged_requests": 0
             }
+        return self.model_health[model]
+    
+    def record_latency(self, model: str, seconds: float):
+        """Record a successful call's latency and refresh p50/p95 in model health"""
+        samples = self.latency_samples.setdefault(model, deque(maxlen=self.LATENCY_WINDOW))
+        samples.append(seconds)
+        
+        health = self._health_entry(model)
+        health["latency_p50"] = self.latency_percentile(model, 50)
+        health["latency_p95"] = self.latency_percentile(model, 95)
+    
+    def latency_percentile(self, model: str, percentile: float) -> Optional[float]:
+        """Latency percentile for a model, or None until enough samples exist"""
+        samples = self.latency_samples.get(model)
+        if not samples or len(samples) < self.MIN_LATENCY_SAMPLES:
+            return None
         
-        health = self.model_health[model]
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+        return ordered[index]
+    
+    def _update_model_health(self, model: str, category: ErrorCategory, severity: ErrorSeverity):
+        """Track model health metrics"""
+        health = self._health_entry(model)
         health["total_errors"] += 1
         health["last_error"] = datetime.utcnow().isoformat() + "Z"
         
@@ -309,12 +341,23 @@ class RetryableAPICall:
                  error_handler: ErrorHandler,
                  model: str,
                  chamber: str,
-                 include_error_context: bool = True):
+                 include_error_context: bool = True,
+                 attempt_timeout: Optional[float] = None,
+                 hedge_percentile: Optional[float] = None):
+        """
+        Args:
+            attempt_timeout: Deadline in seconds for each attempt (async only)
+            hedge_percentile: Latency percentile (e.g. 95) after which a duplicate
+                request is fired; the first to succeed wins (async only)
+        """
         self.error_handler = error_handler
         self.model = model
         self.chamber = chamber
         self.include_error_context = include_error_context
+        self.attempt_timeout = attempt_timeout
+        self.hedge_percentile = hedge_percentile
         self.attempt = 0
+        self.hedged = False
         self.last_error: Optional[ErrorContext] = None
     
     def execute(self, api_call_func, *args, **kwargs):
@@ -345,51 +388,145 @@ class RetryableAPICall:
                         kwargs['prompt'] = f"{error_context}\n\n{kwargs['prompt']}"
                 
                 # Execute API call
+                call_start = time.monotonic()
                 result = api_call_func(*args, **kwargs)
+                self.error_handler.record_latency(self.model, time.monotonic() - call_start)
                 
                 # Success! Return result
                 return result
                 
             except Exception as e:
-                # Record error
-                error_context = self.error_handler.record_error(
-                    error=e,
-                    model=self.model,
-                    chamber=self.chamber,
-                    attempt=self.attempt
-                )
+                delay = self._handle_failure(e)
+                if delay is None:
+                    raise  # Re-raise, no more retries
                 
-                # Set recovery action
-                error_context.recovery_action = self.error_handler.get_recovery_strategy(
-                    error_context.error_category
+                time.sleep(delay)
+        
+        # All retries exhausted
+        raise Exception(f"All {self.error_handler.max_retries} retry attempts exhausted for {self.model} {self.chamber}")
+    
+    async def execute_async(self, api_call_func, *args, **kwargs):
+        """
+        Async execute: awaits backoff instead of blocking a thread
+        
+        Args:
+            api_call_func: Coroutine function to call (called afresh per attempt/hedge)
+            *args, **kwargs: Arguments to pass to api_call_func
+        
+        Each attempt honours `attempt_timeout`. With `hedge_percentile` set and
+        enough latency history, a duplicate request is fired once the attempt
+        outlives that percentile; the first success wins and the other is cancelled.
+        """
+        while self.attempt < self.error_handler.max_retries:
+            self.attempt += 1
+            
+            if self.include_error_context and self.attempt > 1:
+                error_context = self.error_handler.get_error_context_for_prompt(
+                    self.model, self.chamber
                 )
+                if error_context and 'prompt' in kwargs:
+                    kwargs['prompt'] = f"{error_context}\n\n{kwargs['prompt']}"
+            
+            try:
+                call_start = time.monotonic()
+                result = await self._attempt_async(api_call_func, args, kwargs)
+                self.error_handler.record_latency(self.model, time.monotonic() - call_start)
+                return result
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                delay = self._handle_failure(e)
+                if delay is None:
+                    raise
                 
-                # Determine if should retry
-                should_retry = self.error_handler.should_retry(
-                    error_context.error_category,
-                    error_context.severity,
-                    self.attempt
-                )
+                await asyncio.sleep(delay)
+        
+        raise Exception(f"All {self.error_handler.max_retries} retry attempts exhausted for {self.model} {self.chamber}")
+    
+    async def _attempt_async(self, api_call_func, args, kwargs):
+        """One attempt: primary call, optional hedge, bounded by attempt_timeout"""
+        hedge_after = None
+        if self.hedge_percentile is not None:
+            hedge_after = self.error_handler.latency_percentile(self.model, self.hedge_percentile)
+        
+        deadline = None
+        if self.attempt_timeout is not None:
+            deadline = asyncio.get_running_loop().time() + self.attempt_timeout
+        
+        tasks = [asyncio.ensure_future(api_call_func(*args, **kwargs))]
+        try:
+            while True:
+                timeout = None
+                if deadline is not None:
+                    timeout = max(0.0, deadline - asyncio.get_running_loop().time())
+                if hedge_after is not None and len(tasks) == 1:
+                    timeout = hedge_after if timeout is None else min(timeout, hedge_after)
                 
-                if not should_retry:
-                    print(f"  ❌ {self.model} {self.chamber} failed: {error_context.error_message}")
-                    print(f"     Severity: {error_context.severity.value}")
-                    print(f"     Strategy: {error_context.recovery_action}")
-                    raise  # Re-raise, no more retries
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
                 
-                # Calculate retry delay
-                delay = self.error_handler.get_retry_delay(
-                    self.attempt, 
-                    error_context.error_category
-                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                # A failed call only ends the attempt once no sibling is still running
+                tasks = [t for t in tasks if not t.done()]
+                if not tasks:
+                    raise next(iter(done)).exception()
                 
-                print(f"  ⚠️  {self.model} {self.chamber} attempt {self.attempt} failed: {error_context.error_category.value}")
-                print(f"     Retrying in {delay:.1f}s... ({self.error_handler.max_retries - self.attempt} retries left)")
+                if deadline is not None and asyncio.get_running_loop().time() >= deadline:
+                    raise TimeoutError(
+                        f"{self.model} {self.chamber} attempt {self.attempt} timed out after {self.attempt_timeout:.1f}s"
+                    )
                 
-                time.sleep(delay)
+                if hedge_after is not None and not done and not self.hedged:
+                    # Straggler: fire a duplicate and take whichever lands first
+                    self.hedged = True
+                    self.error_handler._health_entry(self.model)["hedged_requests"] += 1
+                    print(f"  ↯ {self.model} {self.chamber} exceeded p{self.hedge_percentile:g} ({hedge_after:.1f}s), hedging")
+                    tasks.append(asyncio.ensure_future(api_call_func(*args, **kwargs)))
+                hedge_after = None
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _handle_failure(self, error: Exception) -> Optional[float]:
+        """Record a failed attempt; return the backoff delay, or None to give up"""
+        # Record error
+        error_context = self.error_handler.record_error(
+            error=error,
+            model=self.model,
+            chamber=self.chamber,
+            attempt=self.attempt
+        )
         
-        # All retries exhausted
-        raise Exception(f"All {self.error_handler.max_retries} retry attempts exhausted for {self.model} {self.chamber}")
+        # Set recovery action
+        error_context.recovery_action = self.error_handler.get_recovery_strategy(
+            error_context.error_category
+        )
+        
+        # Determine if should retry
+        should_retry = self.error_handler.should_retry(
+            error_context.error_category,
+            error_context.severity,
+            self.attempt
+        )
+        
+        if not should_retry:
+            print(f"  ❌ {self.model} {self.chamber} failed: {error_context.error_message}")
+            print(f"     Severity: {error_context.severity.value}")
+            print(f"     Strategy: {error_context.recovery_action}")
+            return None
+        
+        # Calculate retry delay
+        delay = self.error_handler.get_retry_delay(
+            self.attempt, 
+            error_context.error_category
+        )
+        
+        print(f"  ⚠️  {self.model} {self.chamber} attempt {self.attempt} failed: {error_context.error_category.value}")
+        print(f"     Retrying in {delay:.1f}s... ({self.error_handler.max_retries - self.attempt} retries left)")
+        
+        return delay
 
 
 # Example usage function
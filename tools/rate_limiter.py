@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+IRIS Gate Provider Rate Limiter
+
+Features:
+- Token buckets per provider (requests/min and tokens/min)
+- AIMD concurrency control driven by rate-limit and latency signals
+- One shared limiter per provider across threads and event loops
+- Sync (`slot`) and async (`slot_async`) call guards
+
+Every mirror adapter that talks to the same provider should pace itself
+through `get_limiter(provider)`, so pulses, chambered runs and convergence
+protocols running in one process stop racing each other into 429 storms.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+from tools.error_handler import ErrorCategory, ErrorHandler
+
+
+@dataclass
+class ProviderLimits:
+    """Static budget for one provider"""
+    requests_per_minute: float
+    tokens_per_minute: float
+    max_concurrency: int
+    min_concurrency: int = 1
+    latency_factor: float = 3.0  # Latency above factor × EWMA counts as congestion
+
+
+# Conservative defaults; override with IRIS_RATE_<PROVIDER>_{RPM,TPM,CONCURRENCY}
+DEFAULT_PROVIDER_LIMITS: Dict[str, ProviderLimits] = {
+    "anthropic": ProviderLimits(requests_per_minute=50, tokens_per_minute=80_000, max_concurrency=8),
+    "openai": ProviderLimits(requests_per_minute=500, tokens_per_minute=200_000, max_concurrency=16),
+    "xai": ProviderLimits(requests_per_minute=60, tokens_per_minute=100_000, max_concurrency=8),
+    "google": ProviderLimits(requests_per_minute=60, tokens_per_minute=120_000, max_concurrency=8),
+    "deepseek": ProviderLimits(requests_per_minute=60, tokens_per_minute=100_000, max_concurrency=8),
+    "ollama": ProviderLimits(requests_per_minute=600, tokens_per_minute=1_000_000, max_concurrency=2),
+}
+FALLBACK_LIMITS = ProviderLimits(requests_per_minute=60, tokens_per_minute=100_000, max_concurrency=4)
+
+
+def estimate_tokens(*texts: str, max_tokens: int = 0) -> int:
+    """Rough token cost of a call: ~4 chars per prompt token plus the output budget"""
+    return sum(len(t) for t in texts if t) // 4 + max_tokens
+
+
+class TokenBucket:
+    """Continuous-refill token bucket (not thread-safe; guarded by the limiter lock)"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available (0 if available now)"""
+        self._refill(now)
+        # A single request larger than the bucket is allowed once the bucket is full
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+
+class ProviderLimiter:
+    """
+    Proactive pacing plus AIMD concurrency for one provider
+
+    Concurrency grows by ~1 slot per window of successful calls (additive
+    increase) and halves on a rate-limit error or shrinks on a latency spike
+    (multiplicative decrease). Rate-limit errors also pause new calls briefly.
+    """
+
+    def __init__(self, provider: str, limits: ProviderLimits):
+        self.provider = provider
+        self.limits = limits
+        self.request_bucket = TokenBucket(limits.requests_per_minute)
+        self.token_bucket = TokenBucket(limits.tokens_per_minute)
+
+        self.concurrency = float(limits.max_concurrency)
+        self.in_flight = 0
+        self.latency_ewma: Optional[float] = None
+        self.paused_until = 0.0
+
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._classifier = ErrorHandler()
+
+        self.stats = {"calls": 0, "rate_limited": 0, "congestion": 0, "waited_s": 0.0}
+
+    # Admission
+
+    def _try_acquire(self, tokens: int) -> Optional[float]:
+        """Claim a slot (returns 0), or report how long to wait (None = until a release)"""
+        now = time.monotonic()
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.in_flight >= max(self.limits.min_concurrency, int(self.concurrency)):
+            return None
+
+        wait = max(self.request_bucket.wait_time(1, now), self.token_bucket.wait_time(tokens, now))
+        if wait > 0:
+            return wait
+
+        self.request_bucket.consume(1)
+        self.token_bucket.consume(tokens)
+        self.in_flight += 1
+        self.stats["calls"] += 1
+        return 0.0
+
+    def acquire(self, tokens: int = 0):
+        """Block the calling thread until the provider admits one more call"""
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                wait = self._try_acquire(tokens)
+                if wait == 0.0:
+                    self.stats["waited_s"] += time.monotonic() - start
+                    return
+                self._cond.wait(timeout=wait)
+
+    async def acquire_async(self, tokens: int = 0):
+        """Await admission without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                wait = self._try_acquire(tokens)
+                if wait == 0.0:
+                    self.stats["waited_s"] += time.monotonic() - start
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await asyncio.wait([waiter], timeout=wait)
+
+    def release(self):
+        """Return a slot and wake every waiter to re-check admission"""
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._wake_locked()
+
+    def _wake_locked(self):
+        self._cond.notify_all()
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve, waiter)
+
+    # AIMD feedback
+
+    def record_success(self, latency: float):
+        """Additive increase, unless latency signals congestion"""
+        with self._cond:
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            elif latency > self.limits.latency_factor * self.latency_ewma:
+                self.stats["congestion"] += 1
+                self.concurrency = max(self.limits.min_concurrency, self.concurrency * 0.75)
+                return
+            else:
+                self.latency_ewma = 0.8 * self.latency_ewma + 0.2 * latency
+
+            self.concurrency = min(self.limits.max_concurrency, self.concurrency + 1.0 / self.concurrency)
+            self._wake_locked()
+
+    def record_error(self, error: Exception):
+        """Multiplicative decrease on rate-limit / timeout errors"""
+        category, _ = self._classifier.classify_error(error, self.provider)
+        with self._cond:
+            if category == ErrorCategory.API_RATE_LIMIT:
+                self.stats["rate_limited"] += 1
+                self.concurrency = max(self.limits.min_concurrency, self.concurrency * 0.5)
+                pause = self._classifier.get_retry_delay(0, category)
+                self.paused_until = max(self.paused_until, time.monotonic() + pause)
+            elif category == ErrorCategory.API_TIMEOUT:
+                self.stats["congestion"] += 1
+                self.concurrency = max(self.limits.min_concurrency, self.concurrency * 0.75)
+
+    # Call guards
+
+    @contextmanager
+    def slot(self, tokens: int = 0):
+        """`with limiter.slot(n):` around a blocking provider call"""
+        self.acquire(tokens)
+        start = time.monotonic()
+        try:
+            yield self
+        except Exception as e:
+            self.record_error(e)
+            raise
+        else:
+            self.record_success(time.monotonic() - start)
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def slot_async(self, tokens: int = 0):
+        """`async with limiter.slot_async(n):` around an awaited provider call"""
+        await self.acquire_async(tokens)
+        start = time.monotonic()
+        try:
+            yield self
+        except Exception as e:
+            self.record_error(e)
+            raise
+        else:
+            self.record_success(time.monotonic() - start)
+        finally:
+            self.release()
+
+    def snapshot(self) -> Dict:
+        """Current limiter state for logging"""
+        with self._lock:
+            return {
+                "provider": self.provider,
+                "concurrency": round(self.concurrency, 2),
+                "in_flight": self.in_flight,
+                "latency_ewma": self.latency_ewma,
+                **self.stats
+            }
+
+
+def _resolve(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _limits_from_env(provider: str) -> ProviderLimits:
+    base = DEFAULT_PROVIDER_LIMITS.get(provider, FALLBACK_LIMITS)
+    prefix = f"IRIS_RATE_{provider.upper()}_"
+    return ProviderLimits(
+        requests_per_minute=float(os.getenv(prefix + "RPM", base.requests_per_minute)),
+        tokens_per_minute=float(os.getenv(prefix + "TPM", base.tokens_per_minute)),
+        max_concurrency=int(os.getenv(prefix + "CONCURRENCY", base.max_concurrency)),
+        min_concurrency=base.min_concurrency,
+        latency_factor=base.latency_factor
+    )
+
+
+_limiters: Dict[str, ProviderLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    """Process-wide limiter for `provider` (anthropic, openai, xai, google, deepseek, ollama)"""
+    with _limiters_lock:
+        if provider not in _limiters:
+            _limiters[provider] = ProviderLimiter(provider, _limits_from_env(provider))
+        return _limiters[provider]
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+IRIS Gate Response Cache
+
+Features:
+- Content-addressed: SHA-256 of (adapter, model, system prompt, user prompt,
+  temperature, max_tokens), plus an optional sample label
+- One SQLite file (WAL mode), responses stored zlib-compressed
+- Shared by the orchestrator mirrors, the bioelectric runners and the
+  mass-coherence convergence protocol
+
+Modes:
+    off           Always call the provider (default)
+    record        Always call the provider and store the response
+    replay        Never call the provider; a missing entry raises CacheMiss
+    read-through  Serve stored responses, call the provider (and store) on a miss
+
+Select the mode and store with IRIS_RESPONSE_CACHE and IRIS_RESPONSE_CACHE_PATH:
+
+    IRIS_RESPONSE_CACHE=record python scripts/bioelectric_chambered.py --turns 16
+    IRIS_RESPONSE_CACHE=replay python scripts/bioelectric_chambered.py --turns 16   # offline
+
+Callers wrap their (rate-limited) provider call in a fetch function, so a
+cache hit never takes a rate-limiter slot:
+
+    cache = get_response_cache()
+    text = cache.call(provider, model, system, user, temperature, max_tokens,
+                      fetch=lambda: adapter.generate(system, user, ...), sample=turn)
+
+Runs that send the same prompt many times on purpose (100 turns of one seed)
+pass the turn as `sample`, so each turn replays its own response instead of
+every turn collapsing onto the first one.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+CACHE_MODES = ("off", "record", "replay", "read-through")
+
+DEFAULT_CACHE_PATH = Path("iris_vault") / "response_cache.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key         TEXT PRIMARY KEY,
+    adapter     TEXT NOT NULL,
+    model       TEXT,
+    temperature REAL,
+    max_tokens  INTEGER,
+    response    BLOB NOT NULL,   -- zlib-compressed UTF-8 text
+    created_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_model ON responses (adapter, model);
+"""
+
+
+class CacheMiss(LookupError):
+    """Replay mode found no stored response for a call"""
+
+
+def cache_key(adapter: str, model: Optional[str], system: Optional[str], user: str,
+              temperature: Optional[float], max_tokens: Optional[int], sample=None) -> str:
+    """SHA-256 of the call's identifying parameters (the cache key)"""
+    parts = [adapter, model, system, user, temperature, max_tokens]
+    if sample is not None:
+        parts.append(str(sample))
+    payload = json.dumps(parts, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def describe_adapter(adapter) -> Tuple[str, str]:
+    """(adapter, model) key parts for a bioelectric-style adapter object"""
+    name = getattr(adapter, "provider", None) or type(adapter).__name__
+    model = getattr(adapter, "model", None)
+    if not isinstance(model, str):
+        model = getattr(model, "model_name", None) or type(adapter).__name__
+    return name, model
+
+
+class ResponseCache:
+    """SQLite store of provider responses, consulted according to `mode`"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, mode: str = "read-through"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode {mode!r} (choose from {', '.join(CACHE_MODES)})")
+        self.path = Path(path)
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+        if self.mode != "off":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Per-thread connection (mirror worker threads share one cache)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    def put(self, key: str, response: str, adapter: str, model: Optional[str] = None,
+            temperature: Optional[float] = None, max_tokens: Optional[int] = None):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, adapter, model, temperature, max_tokens,
+                 zlib.compress(response.encode("utf-8")), datetime.utcnow().isoformat())
+            )
+
+    def __len__(self) -> int:
+        if self.mode == "off":
+            return 0
+        return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _lookup(self, key: str) -> Optional[str]:
+        """Stored response for `key` when the mode serves from the cache"""
+        if self.mode not in ("replay", "read-through"):
+            return None
+        cached = self.get(key)
+        with self._stats_lock:
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if cached is None and self.mode == "replay":
+            raise CacheMiss(f"No cached response for key {key[:16]} (replay mode)")
+        return cached
+
+    def call(self, adapter: str, model: Optional[str], system: Optional[str], user: str,
+             temperature: Optional[float], max_tokens: Optional[int],
+             fetch: Callable[[], str], sample=None) -> str:
+        """
+        Response for one provider call, per the cache mode.
+
+        Args:
+            adapter, model, system, user, temperature, max_tokens: Key parts
+            fetch: Live provider call returning the response text
+            sample: Optional key part telling repeated identical calls apart
+
+        Returns:
+            Response text (stored or live)
+
+        Raises:
+            CacheMiss: replay mode and no stored response
+        """
+        if self.mode == "off":
+            return fetch()
+        key = cache_key(adapter, model, system, user, temperature, max_tokens, sample)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = fetch()
+        self.put(key, response, adapter, model, temperature, max_tokens)
+        return response
+
+    async def call_async(self, adapter: str, model: Optional[str], system: Optional[str], user: str,
+                         temperature: Optional[float], max_tokens: Optional[int],
+                         fetch: Callable[[], Awaitable[str]], sample=None) -> str:
+        """call() with an async fetch"""
+        if self.mode == "off":
+            return await fetch()
+        key = cache_key(adapter, model, system, user, temperature, max_tokens, sample)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = await fetch()
+        self.put(key, response, adapter, model, temperature, max_tokens)
+        return response
+
+
+_caches: Dict[Tuple[str, str], ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(mode: Optional[str] = None, path=None) -> ResponseCache:
+    """
+    Process-wide cache for a (mode, path) pair.
+
+    Defaults come from IRIS_RESPONSE_CACHE (mode, default "off") and
+    IRIS_RESPONSE_CACHE_PATH (default iris_vault/response_cache.sqlite).
+    """
+    mode = mode or os.getenv("IRIS_RESPONSE_CACHE", "off")
+    path = Path(path or os.getenv("IRIS_RESPONSE_CACHE_PATH", str(DEFAULT_CACHE_PATH)))
+    key = (mode, str(path.resolve()))
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = ResponseCache(path, mode=mode)
+        return _caches[key]
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+IRIS Gate Session Engine
+
+Runs a multi-mirror session (N mirrors × T turns) with:
+- One work queue per mirror, so each mirror runs its own turns in order
+- A barrier policy deciding how far mirrors may drift apart
+- Bounded concurrency for the blocking adapter calls
+
+Barrier policies:
+    strict     Turn t starts only once every mirror has finished turn t-1
+               (the original lockstep broadcast)
+    chamber    Mirrors run freely inside a chamber cycle (S1→S4) and meet at
+               the start of the next cycle
+    pipelined  A mirror may lead the slowest mirror by at most `max_lead` turns
+
+Each turn is a fresh, history-free prompt, so with `pipelined` a session takes
+roughly as long as the slowest mirror's own sequence instead of the sum of the
+per-turn maxima.
+
+Usage:
+    from tools.session_engine import SessionEngine, chamber_schedule
+
+    engine = SessionEngine(["claude", "gpt"], run_turn, barrier="pipelined", max_lead=4)
+    stats = engine.run(chamber_schedule(100))   # run_turn(mirror, turn, chamber)
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+BARRIER_POLICIES = ("strict", "chamber", "pipelined")
+
+CHAMBERS = ["S1", "S2", "S3", "S4"]
+
+# (turn number, chamber or None)
+TurnSpec = Tuple[int, Optional[str]]
+
+
+def chamber_schedule(turns: int, chambers: Optional[Sequence[str]] = CHAMBERS) -> List[TurnSpec]:
+    """Turns 1..`turns` with chambers rotating S1→S2→S3→S4 (no chambers if None)"""
+    return [
+        (turn, chambers[(turn - 1) % len(chambers)] if chambers else None)
+        for turn in range(1, turns + 1)
+    ]
+
+
+@dataclass
+class MirrorStats:
+    """Per-mirror outcome of a session run"""
+    mirror: str
+    completed: int = 0
+    errors: int = 0
+    turn_times: List[float] = field(default_factory=list)
+    chambers: Dict[str, int] = field(default_factory=dict)
+    results: Dict[int, Any] = field(default_factory=dict)  # turn → run_turn return value
+
+    @property
+    def mean_time(self) -> float:
+        return sum(self.turn_times) / len(self.turn_times) if self.turn_times else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summary dict in the runners' stats shape"""
+        return {
+            "mirror": self.mirror,
+            "completed": self.completed,
+            "errors": self.errors,
+            "turn_times": list(self.turn_times),
+            "mean_time": self.mean_time,
+            "chambers": dict(self.chambers),
+        }
+
+
+class SessionEngine:
+    """
+    Schedules `run_turn(mirror, turn, chamber)` for every mirror and turn.
+
+    `run_turn` is a blocking callable (adapter call + save) executed on a
+    thread pool of `max_concurrency` workers; it may return a value (kept in
+    MirrorStats.results) and may raise (counted as an error, the mirror moves
+    on to its next turn).
+    """
+
+    def __init__(
+        self,
+        mirrors: Sequence[str],
+        run_turn: Callable[[str, int, Optional[str]], Any],
+        barrier: str = "strict",
+        max_lead: int = 4,
+        max_concurrency: Optional[int] = None,
+        cycle_length: int = len(CHAMBERS),
+        on_turn_start: Optional[Callable[[int, Optional[str]], None]] = None,
+    ):
+        """
+        Args:
+            mirrors: Mirror names (one work queue each)
+            run_turn: Blocking turn function, (mirror, turn, chamber) -> result
+            barrier: One of BARRIER_POLICIES
+            max_lead: Turns a mirror may run ahead of the slowest one (pipelined)
+            max_concurrency: Concurrent run_turn calls (default: one per mirror)
+            cycle_length: Turns per chamber cycle (chamber barrier)
+            on_turn_start: Called once per turn, when the first mirror starts it
+        """
+        if barrier not in BARRIER_POLICIES:
+            raise ValueError(f"Unknown barrier policy {barrier!r} (choose from {', '.join(BARRIER_POLICIES)})")
+        if max_lead < 0:
+            raise ValueError("max_lead must be >= 0")
+
+        self.mirrors = list(mirrors)
+        self.run_turn = run_turn
+        self.barrier = barrier
+        self.max_lead = max_lead
+        self.max_concurrency = max(1, max_concurrency or len(self.mirrors))
+        self.cycle_length = max(1, cycle_length)
+        self.on_turn_start = on_turn_start
+
+        self._queues: Dict[str, Deque[TurnSpec]] = {}
+        self._started: Set[int] = set()
+        self._cond: Optional[asyncio.Condition] = None
+
+    def _frontier(self, mirror: str) -> float:
+        """Last turn up to which `mirror` has no work left"""
+        pending = self._queues[mirror]
+        return pending[0][0] - 1 if pending else math.inf
+
+    def _may_start(self, turn: int) -> bool:
+        slowest = min(self._frontier(mirror) for mirror in self.mirrors)
+        if self.barrier == "strict":
+            return slowest >= turn - 1
+        if self.barrier == "chamber":
+            cycle_start = (turn - 1) // self.cycle_length * self.cycle_length + 1
+            return slowest >= cycle_start - 1
+        return slowest >= turn - 1 - self.max_lead
+
+    def _timed_turn(self, mirror: str, turn: int, chamber: Optional[str]) -> Tuple[Any, float]:
+        start = time.time()
+        result = self.run_turn(mirror, turn, chamber)
+        return result, time.time() - start
+
+    async def _mirror_loop(self, mirror: str, executor: ThreadPoolExecutor, stats: MirrorStats):
+        loop = asyncio.get_running_loop()
+        pending = self._queues[mirror]
+        scheduled = len(pending)
+
+        while pending:
+            turn, chamber = pending[0]
+            async with self._cond:
+                await self._cond.wait_for(lambda: self._may_start(turn))
+
+            if turn not in self._started:
+                self._started.add(turn)
+                if self.on_turn_start:
+                    self.on_turn_start(turn, chamber)
+
+            label = f"Turn {turn:03d}" + (f" {chamber}" if chamber else "")
+            try:
+                result, elapsed = await loop.run_in_executor(
+                    executor, self._timed_turn, mirror, turn, chamber
+                )
+                stats.completed += 1
+                stats.turn_times.append(elapsed)
+                stats.results[turn] = result
+                if chamber:
+                    stats.chambers[chamber] = stats.chambers.get(chamber, 0) + 1
+            except Exception as e:
+                stats.errors += 1
+                print(f"[{mirror}] {label} ✗ Error: {e}")
+
+            async with self._cond:
+                pending.popleft()
+                self._cond.notify_all()
+
+        print(f"[{mirror}] Complete: {stats.completed}/{scheduled} turns")
+
+    async def run_async(
+        self,
+        schedule: Iterable[TurnSpec],
+        skip: Optional[Dict[str, Iterable[int]]] = None,
+    ) -> Dict[str, MirrorStats]:
+        """
+        Run `schedule` on every mirror.
+
+        Args:
+            schedule: (turn, chamber) pairs, in turn order
+            skip: mirror → turns already done (left out of that mirror's queue)
+
+        Returns:
+            mirror → MirrorStats, in mirror order
+        """
+        schedule = sorted(schedule)
+        skip = {mirror: set(turns) for mirror, turns in (skip or {}).items()}
+        self._queues = {
+            mirror: deque(spec for spec in schedule if spec[0] not in skip.get(mirror, ()))
+            for mirror in self.mirrors
+        }
+        self._started = set()
+        self._cond = asyncio.Condition()
+
+        stats = {mirror: MirrorStats(mirror) for mirror in self.mirrors}
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="mirror")
+        try:
+            await asyncio.gather(*(
+                self._mirror_loop(mirror, executor, stats[mirror]) for mirror in self.mirrors
+            ))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return stats
+
+    def run(
+        self,
+        schedule: Iterable[TurnSpec],
+        skip: Optional[Dict[str, Iterable[int]]] = None,
+    ) -> Dict[str, MirrorStats]:
+        """Blocking wrapper around run_async()"""
+        return asyncio.run(self.run_async(schedule, skip=skip))
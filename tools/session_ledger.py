@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+IRIS Gate Session Ledger
+
+Append-only record of the turns a session has finished, kept next to the
+session's scrolls (iris_vault/scrolls/<session>/ledger.jsonl). Each line is
+one completed (mirror, turn, chamber, seal) entry, written and fsync'd right
+after the turn's scroll is saved, so a crashed run can be resumed without
+paying for any turn it already completed.
+
+Usage:
+    from tools.session_ledger import get_ledger
+
+    ledger = get_ledger(Path("iris_vault/scrolls") / session_id)
+    ledger.record("openai_gpt-4o", 7, "S3", seal)
+    done = ledger.completed()    # {"openai_gpt-4o": {1, 2, ..., 7}, ...}
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+LEDGER_FILENAME = "ledger.jsonl"
+
+
+class SessionLedger:
+    """Append-only, fsync'd JSONL log of completed turns for one session"""
+
+    def __init__(self, session_dir):
+        self.session_dir = Path(session_dir)
+        self.path = self.session_dir / LEDGER_FILENAME
+        self._lock = threading.Lock()
+
+    def record(self, mirror: str, turn: int, chamber: Optional[str], seal: str, **extra) -> Dict:
+        """
+        Append one completed turn and fsync it.
+
+        Args:
+            mirror: Mirror name (scroll subdirectory)
+            turn: Turn number
+            chamber: Chamber of the turn (None for unchambered runs)
+            seal: Seal of the saved response
+            **extra: Additional JSON fields (e.g. error=True)
+
+        Returns:
+            The entry written
+        """
+        entry = {
+            "mirror": mirror,
+            "turn": turn,
+            "chamber": chamber,
+            "seal": seal,
+            "recorded_at": datetime.utcnow().isoformat(),
+            **extra,
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.session_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        return entry
+
+    def entries(self) -> List[Dict]:
+        """
+        Ledger entries in write order.
+
+        A torn last line (process killed mid-write) is skipped; that turn
+        simply counts as not completed.
+        """
+        if not self.path.exists():
+            return []
+        entries = []
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return entries
+
+    def completed(self) -> Dict[str, Set[int]]:
+        """mirror → turn numbers already completed"""
+        done: Dict[str, Set[int]] = {}
+        for entry in self.entries():
+            done.setdefault(entry["mirror"], set()).add(entry["turn"])
+        return done
+
+    def __len__(self) -> int:
+        return len(self.entries())
+
+
+_ledgers: Dict[str, SessionLedger] = {}
+_ledgers_lock = threading.Lock()
+
+
+def get_ledger(session_dir) -> SessionLedger:
+    """Process-wide ledger for a session directory (shared by all mirror threads)"""
+    key = str(Path(session_dir).resolve())
+    with _ledgers_lock:
+        if key not in _ledgers:
+            _ledgers[key] = SessionLedger(session_dir)
+        return _ledgers[key]
+
+
+def record_completed_turn(turn_file: Path, mirror: str, turn: int,
+                          chamber: Optional[str], seal: str, **extra) -> None:
+    """
+    Ledger entry for a bioelectric turn saved at
+    <vault>/scrolls/<session>/<mirror>/turn_NNN.md.
+    """
+    get_ledger(Path(turn_file).parent.parent).record(mirror, turn, chamber, seal, **extra)
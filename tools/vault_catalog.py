@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+IRIS Vault Catalog
+
+Features:
+- One SQLite index (WAL mode) per vault: <vault>/catalog.sqlite
+- One row per saved turn: session, mirror, turn, chamber, seal, pressure,
+  epistemic type and the scroll/meta paths
+- Written by Orchestrator._save_turn and the bioelectric save_turn functions
+- Backfill indexer for existing vaults (skips scrolls unchanged since last index)
+
+Analysis tools query the catalog instead of globbing `scrolls/` and
+re-parsing markdown headers (open_catalog never walks the vault unless
+asked to refresh):
+
+    catalog = get_catalog("iris_vault")
+    turns = catalog.query_turns(session_id=SESSION, mirror=MIRROR,
+                                chamber="S4", epistemic_type=2)
+
+Backfill from the command line:
+
+    python3 tools/vault_catalog.py iris_vault [--no-classify] [--processes 8]
+
+The markdown and JSON files stay the source of truth; the catalog can always
+be rebuilt from them.
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.epistemic_map import classify_batch, classify_response
+
+CATALOG_FILENAME = "catalog.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS turns (
+    scroll_path    TEXT PRIMARY KEY,  -- relative to the vault root
+    session_id     TEXT NOT NULL,
+    mirror         TEXT NOT NULL,
+    turn           INTEGER,
+    chamber        TEXT,
+    timestamp      TEXT,
+    seal           TEXT,
+    pressure       INTEGER,
+    epistemic_type INTEGER,
+    meta_path      TEXT,
+    layout         TEXT NOT NULL,     -- 'bioelectric' (per-mirror turns) or 'orchestrator'
+    mtime          REAL,
+    size           INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_turns_session_mirror ON turns (session_id, mirror, chamber);
+CREATE INDEX IF NOT EXISTS idx_turns_chamber_type ON turns (chamber, epistemic_type);
+CREATE INDEX IF NOT EXISTS idx_turns_mirror ON turns (mirror);
+"""
+
+COLUMNS = (
+    "scroll_path", "session_id", "mirror", "turn", "chamber", "timestamp", "seal",
+    "pressure", "epistemic_type", "meta_path", "layout", "mtime", "size",
+)
+
+# Scroll header fields (bioelectric turns and orchestrator chamber scrolls)
+_HEADER_FIELD = re.compile(r"^\*\*(Session|Mirror|Chamber|Timestamp|Felt Pressure|Seal|Epistemic):\*\*\s*(.+?)\s*$",
+                           re.MULTILINE)
+_TITLE_CHAMBER = re.compile(r"^#.*•\s+(S\d+)", re.MULTILINE)
+_EPISTEMIC_TYPE = re.compile(r"TYPE\s+(\d)")
+_TURN_FILE = re.compile(r"turn_(\d+)\.md$")
+
+
+class VaultCatalog:
+    """SQLite index of the turns saved in one vault"""
+
+    def __init__(self, vault_root, db_path: Optional[Path] = None):
+        self.vault_root = Path(vault_root)
+        self.db_path = Path(db_path) if db_path else self.vault_root / CATALOG_FILENAME
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Per-thread connection (mirror worker threads write concurrently)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # Writes
+
+    def _row(self, scroll_path: Path, fields: Dict) -> Dict:
+        scroll_path = Path(scroll_path)
+        row = {column: fields.get(column) for column in COLUMNS}
+        row["scroll_path"] = self._relative(scroll_path)
+        if row["meta_path"] is not None:
+            row["meta_path"] = self._relative(Path(row["meta_path"]))
+        if scroll_path.exists():
+            stat = scroll_path.stat()
+            row["mtime"], row["size"] = stat.st_mtime, stat.st_size
+        return row
+
+    def record_turn(self, scroll_path: Path, **fields):
+        """
+        Upsert one turn.
+
+        Args:
+            scroll_path: Markdown scroll written for the turn
+            fields: session_id, mirror, layout (required), turn, chamber,
+                    timestamp, seal, pressure, epistemic_type, meta_path
+        """
+        self.record_turns([self._row(scroll_path, fields)])
+
+    def record_turns(self, rows: Iterable[Dict]):
+        """Upsert many prepared rows in one transaction"""
+        placeholders = ", ".join(f":{column}" for column in COLUMNS)
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO turns ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                list(rows)
+            )
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return str(path.resolve().relative_to(self.vault_root.resolve()))
+        except ValueError:
+            return str(path)
+
+    # Queries
+
+    def query_turns(
+        self,
+        session_id: Optional[str] = None,
+        mirror: Optional[str] = None,
+        chamber: Optional[str] = None,
+        epistemic_type: Optional[int] = None,
+        layout: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Turns matching every given filter, ordered by session, mirror, turn.
+        scroll_path and meta_path are relative to the vault root.
+
+        Example: all S4 turns for mirror X in session Y with type 2:
+            query_turns(session_id=Y, mirror=X, chamber="S4", epistemic_type=2)
+        """
+        filters = {"session_id": session_id, "mirror": mirror, "chamber": chamber,
+                   "epistemic_type": epistemic_type, "layout": layout}
+        clauses = [f"{column} = :{column}" for column, value in filters.items() if value is not None]
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        rows = self._connect().execute(
+            f"SELECT * FROM turns {where} ORDER BY session_id, mirror, turn, chamber", filters
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def sessions(self) -> List[str]:
+        rows = self._connect().execute("SELECT DISTINCT session_id FROM turns ORDER BY session_id")
+        return [row[0] for row in rows]
+
+    def has_session(self, session_id: str) -> bool:
+        return self._connect().execute(
+            "SELECT 1 FROM turns WHERE session_id = ? LIMIT 1", (session_id,)
+        ).fetchone() is not None
+
+    def unindexed_sessions(self) -> List[Path]:
+        """
+        Session directories under scrolls/ without any cataloged turn, e.g.
+        saved before the catalog existed. Callers glob these themselves;
+        only the top level of scrolls/ is listed.
+        """
+        scrolls_dir = self.vault_root / "scrolls"
+        if not scrolls_dir.exists():
+            return []
+        indexed = set(self.sessions())
+        return sorted(path for path in scrolls_dir.iterdir() if path.is_dir() and path.name not in indexed)
+
+    def mirrors(self, session_id: Optional[str] = None) -> List[str]:
+        if session_id is None:
+            rows = self._connect().execute("SELECT DISTINCT mirror FROM turns ORDER BY mirror")
+        else:
+            rows = self._connect().execute(
+                "SELECT DISTINCT mirror FROM turns WHERE session_id = ? ORDER BY mirror", (session_id,)
+            )
+        return [row[0] for row in rows]
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM turns").fetchone()[0]
+
+    # Backfill
+
+    def backfill(self, classify: bool = True, processes: Optional[int] = None) -> Dict[str, int]:
+        """
+        Index every scroll under <vault>/scrolls not yet indexed at its current mtime/size.
+
+        Args:
+            classify: Compute epistemic types for scrolls that lack one
+            processes: Worker processes for classification (see classify_batch)
+
+        Returns:
+            Counts of indexed, unchanged and removed scrolls
+        """
+        known = {
+            row["scroll_path"]: (row["mtime"], row["size"])
+            for row in self._connect().execute("SELECT scroll_path, mtime, size FROM turns")
+        }
+
+        rows, texts = [], []
+        seen = set()
+        unchanged = 0
+        for scroll in sorted((self.vault_root / "scrolls").glob("**/*.md")):
+            relative = self._relative(scroll)
+            seen.add(relative)
+            stat = scroll.stat()
+            if known.get(relative) == (stat.st_mtime, stat.st_size):
+                unchanged += 1
+                continue
+
+            text = scroll.read_text(encoding="utf-8", errors="ignore")
+            fields = parse_scroll(scroll, text, self.vault_root)
+            if fields is None:
+                continue
+            rows.append(self._row(scroll, fields))
+            texts.append(text)
+
+        if classify:
+            missing = [i for i, row in enumerate(rows) if row["epistemic_type"] is None]
+            if missing:
+                results = classify_batch([scroll_body(texts[i]) for i in missing], processes=processes)
+                for i, result in zip(missing, results):
+                    rows[i]["epistemic_type"] = result["type"]
+
+        self.record_turns(rows)
+
+        removed = [path for path in known if path not in seen]
+        if removed:
+            conn = self._connect()
+            with conn:
+                conn.executemany("DELETE FROM turns WHERE scroll_path = ?", [(path,) for path in removed])
+
+        return {"indexed": len(rows), "unchanged": unchanged, "removed": len(removed)}
+
+
+def scroll_body(text: str) -> str:
+    """Model response of a scroll (between the first two --- rules, else after the header)"""
+    parts = text.split("\n---\n")
+    return parts[1].strip() if len(parts) >= 2 else text
+
+
+def parse_scroll(scroll: Path, text: str, vault_root: Path) -> Optional[Dict]:
+    """
+    Catalog fields for a scroll on disk.
+
+    Layouts:
+        scrolls/<session>/<mirror>/turn_NNN.md   (bioelectric runners)
+        scrolls/<session>/<chamber>.md           (orchestrator, meta/<session>_<chamber>.json)
+    """
+    relative = scroll.relative_to(vault_root / "scrolls")
+    header = {name: value for name, value in _HEADER_FIELD.findall(text)}
+
+    pressure = re.match(r"\d+", header.get("Felt Pressure", ""))
+    epistemic = _EPISTEMIC_TYPE.search(header.get("Epistemic", ""))
+    fields = {
+        "timestamp": header.get("Timestamp"),
+        "seal": header.get("Seal"),
+        "pressure": int(pressure.group(0)) if pressure else None,
+        "epistemic_type": int(epistemic.group(1)) if epistemic else None,
+    }
+
+    turn_match = _TURN_FILE.search(scroll.name)
+    if len(relative.parts) == 3 and turn_match:
+        title_chamber = _TITLE_CHAMBER.search(text)
+        fields.update(
+            session_id=relative.parts[0],
+            mirror=header.get("Mirror", relative.parts[1]),
+            turn=int(turn_match.group(1)),
+            chamber=header.get("Chamber") or (title_chamber.group(1) if title_chamber else None),
+            layout="bioelectric",
+        )
+        return fields
+
+    if len(relative.parts) == 2:
+        session_id, chamber = relative.parts[0], scroll.stem
+        meta_path = vault_root / "meta" / f"{session_id}_{chamber}.json"
+        meta = {}
+        if meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except json.JSONDecodeError:
+                meta = {}
+        epistemic_meta = meta.get("epistemic") or {}
+        fields.update(
+            session_id=session_id,
+            mirror=meta.get("model_id", session_id),
+            turn=meta.get("turn_id"),
+            chamber=chamber,
+            timestamp=fields["timestamp"] or meta.get("timestamp"),
+            seal=fields["seal"] or (meta.get("seal") or {}).get("sha256_16"),
+            epistemic_type=epistemic_meta.get("type", fields["epistemic_type"]),
+            meta_path=meta_path if meta_path.exists() else None,
+            layout="orchestrator",
+        )
+        return fields
+
+    return None
+
+
+_catalogs: Dict[str, VaultCatalog] = {}
+_catalogs_lock = threading.Lock()
+_refreshed = set()
+
+
+def get_catalog(vault_root) -> VaultCatalog:
+    """Process-wide catalog for a vault root"""
+    key = str(Path(vault_root).resolve())
+    with _catalogs_lock:
+        if key not in _catalogs:
+            _catalogs[key] = VaultCatalog(vault_root)
+        return _catalogs[key]
+
+
+def open_catalog(vault_root, refresh: bool = False) -> Optional[VaultCatalog]:
+    """
+    Catalog of a vault that has one, for querying.
+
+    Saves keep the catalog current (Orchestrator._save_turn, the bioelectric
+    save_turn functions), so opening it does not walk the vault. Pass
+    refresh=True to backfill it first (once per process); otherwise
+    backfill from the command line after copying in scrolls by hand.
+
+    Returns None for vaults without catalog.sqlite (callers fall back to globbing).
+    The catalog only covers sessions saved since it was created: callers glob
+    sessions it has no turns for (has_session, unindexed_sessions).
+    """
+    if not (Path(vault_root) / CATALOG_FILENAME).exists():
+        return None
+    catalog = get_catalog(vault_root)
+    if refresh:
+        with _catalogs_lock:
+            stale = catalog.db_path not in _refreshed
+            _refreshed.add(catalog.db_path)
+        if stale:
+            catalog.backfill()
+    return catalog
+
+
+def record_turn_safely(vault_root, scroll_path: Path, **fields):
+    """record_turn that never fails the caller's save (the catalog can be backfilled)"""
+    try:
+        get_catalog(vault_root).record_turn(scroll_path, **fields)
+    except sqlite3.Error as e:
+        print(f"⚠️  Vault catalog update failed for {scroll_path}: {e}")
+
+
+def record_bioelectric_turn(
+    turn_file: Path,
+    session_id: str,
+    mirror_name: str,
+    turn_num: int,
+    response: str,
+    pressure: Optional[int],
+    seal: str,
+    timestamp: str,
+    chamber: Optional[str] = None,
+):
+    """Catalog a bioelectric turn saved at <vault>/scrolls/<session>/<mirror>/turn_NNN.md"""
+    record_turn_safely(
+        Path(turn_file).parents[3], turn_file,
+        session_id=session_id, mirror=mirror_name, turn=turn_num, chamber=chamber,
+        timestamp=timestamp, seal=seal, pressure=pressure,
+        epistemic_type=classify_response(response)["type"], layout="bioelectric",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill the SQLite catalog of an IRIS vault")
+    parser.add_argument("vault", help="Vault root (contains scrolls/ and meta/)")
+    parser.add_argument("--no-classify", action="store_true",
+                        help="Skip epistemic classification of scrolls without a type")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Worker processes for epistemic classification")
+    args = parser.parse_args()
+
+    catalog = get_catalog(args.vault)
+    stats = catalog.backfill(classify=not args.no_classify, processes=args.processes)
+    print(f"✓ {catalog.db_path}: {stats['indexed']} indexed, {stats['unchanged']} unchanged, "
+          f"{stats['removed']} removed ({catalog.count()} turns, {len(catalog.sessions())} sessions)")
+
+
+if __name__ == "__main__":
+    main()